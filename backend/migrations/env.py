@@ -14,8 +14,9 @@ from isp_compare.models import Base
 
 load_dotenv(Path(__file__).parents[2] / ".env")
 
+postgres_config = PostgresConfig()
 config = context.config
-config.set_main_option(name="sqlalchemy.url", value=PostgresConfig().build_dsn())
+config.set_main_option(name="sqlalchemy.url", value=postgres_config.build_dsn())
 
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
@@ -64,6 +65,7 @@ async def run_async_migrations() -> None:
             config.get_section(config.config_ini_section),
             prefix="sqlalchemy.",
             poolclass=NullPool,
+            connect_args=postgres_config.build_connect_args(),
             future=True,
         )
     )
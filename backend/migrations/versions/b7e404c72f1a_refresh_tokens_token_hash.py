@@ -0,0 +1,66 @@
+"""refresh tokens token hash
+
+Revision ID: b7e404c72f1a
+Revises: c86bb07ae116
+Create Date: 2026-10-19 12:36:47.532666
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e404c72f1a"
+down_revision: str | None = "c86bb07ae116"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "refresh_tokens",
+        sa.Column("token_hash", sa.LargeBinary(length=32), nullable=True),
+    )
+    # Уже выданные токены продолжают работать: хешируем их на месте
+    op.execute(
+        "UPDATE refresh_tokens SET token_hash = sha256(convert_to(token, 'UTF8'))"
+    )
+    op.alter_column("refresh_tokens", "token_hash", nullable=False)
+    op.create_unique_constraint(
+        op.f("uq_refresh_tokens_token_hash"), "refresh_tokens", ["token_hash"]
+    )
+    op.drop_constraint("uq_refresh_tokens_token", "refresh_tokens", type_="unique")
+    op.drop_column("refresh_tokens", "token")
+    op.create_index(
+        "ix_refresh_tokens_user_id",
+        "refresh_tokens",
+        ["user_id"],
+        unique=False,
+        postgresql_where=sa.text("revoked = false"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_refresh_tokens_user_id",
+        table_name="refresh_tokens",
+        postgresql_where=sa.text("revoked = false"),
+    )
+    op.add_column(
+        "refresh_tokens",
+        sa.Column("token", sa.VARCHAR(length=255), autoincrement=False, nullable=True),
+    )
+    # Исходные токены из хеша не восстановить, поэтому все сессии
+    # после отката становятся недействительными
+    op.execute("UPDATE refresh_tokens SET token = encode(token_hash, 'hex')")
+    op.alter_column("refresh_tokens", "token", nullable=False)
+    op.create_unique_constraint("uq_refresh_tokens_token", "refresh_tokens", ["token"])
+    op.drop_constraint(
+        op.f("uq_refresh_tokens_token_hash"), "refresh_tokens", type_="unique"
+    )
+    op.drop_column("refresh_tokens", "token_hash")
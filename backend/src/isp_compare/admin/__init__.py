@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from isp_compare.admin.auth import AdminAuth
 from isp_compare.admin.views import (
+    ParserRunAdmin,
     ProviderAdmin,
     ReviewAdmin,
     TariffAdmin,
@@ -13,6 +14,8 @@ from isp_compare.admin.views import (
     UserSessionAdmin,
 )
 from isp_compare.core.config import JWTConfig
+from isp_compare.services.cache import RedisCache
+from isp_compare.services.catalog_version import CatalogVersion
 
 if TYPE_CHECKING:
     from dishka import AsyncContainer
@@ -25,6 +28,13 @@ async def setup_admin(app: FastAPI) -> None:
         async_sessionmaker[AsyncSession]
     )
     jwt_config: JWTConfig = await container.get(JWTConfig)
+    cache = await container.get(RedisCache)
+    ProviderAdmin.cache = cache
+    ReviewAdmin.cache = cache
+    catalog_version = await container.get(CatalogVersion)
+    ProviderAdmin.catalog_version = catalog_version
+    TariffAdmin.catalog_version = catalog_version
+    ReviewAdmin.catalog_version = catalog_version
 
     auth_backend = AdminAuth(
         secret_key=jwt_config.secret_key.get_secret_value(),
@@ -44,3 +54,4 @@ async def setup_admin(app: FastAPI) -> None:
     admin.add_view(UserAdmin)
     admin.add_view(ReviewAdmin)
     admin.add_view(UserSessionAdmin)
+    admin.add_view(ParserRunAdmin)
@@ -1,13 +1,28 @@
+from typing import ClassVar
+from uuid import UUID
+
 from sqladmin import ModelView
+from starlette.requests import Request
 
-from isp_compare.models import UserSession
+from isp_compare.models import ParserRun, UserSession
 from isp_compare.models.provider import Provider
 from isp_compare.models.review import Review
 from isp_compare.models.tariff import Tariff
 from isp_compare.models.user import User
+from isp_compare.repositories.provider import ProviderRepository
+from isp_compare.services.cache import RedisCache
+from isp_compare.services.catalog_version import CatalogVersion
+from isp_compare.services.provider import (
+    ALL_PROVIDERS_CACHE_KEY,
+    PROVIDER_CACHE_KEY,
+)
+from isp_compare.services.review import PROVIDER_REVIEWS_CACHE_KEY
 
 
 class ProviderAdmin(ModelView, model=Provider):
+    cache: ClassVar[RedisCache]
+    catalog_version: ClassVar[CatalogVersion]
+
     column_list = [
         Provider.id,
         Provider.name,
@@ -33,8 +48,35 @@ class ProviderAdmin(ModelView, model=Provider):
     name_plural = "Providers"
     icon = "fa-solid fa-building"
 
+    async def after_model_change(
+        self,
+        data: dict,  # noqa: ARG002
+        model: Provider,
+        is_created: bool,  # noqa: ARG002
+        request: Request,  # noqa: ARG002
+    ) -> None:
+        await self.cache.invalidate(
+            ALL_PROVIDERS_CACHE_KEY,
+            PROVIDER_CACHE_KEY.format(provider_id=model.id),
+        )
+        await self.catalog_version.bump()
+
+    async def after_model_delete(
+        self,
+        model: Provider,
+        request: Request,  # noqa: ARG002
+    ) -> None:
+        await self.cache.invalidate(
+            ALL_PROVIDERS_CACHE_KEY,
+            PROVIDER_CACHE_KEY.format(provider_id=model.id),
+            PROVIDER_REVIEWS_CACHE_KEY.format(provider_id=model.id),
+        )
+        await self.catalog_version.bump()
+
 
 class TariffAdmin(ModelView, model=Tariff):
+    catalog_version: ClassVar[CatalogVersion]
+
     column_list = [
         Tariff.id,
         Tariff.name,
@@ -68,6 +110,22 @@ class TariffAdmin(ModelView, model=Tariff):
     name_plural = "Tariffs"
     icon = "fa-solid fa-list"
 
+    async def after_model_change(
+        self,
+        data: dict,  # noqa: ARG002
+        model: Tariff,  # noqa: ARG002
+        is_created: bool,  # noqa: ARG002
+        request: Request,  # noqa: ARG002
+    ) -> None:
+        await self.catalog_version.bump()
+
+    async def after_model_delete(
+        self,
+        model: Tariff,  # noqa: ARG002
+        request: Request,  # noqa: ARG002
+    ) -> None:
+        await self.catalog_version.bump()
+
 
 class UserAdmin(ModelView, model=User):
     column_list = [
@@ -95,6 +153,9 @@ class UserAdmin(ModelView, model=User):
 
 
 class ReviewAdmin(ModelView, model=Review):
+    cache: ClassVar[RedisCache]
+    catalog_version: ClassVar[CatalogVersion]
+
     column_list = [
         Review.id,
         Review.user,
@@ -117,6 +178,49 @@ class ReviewAdmin(ModelView, model=Review):
     name_plural = "Reviews"
     icon = "fa-solid fa-star"
 
+    async def on_model_change(
+        self,
+        data: dict,  # noqa: ARG002
+        model: Review,
+        is_created: bool,
+        request: Request,
+    ) -> None:
+        # Запоминаем прежнего провайдера: отзыв могли перенести к другому
+        request.state.review_provider_id = None if is_created else model.provider_id
+
+    async def after_model_change(
+        self,
+        data: dict,  # noqa: ARG002
+        model: Review,
+        is_created: bool,  # noqa: ARG002
+        request: Request,
+    ) -> None:
+        provider_ids = {model.provider_id, request.state.review_provider_id}
+        await self._sync_providers(provider_ids - {None})
+
+    async def after_model_delete(
+        self,
+        model: Review,
+        request: Request,  # noqa: ARG002
+    ) -> None:
+        await self._sync_providers({model.provider_id})
+
+    async def _sync_providers(self, provider_ids: set[UUID]) -> None:
+        async with self.session_maker() as session:
+            provider_repository = ProviderRepository(session=session)
+            await provider_repository.recalculate_review_stats(list(provider_ids))
+            await session.commit()
+
+        await self.cache.invalidate(
+            ALL_PROVIDERS_CACHE_KEY,
+            *(
+                key.format(provider_id=provider_id)
+                for provider_id in provider_ids
+                for key in (PROVIDER_CACHE_KEY, PROVIDER_REVIEWS_CACHE_KEY)
+            ),
+        )
+        await self.catalog_version.bump()
+
 
 class UserSessionAdmin(ModelView, model=UserSession):
     column_list = [UserSession.id, UserSession.total_clicks]
@@ -124,3 +228,32 @@ class UserSessionAdmin(ModelView, model=UserSession):
     name = "User Session"
     name_plural = "User Sessions"
     icon = "fa-solid fa-square-poll-horizontal"
+
+
+class ParserRunAdmin(ModelView, model=ParserRun):
+    column_list = [
+        ParserRun.provider_name,
+        ParserRun.status,
+        ParserRun.started_at,
+        ParserRun.http_time,
+        ParserRun.parse_time,
+        ParserRun.db_time,
+        ParserRun.items_count,
+        ParserRun.errors_count,
+        ParserRun.changes_count,
+    ]
+    column_searchable_list = [ParserRun.provider_name]
+    column_sortable_list = [
+        ParserRun.provider_name,
+        ParserRun.started_at,
+        ParserRun.http_time,
+        ParserRun.parse_time,
+    ]
+    column_default_sort = ("started_at", True)
+
+    can_create = False
+    can_edit = False
+
+    name = "Parser Run"
+    name_plural = "Parser Runs"
+    icon = "fa-solid fa-clock-rotate-left"
@@ -1,5 +1,6 @@
 from fastapi.routing import APIRouter
 
+from isp_compare.api.responses import FastJSONResponse
 from isp_compare.api.v1 import (
     analytics,
     auth,
@@ -7,11 +8,12 @@ from isp_compare.api.v1 import (
     provider,
     review,
     search_history,
+    system,
     tariff,
     user,
 )
 
-main_router = APIRouter()
+main_router = APIRouter(default_response_class=FastJSONResponse)
 main_router.include_router(auth.router)
 main_router.include_router(user.router)
 main_router.include_router(provider.router)
@@ -20,3 +22,4 @@ main_router.include_router(review.router)
 main_router.include_router(search_history.router)
 main_router.include_router(parser.router)
 main_router.include_router(analytics.router)
+main_router.include_router(system.router)
@@ -0,0 +1,11 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    # Сериализация в pydantic-core: модели, Decimal и UUID кодируются
+    # сразу в байты, без промежуточного jsonable_encoder и json.dumps.
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
@@ -1,11 +1,15 @@
 # backend/src/isp_compare/api/v1/parser.py
+from typing import Annotated
+from uuid import UUID
+
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from isp_compare.api.v1 import security
-from isp_compare.schemas.common import APIResponse
+from isp_compare.schemas.parser import ParserJobResponse, ParserRunResponse
 from isp_compare.services.identity_provider import IdentityProvider
+from isp_compare.services.parser_scheduler import ParserScheduler
 from isp_compare.services.parser_service import ParserService
 
 router = APIRouter(
@@ -13,16 +17,20 @@ router = APIRouter(
 )
 
 
-@router.post("/run/{provider_name}", dependencies=[Depends(security)])
+@router.post(
+    "/run/{provider_name}",
+    status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(security)],
+)
 @inject
 async def run_parser(
     provider_name: str,
-    service: FromDishka[ParserService],
+    scheduler: FromDishka[ParserScheduler],
     identity_provider: FromDishka[IdentityProvider],
-) -> APIResponse:
+) -> ParserJobResponse:
     await identity_provider.ensure_is_admin()
 
-    supported_providers = ["Ростелеком", "Дом.ру", "Билайн"]
+    supported_providers = scheduler.supported_providers
     if provider_name not in supported_providers:
         raise HTTPException(
             status_code=400,
@@ -30,27 +38,39 @@ async def run_parser(
             f" Доступные провайдеры: {', '.join(supported_providers)}",
         )
 
-    count = await service.update_provider_tariffs(provider_name)
-
-    return APIResponse(
-        message=f"Успешно обновлено {count} тарифов для провайдера {provider_name}"
-    )
+    job_id = await scheduler.enqueue([provider_name])
+    return ParserJobResponse(job_id=job_id, providers=[provider_name])
 
 
-@router.post("/run-all", dependencies=[Depends(security)])
+@router.post(
+    "/run-all",
+    status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(security)],
+)
 @inject
 async def run_all_parsers(
-    service: FromDishka[ParserService],
+    scheduler: FromDishka[ParserScheduler],
     identity_provider: FromDishka[IdentityProvider],
-) -> APIResponse:
+) -> ParserJobResponse:
     await identity_provider.ensure_is_admin()
 
-    results = await service.update_all_tariffs()
+    providers = scheduler.supported_providers
+    job_id = await scheduler.enqueue(providers)
+    return ParserJobResponse(job_id=job_id, providers=providers)
+
 
-    message_parts = []
-    for provider_name, count in results.items():
-        message_parts.append(f"{provider_name}: {count} тарифов")
+@router.get("/runs")
+@inject
+async def get_parser_runs(
+    service: FromDishka[ParserService],
+    identity_provider: FromDishka[IdentityProvider],
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    offset: Annotated[int, Query(ge=0)] = 0,
+    provider_name: str | None = None,
+    job_id: UUID | None = None,
+) -> list[ParserRunResponse]:
+    await identity_provider.ensure_is_admin()
 
-    return APIResponse(
-        message=f"Результаты обновления тарифов: {', '.join(message_parts)}"
+    return await service.get_parser_runs(
+        limit=limit, offset=offset, provider_name=provider_name, job_id=job_id
     )
@@ -2,28 +2,33 @@ from uuid import UUID
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
+from isp_compare.api.responses import FastJSONResponse
 from isp_compare.schemas.provider import (
     ProviderResponse,
 )
+from isp_compare.services.http_cache import HttpCache
 from isp_compare.services.provider import ProviderService
 
 router = APIRouter(prefix="/providers", tags=["Providers"])
 
 
-@router.get("")
+@router.get("", response_model=list[ProviderResponse])
 @inject
 async def get_all_providers(
     service: FromDishka[ProviderService],
-) -> list[ProviderResponse]:
-    return await service.get_all_providers()
+    http_cache: FromDishka[HttpCache],
+) -> Response:
+    headers = await http_cache.check_catalog()
+    content = await service.get_all_providers_json()
+    return Response(content=content, media_type="application/json", headers=headers)
 
 
-@router.get("/{provider_id}")
+@router.get("/{provider_id}", response_model=ProviderResponse)
 @inject
 async def get_provider(
     provider_id: UUID,
     service: FromDishka[ProviderService],
-) -> ProviderResponse:
-    return await service.get_provider(provider_id)
+) -> FastJSONResponse:
+    return FastJSONResponse(await service.get_provider(provider_id))
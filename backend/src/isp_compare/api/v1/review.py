@@ -1,11 +1,14 @@
+from typing import Annotated
 from uuid import UUID
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 
+from isp_compare.api.responses import FastJSONResponse
 from isp_compare.api.v1 import security
 from isp_compare.schemas.review import ReviewCreate, ReviewResponse, ReviewUpdate
+from isp_compare.services.cursor import encode_cursor
 from isp_compare.services.review import ReviewService
 
 router = APIRouter(tags=["Reviews"])
@@ -25,26 +28,32 @@ async def create_review(
     return await service.create_review(provider_id=provider_id, data=data)
 
 
-@router.get("/providers/{provider_id}/reviews")
+@router.get("/providers/{provider_id}/reviews", response_model=list[ReviewResponse])
 @inject
 async def get_provider_reviews(
     provider_id: UUID,
     service: FromDishka[ReviewService],
-    limit: int = 20,
-    offset: int = 0,
-) -> list[ReviewResponse]:
-    return await service.get_provider_reviews(
-        provider_id=provider_id, limit=limit, offset=offset
+    limit: Annotated[int, Query(ge=1)] = 20,
+    offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: str | None = None,
+) -> FastJSONResponse:
+    reviews = await service.get_provider_reviews(
+        provider_id=provider_id, limit=limit, offset=offset, cursor=cursor
     )
+    headers = {}
+    if reviews and len(reviews) == limit:
+        last_review = reviews[-1]
+        headers["X-Next-Cursor"] = encode_cursor(last_review.created_at, last_review.id)
+    return FastJSONResponse(reviews, headers=headers)
 
 
-@router.get("/reviews/{review_id}")
+@router.get("/reviews/{review_id}", response_model=ReviewResponse)
 @inject
 async def get_review(
     review_id: UUID,
     service: FromDishka[ReviewService],
-) -> ReviewResponse:
-    return await service.get_review(review_id=review_id)
+) -> FastJSONResponse:
+    return FastJSONResponse(await service.get_review(review_id=review_id))
 
 
 @router.patch("/reviews/{review_id}", dependencies=[Depends(security)])
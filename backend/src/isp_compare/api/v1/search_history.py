@@ -1,11 +1,14 @@
+from typing import Annotated
 from uuid import UUID
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 
+from isp_compare.api.responses import FastJSONResponse
 from isp_compare.api.v1 import security
 from isp_compare.schemas.search_history import (
+    PopularSearchResponse,
     SearchHistoryResponse,
 )
 from isp_compare.services.search_history import SearchHistoryService
@@ -15,22 +18,31 @@ router = APIRouter(
 )
 
 
-@router.get("")
+@router.get("", response_model=list[SearchHistoryResponse])
 @inject
 async def get_search_history(
     service: FromDishka[SearchHistoryService],
     limit: int = 20,
     offset: int = 0,
-) -> list[SearchHistoryResponse]:
-    return await service.get_user_search_history(limit, offset)
+) -> FastJSONResponse:
+    return FastJSONResponse(await service.get_user_search_history(limit, offset))
 
 
-@router.get("/latest")
+@router.get("/latest", response_model=SearchHistoryResponse | None)
 @inject
 async def get_latest_search_history(
     service: FromDishka[SearchHistoryService],
-) -> SearchHistoryResponse | None:
-    return await service.get_latest_search()
+) -> FastJSONResponse:
+    return FastJSONResponse(await service.get_latest_search())
+
+
+@router.get("/popular", response_model=list[PopularSearchResponse])
+@inject
+async def get_popular_searches(
+    service: FromDishka[SearchHistoryService],
+    limit: Annotated[int, Query(ge=1, le=50)] = 20,
+) -> FastJSONResponse:
+    return FastJSONResponse(await service.get_popular_searches(limit))
 
 
 @router.delete("/{search_history_id}", status_code=status.HTTP_204_NO_CONTENT)
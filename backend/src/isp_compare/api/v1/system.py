@@ -0,0 +1,21 @@
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Depends
+
+from isp_compare.api.v1 import security
+from isp_compare.schemas.database import PoolStatsResponse
+from isp_compare.services.database_pool import DatabasePoolMonitor
+from isp_compare.services.identity_provider import IdentityProvider
+
+router = APIRouter(prefix="/system", tags=["System"], dependencies=[Depends(security)])
+
+
+@router.get("/db-pool")
+@inject
+async def get_db_pool_stats(
+    monitor: FromDishka[DatabasePoolMonitor],
+    identity_provider: FromDishka[IdentityProvider],
+) -> list[PoolStatsResponse]:
+    await identity_provider.ensure_is_admin()
+
+    return monitor.get_stats()
@@ -5,61 +5,80 @@ from dishka import FromDishka
 from dishka.integrations.fastapi import inject
 from fastapi import APIRouter, Depends
 
+from isp_compare.api.responses import FastJSONResponse
 from isp_compare.api.v1 import security
 from isp_compare.schemas.tariff import (
     TariffResponse,
     TariffSearchParams,
 )
 from isp_compare.schemas.tariff_comparison import ComparisonRequest, ComparisonResult
+from isp_compare.services.http_cache import HttpCache
 from isp_compare.services.tariff import TariffService
 from isp_compare.services.tariff_comparison import TariffComparisonService
 
 router = APIRouter(tags=["Tariffs"])
 
 
-@router.get("/tariffs")
+# Сервисы уже возвращают провалидированные схемы, поэтому ответ собирается
+# напрямую: FastAPI не проверяет его повторно по response_model.
+
+
+@router.get("/tariffs", response_model=list[TariffResponse])
 @inject
 async def get_all_tariffs(
     service: FromDishka[TariffService],
+    http_cache: FromDishka[HttpCache],
     limit: int = 100,
     offset: int = 0,
-) -> list[TariffResponse]:
-    return await service.get_all_tariffs(limit, offset)
+) -> FastJSONResponse:
+    headers = await http_cache.check_catalog()
+    tariffs = await service.get_all_tariffs(limit, offset)
+    return FastJSONResponse(tariffs, headers=headers)
 
 
-@router.get("/providers/{provider_id}/tariffs")
+@router.get("/providers/{provider_id}/tariffs", response_model=list[TariffResponse])
 @inject
 async def get_provider_tariffs(
     provider_id: UUID,
     service: FromDishka[TariffService],
+    http_cache: FromDishka[HttpCache],
     limit: int = 100,
     offset: int = 0,
-) -> list[TariffResponse]:
-    return await service.get_provider_tariffs(provider_id, limit, offset)
+) -> FastJSONResponse:
+    headers = await http_cache.check_catalog()
+    tariffs = await service.get_provider_tariffs(provider_id, limit, offset)
+    return FastJSONResponse(tariffs, headers=headers)
 
 
-@router.get("/tariffs/search", dependencies=[Depends(security)])
+@router.get(
+    "/tariffs/search",
+    dependencies=[Depends(security)],
+    response_model=list[TariffResponse],
+)
 @inject
 async def search_tariffs(
     service: FromDishka[TariffService],
     search_params: Annotated[TariffSearchParams, Depends(TariffSearchParams)],
-) -> list[TariffResponse]:
-    return await service.search_tariffs(search_params)
+) -> FastJSONResponse:
+    return FastJSONResponse(await service.search_tariffs(search_params))
 
 
-@router.get("/tariffs/{tariff_id}")
+@router.get("/tariffs/{tariff_id}", response_model=TariffResponse)
 @inject
 async def get_tariff(
     tariff_id: UUID,
     service: FromDishka[TariffService],
-) -> TariffResponse:
-    return await service.get_tariff(tariff_id)
+    http_cache: FromDishka[HttpCache],
+) -> FastJSONResponse:
+    headers = await http_cache.check_catalog()
+    tariff = await service.get_tariff(tariff_id)
+    return FastJSONResponse(tariff, headers=headers)
 
 
-@router.post("/tariffs/comparison")
+@router.post("/tariffs/comparison", response_model=ComparisonResult)
 @inject
 async def compare_tariffs(
     request: ComparisonRequest,
     service: FromDishka[TariffComparisonService],
-) -> ComparisonResult:
-    return await service.compare_tariffs(request)
+) -> FastJSONResponse:
+    return FastJSONResponse(await service.compare_tariffs(request))
@@ -2,6 +2,7 @@ from dishka import FromDishka
 from dishka.integrations.fastapi import inject
 from fastapi import APIRouter, Depends
 
+from isp_compare.api.responses import FastJSONResponse
 from isp_compare.api.v1 import security
 from isp_compare.schemas.common import APIResponse
 from isp_compare.schemas.user import PasswordChange, UserProfile, UserProfileUpdate
@@ -10,12 +11,12 @@ from isp_compare.services.user import UserService
 router = APIRouter(prefix="/users", tags=["User"], dependencies=[Depends(security)])
 
 
-@router.get("/me")
+@router.get("/me", response_model=UserProfile)
 @inject
 async def get_current_user(
     service: FromDishka[UserService],
-) -> UserProfile:
-    return await service.get_profile()
+) -> FastJSONResponse:
+    return FastJSONResponse(await service.get_profile())
 
 
 @router.patch("/profile")
@@ -0,0 +1,28 @@
+import asyncio
+import logging
+
+from isp_compare.core.config import create_config
+from isp_compare.core.di.main import create_container
+from isp_compare.services.provider import ProviderService
+
+logger = logging.getLogger(__name__)
+
+
+async def recalculate_provider_stats() -> int:
+    container = create_container(create_config())
+    try:
+        async with container() as request_container:
+            provider_service = await request_container.get(ProviderService)
+            return await provider_service.recalculate_review_stats()
+    finally:
+        await container.close()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    updated = asyncio.run(recalculate_provider_stats())
+    logger.info(f"Review stats recalculated for {updated} providers")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
-from typing import Literal
+from typing import Any, Literal
+from uuid import uuid4
 
 from pydantic import BaseModel, SecretStr
 from pydantic_settings import BaseSettings as _BaseSettings
@@ -14,6 +15,10 @@ class BaseSettings(_BaseSettings):
     )
 
 
+def _prepared_statement_name() -> str:
+    return f"__asyncpg_{uuid4()}__"
+
+
 class ApplicationConfig(BaseSettings, env_prefix="APPLICATION_"):
     title: str
     debug: bool = False
@@ -43,16 +48,63 @@ class PostgresConfig(BaseSettings, env_prefix="POSTGRES_"):
 
     enable_logging: bool = False
 
-    def build_dsn(self) -> str:
+    # На каждый воркер приходится до pool_size + max_overflow соединений
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30
+    pool_recycle: int = 30 * 60
+    pool_pre_ping: bool = False
+    # Кеш подготовленных выражений asyncpg и диалекта SQLAlchemy
+    statement_cache_size: int = 100
+    prepared_statement_cache_size: int = 100
+    # Работа через PgBouncer в режиме pool_mode=transaction: соседние
+    # транзакции попадают на разные серверные соединения, поэтому
+    # подготовленные выражения не кешируются и получают уникальные имена
+    transaction_pooling: bool = False
+
+    # Реплики для чтения в формате host или host:port
+    replica_hosts: list[str] = []
+    # Сколько секунд после записи клиент читает с primary
+    replica_sticky_seconds: int = 5
+
+    def build_dsn(self, host: str | None = None, port: int | None = None) -> str:
         return URL.create(
             drivername="postgresql+asyncpg",
             username=self.user,
             password=self.password.get_secret_value(),
-            host=self.host,
-            port=self.port,
+            host=host or self.host,
+            port=port or self.port,
             database=self.db,
         ).render_as_string(hide_password=False)
 
+    def build_connect_args(self) -> dict[str, Any]:
+        if self.transaction_pooling:
+            return {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": _prepared_statement_name,
+            }
+
+        return {
+            "statement_cache_size": self.statement_cache_size,
+            "prepared_statement_cache_size": self.prepared_statement_cache_size,
+        }
+
+    @property
+    def connections_per_worker(self) -> int:
+        return self.pool_size + self.max_overflow
+
+    def build_replica_dsns(self) -> list[str]:
+        dsns = []
+        for replica in self.replica_hosts:
+            host, _, port = replica.partition(":")
+            dsns.append(self.build_dsn(host, int(port) if port else None))
+        return dsns
+
+
+class ServerConfig(BaseSettings, env_prefix="SERVER_"):
+    workers: int = 1
+
 
 class RedisConfig(BaseSettings, env_prefix="REDIS_"):
     host: str
@@ -60,12 +112,62 @@ class RedisConfig(BaseSettings, env_prefix="REDIS_"):
     password: SecretStr
 
 
+class ParserConfig(BaseSettings, env_prefix="PARSER_"):
+    scheduler_enabled: bool = False
+    interval_minutes: int = 24 * 60
+    provider_intervals_minutes: dict[str, int] = {}
+    jitter_seconds: int = 5 * 60
+    poll_interval_seconds: int = 60
+    lock_timeout_seconds: int = 60 * 60
+    batch_size: int = 100
+
+    def get_interval_seconds(self, provider_name: str) -> int:
+        minutes = self.provider_intervals_minutes.get(
+            provider_name, self.interval_minutes
+        )
+        return minutes * 60
+
+
+class SearchHistoryConfig(BaseSettings, env_prefix="SEARCH_HISTORY_"):
+    # Поиски копятся в очереди Redis и пишутся в БД пачками
+    flush_interval_seconds: float = 1
+    batch_size: int = 500
+    # Старые записи сверх лимита удаляются при вставке новых
+    max_per_user: int = 100
+    retention_days: int = 180
+    purge_interval_minutes: int = 60
+    # После стольких неудачных попыток запись уходит в dead-letter список
+    max_flush_attempts: int = 5
+
+
+class RefreshTokenConfig(BaseSettings, env_prefix="REFRESH_TOKEN_"):
+    # redis - токены с TTL и атомарной ротацией без обращений к БД
+    store: Literal["sql", "redis"] = "sql"
+    # Истекшие и давно отозванные токены удаляются фоновой задачей порциями
+    purge_interval_minutes: int = 60
+    purge_batch_size: int = 10000
+    # Отозванный токен хранится еще какое-то время, чтобы распознать
+    # повторное использование украденного токена
+    revoked_retention_days: int = 1
+
+
+class HttpCacheConfig(BaseSettings, env_prefix="HTTP_CACHE_"):
+    # Политика для ответов каталога (провайдеры и тарифы); public позволяет
+    # nginx кешировать их на своей стороне
+    catalog_cache_control: str = "public, max-age=60"
+
+
 class Config(BaseModel):
     app: ApplicationConfig
     jwt: JWTConfig
     cookie: CookieConfig
     postgres: PostgresConfig
     redis: RedisConfig
+    parser: ParserConfig
+    http_cache: HttpCacheConfig
+    server: ServerConfig
+    search_history: SearchHistoryConfig
+    refresh_token: RefreshTokenConfig
 
 
 def create_config() -> Config:
@@ -75,4 +177,9 @@ def create_config() -> Config:
         cookie=CookieConfig(),
         postgres=PostgresConfig(),
         redis=RedisConfig(),
+        parser=ParserConfig(),
+        http_cache=HttpCacheConfig(),
+        server=ServerConfig(),
+        search_history=SearchHistoryConfig(),
+        refresh_token=RefreshTokenConfig(),
     )
@@ -0,0 +1,109 @@
+import secrets
+from contextvars import ContextVar
+from http import HTTPStatus
+from http.cookies import SimpleCookie
+from typing import Any, NewType
+
+from sqlalchemy import Engine, Select
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+REPLICA_ENGINES_KEY = "replica_engines"
+PRIMARY_STICKY_COOKIE = "db_primary"
+READ_METHODS = frozenset({"GET", "HEAD"})
+# С реплик читается только публичный каталог: там отставание на доли секунды
+# незаметно, а личные данные и админка всегда читаются с primary
+REPLICA_READ_PREFIXES = ("/api/providers", "/api/tariffs", "/api/reviews")
+
+ReplicaEngines = NewType("ReplicaEngines", list[AsyncEngine])
+
+# Выставляется middleware на время запроса, который можно читать с реплик
+replica_reads: ContextVar[bool] = ContextVar("replica_reads", default=False)
+
+
+class RoutingSession(Session):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._pinned_to_primary = False
+
+    def get_bind(
+        self, mapper: Any = None, *, clause: Any = None, **kwargs: Any
+    ) -> Engine:
+        replicas: list[Engine] = self.info.get(REPLICA_ENGINES_KEY, [])
+        if (
+            replicas
+            and replica_reads.get()
+            and not self._pinned_to_primary
+            and not self._flushing
+            and isinstance(clause, Select)
+            and clause._for_update_arg is None  # noqa: SLF001
+        ):
+            return secrets.choice(replicas)
+
+        # После первой записи сессия до конца читает с primary,
+        # чтобы видеть собственные изменения
+        if not isinstance(clause, Select) or self._flushing:
+            self._pinned_to_primary = True
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+class ReplicaRoutingMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        sticky_seconds: int,
+        read_prefixes: tuple[str, ...] = REPLICA_READ_PREFIXES,
+    ) -> None:
+        self._app = app
+        self._sticky_seconds = sticky_seconds
+        self._read_prefixes = read_prefixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        if scope["method"] in READ_METHODS:
+            token = replica_reads.set(
+                self._is_replica_path(scope["path"]) and not self._is_sticky(scope)
+            )
+            try:
+                await self._app(scope, receive, send)
+            finally:
+                replica_reads.reset(token)
+            return
+
+        async def send_with_sticky_cookie(message: Message) -> None:
+            # Реплики отстают от primary: после записи клиент какое-то время
+            # читает с primary, чтобы сразу увидеть свои изменения
+            if (
+                message["type"] == "http.response.start"
+                and message["status"] < HTTPStatus.BAD_REQUEST
+            ):
+                cookie = (
+                    f"{PRIMARY_STICKY_COOKIE}=1; Max-Age={self._sticky_seconds}; "
+                    "Path=/; HttpOnly; SameSite=lax"
+                )
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"set-cookie", cookie.encode("latin-1")),
+                ]
+            await send(message)
+
+        await self._app(scope, receive, send_with_sticky_cookie)
+
+    def _is_replica_path(self, path: str) -> bool:
+        return any(
+            path == prefix or path.startswith(f"{prefix}/")
+            for prefix in self._read_prefixes
+        )
+
+    @staticmethod
+    def _is_sticky(scope: Scope) -> bool:
+        for name, value in scope["headers"]:
+            if name == b"cookie":
+                cookies = SimpleCookie(value.decode("latin-1"))
+                if PRIMARY_STICKY_COOKIE in cookies:
+                    return True
+        return False
@@ -3,9 +3,14 @@ from dishka import Provider, Scope, from_context, provide
 from isp_compare.core.config import (
     Config,
     CookieConfig,
+    HttpCacheConfig,
     JWTConfig,
+    ParserConfig,
     PostgresConfig,
     RedisConfig,
+    RefreshTokenConfig,
+    SearchHistoryConfig,
+    ServerConfig,
 )
 
 
@@ -28,3 +33,23 @@ class ConfigProvider(Provider):
     @provide
     def get_redis_config(self, config: Config) -> RedisConfig:
         return config.redis
+
+    @provide
+    def get_parser_config(self, config: Config) -> ParserConfig:
+        return config.parser
+
+    @provide
+    def get_http_cache_config(self, config: Config) -> HttpCacheConfig:
+        return config.http_cache
+
+    @provide
+    def get_server_config(self, config: Config) -> ServerConfig:
+        return config.server
+
+    @provide
+    def get_search_history_config(self, config: Config) -> SearchHistoryConfig:
+        return config.search_history
+
+    @provide
+    def get_refresh_token_config(self, config: Config) -> RefreshTokenConfig:
+        return config.refresh_token
@@ -10,17 +10,54 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from isp_compare.core.config import PostgresConfig, RedisConfig
+from isp_compare.core.db_pool import MonitoredQueuePool
+from isp_compare.core.db_routing import (
+    REPLICA_ENGINES_KEY,
+    ReplicaEngines,
+    RoutingSession,
+)
 from isp_compare.services.transaction_manager import TransactionManager
 
 
+def create_engine(config: PostgresConfig, dsn: str) -> AsyncEngine:
+    return create_async_engine(
+        dsn,
+        echo=config.enable_logging,
+        poolclass=MonitoredQueuePool,
+        pool_size=config.pool_size,
+        max_overflow=config.max_overflow,
+        pool_timeout=config.pool_timeout,
+        pool_recycle=config.pool_recycle,
+        pool_pre_ping=config.pool_pre_ping,
+        connect_args=config.build_connect_args(),
+    )
+
+
 class DatabaseProvider(Provider):
     @provide(scope=Scope.APP)
     def engine(self, config: PostgresConfig) -> AsyncEngine:
-        return create_async_engine(config.build_dsn(), echo=config.enable_logging)
+        return create_engine(config, config.build_dsn())
 
     @provide(scope=Scope.APP)
-    def session_maker(self, engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
-        return async_sessionmaker(bind=engine, expire_on_commit=False)
+    def replica_engines(self, config: PostgresConfig) -> ReplicaEngines:
+        return ReplicaEngines(
+            [create_engine(config, dsn) for dsn in config.build_replica_dsns()]
+        )
+
+    @provide(scope=Scope.APP)
+    def session_maker(
+        self, engine: AsyncEngine, replica_engines: ReplicaEngines
+    ) -> async_sessionmaker[AsyncSession]:
+        return async_sessionmaker(
+            bind=engine,
+            sync_session_class=RoutingSession,
+            expire_on_commit=False,
+            info={
+                REPLICA_ENGINES_KEY: [
+                    replica.sync_engine for replica in replica_engines
+                ]
+            },
+        )
 
     @provide(scope=Scope.REQUEST)
     async def session(
@@ -1,5 +1,7 @@
 from dishka import Provider, Scope, provide
 
+from isp_compare.repositories.parser_run import ParserRunRepository
+from isp_compare.repositories.popular_search import PopularSearchRepository
 from isp_compare.repositories.provider import ProviderRepository
 from isp_compare.repositories.review import ReviewRepository
 from isp_compare.repositories.search_history import SearchHistoryRepository
@@ -19,5 +21,7 @@ class RepositoryProvider(Provider):
     tariff_repository = provide(TariffRepository)
     review_repository = provide(ReviewRepository)
     search_history = provide(SearchHistoryRepository)
+    popular_search_repository = provide(PopularSearchRepository)
+    parser_run_repository = provide(ParserRunRepository)
 
     user_session_repository = provide(UserSessionRepository)
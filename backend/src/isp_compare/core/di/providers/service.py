@@ -1,19 +1,35 @@
 from dishka import Provider, Scope, provide
+from redis.asyncio import Redis
 
-from isp_compare.services.user_session import UserSessionService
+from isp_compare.core.config import RefreshTokenConfig
+from isp_compare.repositories.token import RefreshTokenRepository
 from isp_compare.services.auth import AuthService
+from isp_compare.services.cache import RedisCache
+from isp_compare.services.catalog_version import CatalogVersion
+from isp_compare.services.database_pool import DatabasePoolMonitor
+from isp_compare.services.http_cache import HttpCache
 from isp_compare.services.identity_provider import IdentityProvider
+from isp_compare.services.parser_scheduler import ParserScheduler
 from isp_compare.services.parser_service import ParserService
 from isp_compare.services.password_hasher import PasswordHasher
 from isp_compare.services.provider import ProviderService
 from isp_compare.services.rate_limiter import RateLimiter
+from isp_compare.services.refresh_token_store import (
+    RedisRefreshTokenStore,
+    RefreshTokenStore,
+    SqlRefreshTokenStore,
+)
 from isp_compare.services.review import ReviewService
 from isp_compare.services.search_history import SearchHistoryService
+from isp_compare.services.search_history_recorder import SearchHistoryRecorder
 from isp_compare.services.tariff import TariffService
 from isp_compare.services.tariff_comparison import TariffComparisonService
 from isp_compare.services.token_processor import TokenProcessor
+from isp_compare.services.token_purger import RefreshTokenPurger
 from isp_compare.services.token_service import TokenService
+from isp_compare.services.transaction_manager import TransactionManager
 from isp_compare.services.user import UserService
+from isp_compare.services.user_session import UserSessionService
 
 
 class ServiceProvider(Provider):
@@ -26,13 +42,32 @@ class ServiceProvider(Provider):
     auth_service = provide(AuthService)
     user_service = provide(UserService)
     token_service = provide(TokenService)
+    refresh_token_purger = provide(RefreshTokenPurger, scope=Scope.APP)
 
+    cache = provide(RedisCache, scope=Scope.APP)
+    catalog_version = provide(CatalogVersion, scope=Scope.APP)
+    http_cache = provide(HttpCache)
     provider_service = provide(ProviderService)
     tariff_service = provide(TariffService)
     tariff_comparison_service = provide(TariffComparisonService)
     review_service = provide(ReviewService)
     search_history_service = provide(SearchHistoryService)
+    search_history_recorder = provide(SearchHistoryRecorder, scope=Scope.APP)
 
     rate_limiter = provide(RateLimiter)
     parser_service = provide(ParserService)
+    parser_scheduler = provide(ParserScheduler, scope=Scope.APP)
     user_session_service = provide(UserSessionService)
+    database_pool_monitor = provide(DatabasePoolMonitor, scope=Scope.APP)
+
+    @provide
+    def refresh_token_store(
+        self,
+        config: RefreshTokenConfig,
+        redis_client: Redis,
+        refresh_token_repository: RefreshTokenRepository,
+        transaction_manager: TransactionManager,
+    ) -> RefreshTokenStore:
+        if config.store == "redis":
+            return RedisRefreshTokenStore(redis_client, config)
+        return SqlRefreshTokenStore(refresh_token_repository, transaction_manager)
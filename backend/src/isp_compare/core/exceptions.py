@@ -127,6 +127,11 @@ class ReviewNotFoundException(AppException):
     detail = "Отзыв не найден."
 
 
+class InvalidCursorException(AppException):
+    status_code = status.HTTP_400_BAD_REQUEST
+    detail = "Некорректный курсор пагинации."
+
+
 class SearchHistoryNotFoundException(AppException):
     status_code = status.HTTP_404_NOT_FOUND
     detail = "История поиска не найдена."
@@ -163,3 +168,8 @@ class UsernameChangeRateLimitExceededException(RateLimitExceededException):
         "Слишком много попыток изменения имени пользователя. "
         "Пожалуйста, попробуйте позже."
     )
+
+
+class NotModifiedException(AppException):
+    status_code = status.HTTP_304_NOT_MODIFIED
+    detail = "Данные не изменились."
@@ -1,3 +1,4 @@
+import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING
@@ -9,12 +10,19 @@ from starlette.middleware.sessions import SessionMiddleware
 
 from isp_compare.admin import setup_admin
 from isp_compare.api import main_router
-from isp_compare.core.config import Config, create_config
+from isp_compare.core.config import Config, RefreshTokenConfig, create_config
+from isp_compare.core.db_routing import ReplicaRoutingMiddleware
 from isp_compare.core.di.main import create_container
+from isp_compare.services.database_pool import DatabasePoolMonitor
+from isp_compare.services.parser_scheduler import ParserScheduler
+from isp_compare.services.search_history_recorder import SearchHistoryRecorder
+from isp_compare.services.token_purger import RefreshTokenPurger
 
 if TYPE_CHECKING:
     from dishka import AsyncContainer
 
+logger = logging.getLogger(__name__)
+
 
 def setup_routers(app: FastAPI) -> None:
     app.include_router(main_router, prefix="/api")
@@ -36,14 +44,46 @@ def setup_middlewares(app: FastAPI, config: Config) -> None:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
+    if config.postgres.replica_hosts:
+        app.add_middleware(
+            ReplicaRoutingMiddleware,
+            sticky_seconds=config.postgres.replica_sticky_seconds,
+        )
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     await setup_admin(app)
+
+    container: AsyncContainer = app.state.dishka_container
+    database_pool_monitor = await container.get(DatabasePoolMonitor)
+    if not await database_pool_monitor.check_capacity():
+        # Запуск не прерываем: при нехватке соединений запросы будут ждать
+        # в очереди пула или получать ошибку "too many clients"
+        logger.warning(
+            "Reduce POSTGRES_POOL_SIZE, POSTGRES_MAX_OVERFLOW or SERVER_WORKERS, "
+            "or raise max_connections on the database server"
+        )
+
+    parser_scheduler = await container.get(ParserScheduler)
+    parser_scheduler.start()
+    search_history_recorder = await container.get(SearchHistoryRecorder)
+    search_history_recorder.start()
+    refresh_token_purger = await container.get(RefreshTokenPurger)
+    refresh_token_config = await container.get(RefreshTokenConfig)
+    # В Redis токены истекают по TTL, чистить таблицу не нужно
+    if refresh_token_config.store == "sql":
+        refresh_token_purger.start()
+
     yield
 
+    await parser_scheduler.stop()
+    await refresh_token_purger.stop()
+    # Дописываем в БД все, что успело накопиться в очереди
+    await search_history_recorder.stop()
+
 
 def create_application() -> FastAPI:
     config: Config = create_config()
@@ -1,4 +1,6 @@
 from isp_compare.models.base import Base
+from isp_compare.models.parser_run import ParserRun
+from isp_compare.models.popular_search import PopularSearch
 from isp_compare.models.provider import Provider
 from isp_compare.models.review import Review
 from isp_compare.models.search_history import SearchHistory
@@ -9,6 +11,8 @@ from isp_compare.models.user_session import UserSession
 
 __all__ = [
     "Base",
+    "ParserRun",
+    "PopularSearch",
     "Provider",
     "RefreshToken",
     "Review",
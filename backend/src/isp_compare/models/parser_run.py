@@ -0,0 +1,44 @@
+from datetime import datetime
+from enum import StrEnum
+from uuid import UUID
+
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from isp_compare.models.base import Base, CreatedDateMixin, IdMixin
+
+
+class ParserRunStatus(StrEnum):
+    RUNNING = "running"
+    SUCCESS = "success"
+    FAILED = "failed"
+
+
+class ParserRun(IdMixin, CreatedDateMixin, Base):
+    __tablename__ = "parser_runs"
+    __table_args__ = (
+        Index("ix_parser_runs_job_id", "job_id"),
+        Index("ix_parser_runs_provider_name_started_at", "provider_name", "started_at"),
+        Index("ix_parser_runs_started_at", "started_at"),
+    )
+
+    job_id: Mapped[UUID]
+    provider_id: Mapped[UUID | None] = mapped_column(
+        ForeignKey("providers.id", ondelete="SET NULL")
+    )
+    provider_name: Mapped[str] = mapped_column(String(255))
+
+    status: Mapped[ParserRunStatus] = mapped_column(String(32))
+    error: Mapped[str | None] = mapped_column(Text)
+
+    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+    # Длительность этапов в секундах
+    http_time: Mapped[float] = mapped_column(default=0)
+    parse_time: Mapped[float] = mapped_column(default=0)
+    db_time: Mapped[float] = mapped_column(default=0)
+
+    items_count: Mapped[int] = mapped_column(default=0)
+    errors_count: Mapped[int] = mapped_column(default=0)
+    changes_count: Mapped[int] = mapped_column(default=0)
@@ -0,0 +1,20 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, UniqueConstraint, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from isp_compare.models.base import Base, IdMixin
+
+
+class PopularSearch(IdMixin, Base):
+    __tablename__ = "popular_searches"
+    __table_args__ = (
+        UniqueConstraint("filters"),
+        Index("ix_popular_searches_searches_count", text("searches_count DESC")),
+    )
+
+    # Параметры поиска без пагинации
+    filters: Mapped[dict] = mapped_column(JSONB)
+    searches_count: Mapped[int] = mapped_column(default=0)
+    last_searched_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Text
+from sqlalchemy import Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from isp_compare.models.base import Base, IdMixin, TimestampMixin
@@ -12,6 +12,7 @@ if TYPE_CHECKING:
 
 class Provider(IdMixin, TimestampMixin, Base):
     __tablename__ = "providers"
+    __table_args__ = (Index("ix_providers_name", "name", unique=True),)
 
     name: Mapped[str] = mapped_column(String(255))
     description: Mapped[str | None] = mapped_column(Text)
@@ -19,6 +20,8 @@ class Provider(IdMixin, TimestampMixin, Base):
     phone: Mapped[str]
     logo_url: Mapped[str | None]
     rating: Mapped[float | None]
+    rating_sum: Mapped[int] = mapped_column(default=0, server_default="0")
+    reviews_count: Mapped[int] = mapped_column(default=0, server_default="0")
 
     tariffs: Mapped[list["Tariff"]] = relationship(
         back_populates="provider", cascade="all, delete-orphan"
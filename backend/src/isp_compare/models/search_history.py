@@ -1,7 +1,8 @@
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import JSON, ForeignKey
+from sqlalchemy import ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from isp_compare.models.base import Base, CreatedDateMixin, IdMixin
@@ -16,4 +17,13 @@ class SearchHistory(IdMixin, CreatedDateMixin, Base):
     user_id: Mapped[UUID] = mapped_column(ForeignKey("users.id"))
     user: Mapped["User"] = relationship()
 
-    search_params: Mapped[dict] = mapped_column(JSON, nullable=False)
+    search_params: Mapped[dict] = mapped_column(JSONB, nullable=False)
+
+    __table_args__ = (
+        Index(
+            "ix_search_history_user_id_created_at",
+            "user_id",
+            text("created_at DESC"),
+        ),
+        Index("ix_search_history_created_at", "created_at"),
+    )
@@ -0,0 +1,24 @@
+from collections.abc import Callable
+
+from isp_compare.parsers.base import BaseParser
+from isp_compare.parsers.engine import (
+    ParserFactory,
+    ParserSpec,
+    SelectorParser,
+    SelectorSpec,
+)
+from isp_compare.parsers.providers import PROVIDER_SPECS
+
+PARSERS: dict[str, Callable[[], BaseParser]] = {
+    spec.provider_name: ParserFactory(spec) for spec in PROVIDER_SPECS
+}
+
+__all__ = [
+    "PARSERS",
+    "PROVIDER_SPECS",
+    "BaseParser",
+    "ParserFactory",
+    "ParserSpec",
+    "SelectorParser",
+    "SelectorSpec",
+]
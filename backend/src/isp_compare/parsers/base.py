@@ -1,18 +1,37 @@
 import re
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from typing import ClassVar
 from uuid import UUID
 
+import httpx
+
 from isp_compare.schemas.tariff import TariffCreate
 
 
 class BaseParser(ABC):
     provider_name: str
     provider_id: UUID | None = None
+    tariffs_url: str
+    headers: ClassVar[dict[str, str]] = {}
+
+    def __init__(self) -> None:
+        self.errors_count = 0
+
+    async def fetch(self) -> str:
+        async with httpx.AsyncClient(headers=self.headers) as client:
+            response = await client.get(self.tariffs_url)
+            return response.text
 
     @abstractmethod
-    async def parse_tariffs(self) -> list[TariffCreate]:
+    def parse(self, html: str) -> AsyncIterator[TariffCreate]:
         pass
 
+    async def parse_tariffs(self) -> AsyncIterator[TariffCreate]:
+        html = await self.fetch()
+        async for tariff in self.parse(html):
+            yield tariff
+
     @staticmethod
     def clean_price(price_str: str) -> float:
         cleaned = re.sub(r"[^\d.]", "", price_str.replace(",", "."))
@@ -0,0 +1,159 @@
+import asyncio
+import logging
+import re
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field, fields
+from decimal import Decimal
+
+import soupsieve
+from bs4 import BeautifulSoup, Tag
+from soupsieve import SoupSieve
+
+from isp_compare.parsers.base import BaseParser
+from isp_compare.schemas.tariff import TariffCreate
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class SelectorSpec:
+    card: str
+    name: str
+    price: str
+    speed: str
+    description: str
+    link: str
+    promo_price: str
+    promo_period: str
+    # None - признаки ТВ/телефона ищутся по всему тексту карточки
+    features: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ParserSpec:
+    provider_name: str
+    base_url: str
+    tariffs_url: str
+    selectors: SelectorSpec
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledSelectors:
+    card: SoupSieve
+    fields: tuple[tuple[str, SoupSieve], ...]
+
+    @classmethod
+    def compile(cls, selectors: SelectorSpec) -> "CompiledSelectors":
+        compiled_fields = tuple(
+            (spec_field.name, soupsieve.compile(value))
+            for spec_field in fields(selectors)
+            if spec_field.name != "card"
+            and (value := getattr(selectors, spec_field.name)) is not None
+        )
+        return cls(card=soupsieve.compile(selectors.card), fields=compiled_fields)
+
+
+REQUIRED_FIELDS = frozenset({"name", "price", "speed", "description", "features"})
+
+
+class SelectorParser(BaseParser):
+    def __init__(self, spec: ParserSpec, selectors: CompiledSelectors) -> None:
+        super().__init__()
+        self.provider_name = spec.provider_name
+        self.base_url = spec.base_url
+        self.tariffs_url = spec.tariffs_url
+        self.headers = spec.headers
+        self._selectors = selectors
+
+    async def parse(self, html: str) -> AsyncIterator[TariffCreate]:
+        soup = BeautifulSoup(html, "html.parser")
+
+        for card in self._selectors.card.iselect(soup):
+            try:
+                tariff = self.parse_card(card)
+            except (KeyError, AttributeError, ValueError, TypeError) as e:
+                logger.exception(f"Error parsing tariff: {e}")
+                self.errors_count += 1
+                continue
+
+            yield tariff
+            # Отдаем управление циклу событий, чтобы запись предыдущей пачки
+            # в БД шла параллельно с разбором следующих карточек.
+            await asyncio.sleep(0)
+
+    def parse_card(self, card: Tag) -> TariffCreate:
+        found = self._extract(card)
+
+        missing = REQUIRED_FIELDS.intersection(
+            name for name, _ in self._selectors.fields
+        ).difference(found)
+        if missing:
+            raise ValueError(f"Missing fields: {', '.join(sorted(missing))}")
+
+        price = self.clean_price(self._text(found["price"]))
+        speed = self.clean_speed(self._text(found["speed"]))
+
+        features = found.get("features", card)
+        features_text = features.get_text().lower()
+        has_tv = "тв" in features_text or "телевидение" in features_text
+        has_phone = "телефон" in features_text
+
+        link = found.get("link")
+        url = self.base_url + link["href"] if link else None
+
+        promo_price = None
+        if "promo_price" in found:
+            promo_price = self.clean_price(self._text(found["promo_price"]))
+
+        promo_period = None
+        if "promo_period" in found:
+            period_match = re.search(r"\d+", self._text(found["promo_period"]))
+            promo_period = int(period_match.group(0)) if period_match else None
+
+        return TariffCreate(
+            name=self._text(found["name"]),
+            description=self._text(found["description"]),
+            price=Decimal(str(price)),
+            speed=speed,
+            has_tv=has_tv,
+            has_phone=has_phone,
+            connection_cost=Decimal("0"),
+            promo_price=Decimal(str(promo_price)) if promo_price else None,
+            promo_period=promo_period,
+            is_active=True,
+            url=url,
+        )
+
+    def _extract(self, card: Tag) -> dict[str, Tag]:
+        # Один обход потомков карточки вместо отдельного select_one на каждое
+        # поле; как и select_one, берем первое совпадение в порядке документа.
+        pending = list(self._selectors.fields)
+        found: dict[str, Tag] = {}
+
+        for element in card.descendants:
+            if not pending:
+                break
+            if not isinstance(element, Tag):
+                continue
+
+            for item in pending[:]:
+                name, selector = item
+                if selector.match(element):
+                    found[name] = element
+                    pending.remove(item)
+
+        return found
+
+    @staticmethod
+    def _text(element: Tag) -> str:
+        return element.get_text().strip()
+
+
+class ParserFactory:
+    def __init__(self, spec: ParserSpec) -> None:
+        self.spec = spec
+        self._selectors = CompiledSelectors.compile(spec.selectors)
+
+    def __call__(self) -> SelectorParser:
+        return SelectorParser(self.spec, self._selectors)
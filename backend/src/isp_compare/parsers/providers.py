@@ -0,0 +1,68 @@
+from isp_compare.parsers.engine import ParserSpec, SelectorSpec
+
+ROSTELECOM = ParserSpec(
+    provider_name="Ростелеком",
+    base_url="https://volgograd.rt.ru",
+    tariffs_url="https://volgograd.rt.ru/",
+    headers={
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,"
+        "image/webp,image/apng,*/*;q=0.8",
+        "Accept-Language": "ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7",
+        "Accept-Encoding": "gzip, deflate, br",
+        "Connection": "keep-alive",
+        "Cache-Control": "max-age=0",
+        "Sec-Fetch-Dest": "document",
+        "Sec-Fetch-Mode": "navigate",
+        "Sec-Fetch-Site": "none",
+        "Sec-Fetch-User": "?1",
+        "Upgrade-Insecure-Requests": "1",
+    },
+    selectors=SelectorSpec(
+        card=".tariff-card",
+        name=".tariff-title",
+        price=".tariff-price",
+        speed=".tariff-speed",
+        description=".tariff-description",
+        features=".tariff-features",
+        link="a.tariff-link",
+        promo_price=".tariff-promo .promo-price",
+        promo_period=".tariff-promo .promo-period",
+    ),
+)
+
+DOMRU = ParserSpec(
+    provider_name="Дом.ru",
+    base_url="https://volgograd.dom.ru",
+    tariffs_url="https://volgograd.dom.ru/internet",
+    selectors=SelectorSpec(
+        card=".tariff-item",
+        name=".tariff-name",
+        price=".tariff-price",
+        speed=".tariff-speed",
+        description=".tariff-desc",
+        features=".tariff-features",
+        link="a.tariff-more",
+        promo_price=".tariff-promo .promo-price",
+        promo_period=".tariff-promo .promo-period",
+    ),
+)
+
+BEELINE = ParserSpec(
+    provider_name="Билайн",
+    base_url="https://moskva.beeline.ru",
+    tariffs_url="https://moskva.beeline.ru/customers/products/home/",
+    selectors=SelectorSpec(
+        card=".tariff-card",
+        name=".tariff-name",
+        price=".tariff-price",
+        speed=".tariff-speed",
+        description=".tariff-description",
+        link="a.tariff-detail",
+        promo_price=".tariff-promo .promo-price",
+        promo_period=".tariff-promo .promo-period",
+    ),
+)
+
+PROVIDER_SPECS = [ROSTELECOM, DOMRU, BEELINE]
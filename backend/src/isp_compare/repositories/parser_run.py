@@ -0,0 +1,39 @@
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from isp_compare.models.parser_run import ParserRun
+
+
+class ParserRunRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def create(self, parser_run: ParserRun) -> None:
+        self._session.add(parser_run)
+
+    async def update(self, parser_run_id: UUID, update_data: dict[str, Any]) -> None:
+        stmt = (
+            update(ParserRun).where(ParserRun.id == parser_run_id).values(**update_data)
+        )
+        await self._session.execute(stmt)
+
+    async def get_list(
+        self,
+        limit: int,
+        offset: int,
+        provider_name: str | None = None,
+        job_id: UUID | None = None,
+    ) -> list[ParserRun]:
+        stmt = select(ParserRun)
+
+        if provider_name is not None:
+            stmt = stmt.where(ParserRun.provider_name == provider_name)
+        if job_id is not None:
+            stmt = stmt.where(ParserRun.job_id == job_id)
+
+        stmt = stmt.order_by(ParserRun.started_at.desc()).limit(limit).offset(offset)
+        result = await self._session.execute(stmt)
+        return list(result.scalars())
@@ -0,0 +1,36 @@
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from isp_compare.models.popular_search import PopularSearch
+
+
+class PopularSearchRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def increment(self, rows: list[dict[str, Any]]) -> None:
+        # Каждая строка - уникальный набор фильтров с числом новых поисков
+        stmt = insert(PopularSearch).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[PopularSearch.filters],
+            set_={
+                "searches_count": PopularSearch.searches_count
+                + stmt.excluded.searches_count,
+                "last_searched_at": func.greatest(
+                    PopularSearch.last_searched_at, stmt.excluded.last_searched_at
+                ),
+            },
+        )
+        await self._session.execute(stmt)
+
+    async def get_top(self, limit: int) -> list[PopularSearch]:
+        stmt = (
+            select(PopularSearch)
+            .order_by(PopularSearch.searches_count.desc())
+            .limit(limit)
+        )
+        result = await self._session.scalars(stmt)
+        return list(result)
@@ -1,7 +1,7 @@
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select, update
+from sqlalchemy import Float, cast, exists, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from isp_compare.models.provider import Provider
@@ -12,35 +12,23 @@ class ProviderRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
-    async def get_by_id(self, provider_id: UUID) -> tuple[Provider, int] | None:
-        stmt = (
-            select(Provider, func.count(Review.id).label("reviews_count"))
-            .outerjoin(Review, Provider.id == Review.provider_id)
-            .where(Provider.id == provider_id)
-            .group_by(Provider.id)
-        )
-        result = await self._session.execute(stmt)
-        row = result.one_or_none()
+    async def get_by_id(self, provider_id: UUID) -> Provider | None:
+        stmt = select(Provider).where(Provider.id == provider_id)
+        return await self._session.scalar(stmt)
 
-        if row:
-            provider, reviews_count = row
-            return provider, reviews_count
-        return None
+    async def exists(self, provider_id: UUID) -> bool:
+        stmt = select(exists().where(Provider.id == provider_id))
+        return bool(await self._session.scalar(stmt))
 
-    async def get_all(self) -> list[tuple[Provider, int]]:
-        stmt = (
-            select(Provider, func.count(Review.id).label("reviews_count"))
-            .outerjoin(Review, Provider.id == Review.provider_id)
-            .group_by(Provider.id)
-        )
+    async def get_by_name(self, name: str) -> Provider | None:
+        stmt = select(Provider).where(Provider.name == name)
         result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
 
-        providers_with_counts = []
-        for row in result:
-            provider, reviews_count = row
-            providers_with_counts.append((provider, reviews_count))
-
-        return providers_with_counts
+    async def get_all(self) -> list[Provider]:
+        stmt = select(Provider)
+        result = await self._session.execute(stmt)
+        return list(result.scalars())
 
     async def get_multiple_by_ids(
         self, provider_ids: list[UUID]
@@ -57,3 +45,48 @@ class ProviderRepository:
     async def update(self, provider_id: UUID, update_data: dict[str, Any]) -> None:
         stmt = update(Provider).where(Provider.id == provider_id).values(**update_data)
         await self._session.execute(stmt)
+
+    async def apply_review_change(
+        self, provider_id: UUID, rating_delta: int, count_delta: int
+    ) -> None:
+        # Считаем от текущих значений строки внутри UPDATE, поэтому
+        # параллельные отзывы не затирают изменения друг друга.
+        rating_sum = Provider.rating_sum + rating_delta
+        reviews_count = Provider.reviews_count + count_delta
+        stmt = (
+            update(Provider)
+            .where(Provider.id == provider_id)
+            .values(
+                rating_sum=rating_sum,
+                reviews_count=reviews_count,
+                rating=cast(rating_sum, Float) / func.nullif(reviews_count, 0),
+            )
+        )
+        await self._session.execute(stmt)
+
+    async def recalculate_review_stats(
+        self, provider_ids: list[UUID] | None = None
+    ) -> int:
+        rating_sum = (
+            select(func.coalesce(func.sum(Review.rating), 0))
+            .where(Review.provider_id == Provider.id)
+            .scalar_subquery()
+        )
+        reviews_count = (
+            select(func.count(Review.id))
+            .where(Review.provider_id == Provider.id)
+            .scalar_subquery()
+        )
+        rating = (
+            select(func.avg(Review.rating))
+            .where(Review.provider_id == Provider.id)
+            .scalar_subquery()
+        )
+        stmt = update(Provider).values(
+            rating_sum=rating_sum, reviews_count=reviews_count, rating=rating
+        )
+        if provider_ids is not None:
+            stmt = stmt.where(Provider.id.in_(provider_ids))
+
+        result = await self._session.execute(stmt)
+        return result.rowcount
@@ -1,7 +1,8 @@
+from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select, update
+from sqlalchemy import and_, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
@@ -18,51 +19,61 @@ class ReviewRepository:
     async def get_by_id(
         self, review_id: UUID, for_update: bool = False
     ) -> Review | None:
-        if for_update:
-            stmt = select(Review).where(Review.id == review_id)
-            stmt = stmt.with_for_update()
-            review = await self._session.scalar(stmt)
-
-            if review:
-                await self._session.refresh(review, ["user"])
-            return review
         stmt = (
             select(Review)
-            .options(joinedload(Review.user))
+            .options(joinedload(Review.user, innerjoin=True))
             .where(Review.id == review_id)
         )
+        if for_update:
+            stmt = stmt.with_for_update(of=Review)
         return await self._session.scalar(stmt)
 
     async def get_by_user_and_provider(
-        self, user_id: UUID, provider_id: UUID
+        self, user_id: UUID, provider_id: UUID, for_update: bool = False
     ) -> Review | None:
         stmt = select(Review).where(
             Review.user_id == user_id, Review.provider_id == provider_id
         )
+        if for_update:
+            stmt = stmt.with_for_update()
         return await self._session.scalar(stmt)
 
     async def get_by_provider(
-        self, provider_id: UUID, limit: int, offset: int
+        self,
+        provider_id: UUID,
+        limit: int,
+        offset: int = 0,
+        cursor: tuple[datetime, UUID] | None = None,
     ) -> list[Review]:
         stmt = (
             select(Review)
-            .options(joinedload(Review.user))
+            .options(joinedload(Review.user, innerjoin=True))
             .where(Review.provider_id == provider_id)
-            .order_by(Review.created_at.desc())
+            .order_by(Review.created_at.desc(), Review.id)
             .limit(limit)
-            .offset(offset)
         )
+        if cursor:
+            # Порядок совпадает с индексом (provider_id, created_at DESC, id)
+            created_at, review_id = cursor
+            stmt = stmt.where(
+                or_(
+                    Review.created_at < created_at,
+                    and_(Review.created_at == created_at, Review.id > review_id),
+                )
+            )
+        elif offset:
+            stmt = stmt.offset(offset)
+
         result = await self._session.execute(stmt)
-        return list(result.scalars().unique())
+        return list(result.scalars())
 
-    async def update(self, review_id: UUID, update_data: dict[str, Any]) -> None:
-        stmt = update(Review).where(Review.id == review_id).values(**update_data)
-        await self._session.execute(stmt)
+    async def update(self, review: Review, update_data: dict[str, Any]) -> None:
+        # Строка уже заблокирована и загружена вместе с автором, поэтому
+        # меняем сам объект: UPDATE ... RETURNING с populate_existing
+        # сбросил бы загруженную связь user
+        for key, value in update_data.items():
+            setattr(review, key, value)
+        await self._session.flush()
 
     async def delete(self, review: Review) -> None:
         await self._session.delete(review)
-
-    async def calculate_average_rating(self, provider_id: UUID) -> float:
-        stmt = select(func.avg(Review.rating)).where(Review.provider_id == provider_id)
-        result = await self._session.scalar(stmt)
-        return result or None
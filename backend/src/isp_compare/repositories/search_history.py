@@ -1,9 +1,13 @@
+from collections.abc import Collection
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from isp_compare.models.search_history import SearchHistory
+from isp_compare.models.user import User
 
 
 class SearchHistoryRepository:
@@ -13,6 +17,25 @@ class SearchHistoryRepository:
     async def create(self, search_history: SearchHistory) -> None:
         self._session.add(search_history)
 
+    async def create_many(self, rows: list[dict[str, Any]]) -> None:
+        await self._session.execute(insert(SearchHistory), rows)
+
+    async def get_latest_params_by_users(
+        self, user_ids: Collection[UUID]
+    ) -> dict[UUID, dict | None]:
+        # Пользователи, которых нет в результате, уже удалены
+        latest_params = (
+            select(SearchHistory.search_params)
+            .where(SearchHistory.user_id == User.id)
+            .order_by(SearchHistory.created_at.desc())
+            .limit(1)
+            .correlate(User)
+            .scalar_subquery()
+        )
+        stmt = select(User.id, latest_params).where(User.id.in_(user_ids))
+        result = await self._session.execute(stmt)
+        return dict(result.tuples().all())
+
     async def get_by_id(
         self, search_history_id: UUID, for_update: bool = False
     ) -> SearchHistory | None:
@@ -47,6 +70,36 @@ class SearchHistoryRepository:
     async def delete(self, search_history: SearchHistory) -> None:
         await self._session.delete(search_history)
 
+    async def trim_to_limit(self, user_ids: Collection[UUID], limit: int) -> int:
+        ranked = (
+            select(
+                SearchHistory.id,
+                func.row_number()
+                .over(
+                    partition_by=SearchHistory.user_id,
+                    order_by=SearchHistory.created_at.desc(),
+                )
+                .label("position"),
+            )
+            .where(SearchHistory.user_id.in_(user_ids))
+            .subquery()
+        )
+        stmt = delete(SearchHistory).where(
+            SearchHistory.id.in_(select(ranked.c.id).where(ranked.c.position > limit))
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount
+
+    async def delete_created_before(self, created_before: datetime, limit: int) -> int:
+        expired = (
+            select(SearchHistory.id)
+            .where(SearchHistory.created_at < created_before)
+            .limit(limit)
+        )
+        stmt = delete(SearchHistory).where(SearchHistory.id.in_(expired))
+        result = await self._session.execute(stmt)
+        return result.rowcount
+
     async def delete_all_for_user(self, user_id: UUID) -> None:
         stmt = delete(SearchHistory).where(SearchHistory.user_id == user_id)
         await self._session.execute(stmt)
@@ -1,12 +1,32 @@
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import case, select, update
+from sqlalchemy import Result, case, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from isp_compare.models.tariff import Tariff
 
 
+# Колонки ответа каталога: списки читаются строками, без ORM-объектов,
+# identity map и отслеживания изменений - эти запросы ничего не пишут.
+# Строки отдаются обычными dict: pydantic валидирует их быстрее, чем Row.
+TARIFF_LIST_COLUMNS = (
+    Tariff.id,
+    Tariff.provider_id,
+    Tariff.name,
+    Tariff.description,
+    Tariff.price,
+    Tariff.speed,
+    Tariff.has_tv,
+    Tariff.has_phone,
+    Tariff.connection_cost,
+    Tariff.promo_price,
+    Tariff.promo_period,
+    Tariff.is_active,
+    Tariff.url,
+)
+
+
 class TariffRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
@@ -14,6 +34,26 @@ class TariffRepository:
     async def create(self, tariff: Tariff) -> None:
         self._session.add(tariff)
 
+    async def create_many(self, tariffs_data: list[dict[str, Any]]) -> None:
+        if not tariffs_data:
+            return
+
+        await self._session.execute(insert(Tariff), tariffs_data)
+
+    async def update_many(self, tariffs_data: list[dict[str, Any]]) -> None:
+        # Пакетный UPDATE по первичному ключу: в каждом словаре есть id
+        if not tariffs_data:
+            return
+
+        await self._session.execute(update(Tariff), tariffs_data)
+
+    async def deactivate_many(self, tariff_ids: list[UUID]) -> None:
+        if not tariff_ids:
+            return
+
+        stmt = update(Tariff).where(Tariff.id.in_(tariff_ids)).values(is_active=False)
+        await self._session.execute(stmt)
+
     async def get_by_id(
         self, tariff_id: UUID, for_update: bool = False
     ) -> Tariff | None:
@@ -22,18 +62,21 @@ class TariffRepository:
             stmt = stmt.with_for_update()
         return await self._session.scalar(stmt)
 
-    async def get_all(self, limit: int, offset: int) -> list[Tariff]:
+    async def get_all(self, limit: int, offset: int) -> list[dict[str, Any]]:
         stmt = (
-            select(Tariff).where(Tariff.is_active.is_(True)).limit(limit).offset(offset)
+            select(*TARIFF_LIST_COLUMNS)
+            .where(Tariff.is_active.is_(True))
+            .limit(limit)
+            .offset(offset)
         )
         result = await self._session.execute(stmt)
-        return list(result.scalars())
+        return _as_dicts(result)
 
     async def get_by_provider(
         self, provider_id: UUID, limit: int, offset: int
-    ) -> list[Tariff]:
+    ) -> list[dict[str, Any]]:
         stmt = (
-            select(Tariff)
+            select(*TARIFF_LIST_COLUMNS)
             .where(
                 Tariff.provider_id == provider_id,
                 Tariff.is_active.is_(True),
@@ -42,7 +85,15 @@ class TariffRepository:
             .offset(offset)
         )
         result = await self._session.execute(stmt)
-        return list(result.scalars())
+        return _as_dicts(result)
+
+    async def get_active_by_provider(self, provider_id: UUID) -> list[dict[str, Any]]:
+        stmt = select(*TARIFF_LIST_COLUMNS).where(
+            Tariff.provider_id == provider_id,
+            Tariff.is_active.is_(True),
+        )
+        result = await self._session.execute(stmt)
+        return _as_dicts(result)
 
     async def get_multiple_by_ids(self, tariff_ids: list[UUID]) -> dict[UUID, Tariff]:
         if not tariff_ids:
@@ -73,8 +124,8 @@ class TariffRepository:
         has_phone: bool | None,
         limit: int,
         offset: int,
-    ) -> list[Tariff]:
-        query = select(Tariff)
+    ) -> list[dict[str, Any]]:
+        query = select(*TARIFF_LIST_COLUMNS)
 
         effective_price = case(
             (Tariff.promo_price.isnot(None), Tariff.promo_price), else_=Tariff.price
@@ -97,4 +148,9 @@ class TariffRepository:
         query = query.limit(limit).offset(offset)
 
         result = await self._session.execute(query)
-        return list(result.scalars())
+        return _as_dicts(result)
+
+
+def _as_dicts(result: Result) -> list[dict[str, Any]]:
+    keys = tuple(result.keys())
+    return [dict(zip(keys, row, strict=True)) for row in result]
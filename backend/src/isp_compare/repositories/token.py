@@ -1,7 +1,7 @@
 from datetime import UTC, datetime
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy import select, update
+from sqlalchemy import delete, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from isp_compare.models.token import RefreshToken
@@ -14,8 +14,33 @@ class RefreshTokenRepository:
     async def create(self, refresh_token: RefreshToken) -> None:
         self._session.add(refresh_token)
 
-    async def get_by_token(self, token: str) -> RefreshToken | None:
-        stmt = select(RefreshToken).where(RefreshToken.token == token)
+    async def create_revoking_others(
+        self, user_id: UUID, token_hash: bytes, expires_at: datetime
+    ) -> None:
+        # Отзыв прежних токенов пользователя и вставка нового - один запрос:
+        # UPDATE в CTE не видит строку, которую добавляет INSERT. Значения
+        # по умолчанию задаем явно: при CTE SQLAlchemy их не подставляет
+        revoked = (
+            update(RefreshToken)
+            .where(RefreshToken.user_id == user_id, ~RefreshToken.revoked)
+            .values(revoked=True, revoked_at=datetime.now(UTC))
+            .cte("revoked")
+        )
+        stmt = (
+            insert(RefreshToken)
+            .values(
+                id=uuid4(),
+                user_id=user_id,
+                token_hash=token_hash,
+                expires_at=expires_at,
+                revoked=False,
+            )
+            .add_cte(revoked)
+        )
+        await self._session.execute(stmt)
+
+    async def get_by_token_hash(self, token_hash: bytes) -> RefreshToken | None:
+        stmt = select(RefreshToken).where(RefreshToken.token_hash == token_hash)
         return await self._session.scalar(stmt)
 
     async def get_by_user_id(self, user_id: UUID) -> list[RefreshToken]:
@@ -23,10 +48,13 @@ class RefreshTokenRepository:
         result = await self._session.execute(stmt)
         return list(result.scalars())
 
-    async def revoke(self, token: str) -> None:
+    async def revoke(self, token_hash: bytes) -> None:
         stmt = (
             update(RefreshToken)
-            .where(RefreshToken.token == token, RefreshToken.revoked.is_(False))
+            .where(
+                RefreshToken.token_hash == token_hash,
+                ~RefreshToken.revoked,
+            )
             .values(revoked=True, revoked_at=datetime.now(UTC))
         )
         await self._session.execute(stmt)
@@ -36,16 +64,35 @@ class RefreshTokenRepository:
             update(RefreshToken)
             .where(
                 RefreshToken.user_id == user_id,
-                RefreshToken.revoked.is_(False),
+                # Условие в той же форме, что у частичного индекса:
+                # с "revoked IS false" планировщик индекс не применит
+                ~RefreshToken.revoked,
             )
             .values(revoked=True, revoked_at=datetime.now(UTC))
         )
         await self._session.execute(stmt)
 
-    async def delete_expired(self) -> None:
-        stmt = select(RefreshToken).where(RefreshToken.expires_at < datetime.now(UTC))
+    async def delete_expired(self, limit: int) -> int:
+        expired = (
+            select(RefreshToken.id)
+            .where(RefreshToken.expires_at < func.now())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = delete(RefreshToken).where(RefreshToken.id.in_(expired))
         result = await self._session.execute(stmt)
-        expired_tokens = list(result.scalars())
+        return result.rowcount
 
-        for token in expired_tokens:
-            await self._session.delete(token)
+    async def delete_revoked_before(self, revoked_before: datetime, limit: int) -> int:
+        revoked = (
+            select(RefreshToken.id)
+            .where(
+                RefreshToken.revoked,
+                RefreshToken.revoked_at < revoked_before,
+            )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = delete(RefreshToken).where(RefreshToken.id.in_(revoked))
+        result = await self._session.execute(stmt)
+        return result.rowcount
@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+
+
+class PoolStatsResponse(BaseModel):
+    name: str
+    size: int
+    checked_out: int
+    overflow: int
+    max_connections: int
+
+    waits: int
+    wait_time_total: float
+    wait_time_max: float
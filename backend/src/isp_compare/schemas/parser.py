@@ -0,0 +1,33 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+from isp_compare.models.parser_run import ParserRunStatus
+
+
+class ParserJobResponse(BaseModel):
+    job_id: UUID
+    providers: list[str]
+
+
+class ParserRunResponse(BaseModel):
+    id: UUID
+    job_id: UUID
+    provider_id: UUID | None
+    provider_name: str
+    status: ParserRunStatus
+    error: str | None
+
+    started_at: datetime
+    finished_at: datetime | None
+
+    http_time: float
+    parse_time: float
+    db_time: float
+
+    items_count: int
+    errors_count: int
+    changes_count: int
+
+    model_config = ConfigDict(from_attributes=True)
@@ -18,3 +18,11 @@ class SearchHistoryResponse(BaseModel):
     created_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class PopularSearchResponse(BaseModel):
+    filters: dict[str, Any]
+    searches_count: int
+    last_searched_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
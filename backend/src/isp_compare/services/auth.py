@@ -1,3 +1,4 @@
+import asyncio
 from typing import cast
 
 from asyncpg import UniqueViolationError
@@ -93,14 +94,19 @@ class AuthService:
     async def login(self, data: UserLogin, response: Response) -> TokenResponse:
         ip_address = self._request.client.host if self._request.client else "unknown"
 
-        is_allowed, remaining = await self._rate_limiter.check_failed_login_limit(
-            username=data.username, ip_address=ip_address
+        # Проверка лимита в Redis и выборка пользователя не зависят друг
+        # от друга и идут параллельно
+        (is_allowed, remaining), user = await asyncio.gather(
+            self._rate_limiter.check_failed_login_limit(
+                username=data.username, ip_address=ip_address
+            ),
+            self._user_repository.get_by_username(data.username),
         )
+        # На время проверки пароля соединение возвращается в пул
+        await self._transaction_manager.release()
         if not is_allowed:
             raise LoginRateLimitExceededException(retry_after=300)
 
-        user = await self._user_repository.get_by_username(data.username)
-
         if not user or not self._password_hasher.verify(
             data.password, user.hashed_password
         ):
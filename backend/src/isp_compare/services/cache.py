@@ -0,0 +1,128 @@
+import logging
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from pydantic import TypeAdapter
+from redis.asyncio import Redis
+from redis.exceptions import WatchError
+
+from isp_compare.services.redis_lock import RedisLock
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CACHE_FRESH_KEY = "{key}:fresh"
+CACHE_LOCK_KEY = "{key}:lock"
+CACHE_VERSION_KEY = "{key}:version"
+# Блокировка пересчета живет не дольше самого медленного запроса к БД
+CACHE_LOCK_TIMEOUT = 10
+CACHE_LOCK_RETRY_INTERVAL = 0.05
+
+
+class RedisCache:
+    def __init__(self, redis_client: Redis) -> None:
+        self._redis = redis_client
+
+    async def get_or_set(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[T]],
+        adapter: TypeAdapter[T],
+        ttl: int,
+        stale_ttl: int = 0,
+    ) -> T:
+        async def serialize() -> bytes:
+            return adapter.dump_json(await factory())
+
+        data = await self.get_or_set_raw(key, serialize, ttl, stale_ttl)
+        return adapter.validate_json(data)
+
+    async def get_or_set_raw(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[bytes]],
+        ttl: int,
+        stale_ttl: int = 0,
+    ) -> bytes:
+        data, fresh = await self._redis.mget(key, CACHE_FRESH_KEY.format(key=key))
+        if data is not None and fresh is not None:
+            return self._to_bytes(data)
+
+        lock = RedisLock(
+            self._redis, CACHE_LOCK_KEY.format(key=key), timeout=CACHE_LOCK_TIMEOUT
+        )
+
+        if data is not None:
+            # Устаревшее значение: пересчитывает один запрос, остальные
+            # сразу получают старые данные и не ждут.
+            if not await lock.acquire():
+                return self._to_bytes(data)
+        elif not await lock.acquire(
+            blocking_timeout=CACHE_LOCK_TIMEOUT,
+            retry_interval=CACHE_LOCK_RETRY_INTERVAL,
+        ):
+            logger.warning(f"Cache lock wait timed out for {key}")
+            return await factory()
+
+        try:
+            if data is None:
+                # Пока ждали блокировку, значение мог посчитать другой запрос
+                data = await self._redis.get(key)
+                if data is not None:
+                    return self._to_bytes(data)
+
+            return await self._refresh(key, factory, ttl, stale_ttl)
+        finally:
+            await lock.release()
+
+    async def get(self, key: str, adapter: TypeAdapter[T]) -> T | None:
+        data, fresh = await self._redis.mget(key, CACHE_FRESH_KEY.format(key=key))
+        if data is None or fresh is None:
+            return None
+
+        return adapter.validate_json(data)
+
+    async def invalidate(self, *keys: str) -> None:
+        if not keys:
+            return
+
+        async with self._redis.pipeline(transaction=True) as pipe:
+            for key in keys:
+                pipe.delete(key, CACHE_FRESH_KEY.format(key=key))
+                pipe.incr(CACHE_VERSION_KEY.format(key=key))
+            await pipe.execute()
+
+    async def _refresh(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[bytes]],
+        ttl: int,
+        stale_ttl: int,
+    ) -> bytes:
+        version_key = CACHE_VERSION_KEY.format(key=key)
+        version = await self._redis.get(version_key)
+
+        value = await factory()
+
+        # Если во время расчета кеш инвалидировали, значение могло быть
+        # посчитано по старым данным - отдаем его, но не сохраняем.
+        async with self._redis.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(version_key)
+                if await pipe.get(version_key) != version:
+                    await pipe.unwatch()
+                    return value
+
+                pipe.multi()
+                pipe.set(key, value, ex=ttl + stale_ttl)
+                pipe.set(CACHE_FRESH_KEY.format(key=key), 1, ex=ttl)
+                await pipe.execute()
+            except WatchError:
+                pass
+
+        return value
+
+    @staticmethod
+    def _to_bytes(data: bytes | str) -> bytes:
+        return data.encode() if isinstance(data, str) else data
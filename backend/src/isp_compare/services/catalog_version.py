@@ -0,0 +1,31 @@
+from time import time_ns
+
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+
+CATALOG_VERSION_KEY = "catalog:version"
+
+
+class CatalogVersion:
+    def __init__(self, redis_client: Redis) -> None:
+        self._redis = redis_client
+
+    async def get(self) -> str:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            self._ensure_initialized(pipe)
+            pipe.get(CATALOG_VERSION_KEY)
+            _, version = await pipe.execute()
+
+        return version.decode() if isinstance(version, bytes) else str(version)
+
+    async def bump(self) -> None:
+        async with self._redis.pipeline(transaction=True) as pipe:
+            self._ensure_initialized(pipe)
+            pipe.incr(CATALOG_VERSION_KEY)
+            await pipe.execute()
+
+    @staticmethod
+    def _ensure_initialized(pipe: Pipeline) -> None:
+        # Версия стартует с текущего времени: после сброса Redis она
+        # не совпадет с ETag, которые уже сохранены у клиентов и в nginx.
+        pipe.set(CATALOG_VERSION_KEY, time_ns(), nx=True)
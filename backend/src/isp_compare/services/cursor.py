@@ -0,0 +1,26 @@
+import base64
+import binascii
+from datetime import datetime
+from uuid import UUID
+
+from isp_compare.core.exceptions import InvalidCursorException
+
+
+def encode_cursor(created_at: datetime, item_id: UUID) -> str:
+    raw = f"{created_at.isoformat()}|{item_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, item_id = raw.split("|")
+        created_at_value = datetime.fromisoformat(created_at)
+        item_id_value = UUID(item_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorException from e
+
+    if created_at_value.tzinfo is None:
+        raise InvalidCursorException
+
+    return created_at_value, item_id_value
@@ -0,0 +1,94 @@
+import asyncio
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from isp_compare.core.config import PostgresConfig, ServerConfig
+from isp_compare.core.db_pool import MonitoredQueuePool
+from isp_compare.core.db_routing import ReplicaEngines
+from isp_compare.schemas.database import PoolStatsResponse
+
+logger = logging.getLogger(__name__)
+
+CAPACITY_CHECK_TIMEOUT_SECONDS = 5
+
+
+class DatabasePoolMonitor:
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        replica_engines: ReplicaEngines,
+        postgres_config: PostgresConfig,
+        server_config: ServerConfig,
+    ) -> None:
+        self._engines = {"primary": engine}
+        for replica in replica_engines:
+            self._engines[f"replica:{replica.url.host}:{replica.url.port}"] = replica
+        self._postgres_config = postgres_config
+        self._server_config = server_config
+
+    @property
+    def required_connections(self) -> int:
+        return (
+            self._server_config.workers * self._postgres_config.connections_per_worker
+        )
+
+    def get_stats(self) -> list[PoolStatsResponse]:
+        stats = []
+        for name, engine in self._engines.items():
+            pool = engine.pool
+            if not isinstance(pool, MonitoredQueuePool):
+                continue
+
+            stats.append(
+                PoolStatsResponse(
+                    name=name,
+                    size=pool.size(),
+                    checked_out=pool.checkedout(),
+                    overflow=max(pool.overflow(), 0),
+                    max_connections=self._postgres_config.connections_per_worker,
+                    waits=pool.wait_stats.waits,
+                    wait_time_total=pool.wait_stats.total_seconds,
+                    wait_time_max=pool.wait_stats.max_seconds,
+                )
+            )
+        return stats
+
+    async def check_capacity(self) -> bool:
+        # Все воркеры вместе не должны открыть больше соединений,
+        # чем сервер готов принять от обычных пользователей
+        if self._postgres_config.transaction_pooling:
+            # Серверными соединениями управляет PgBouncer
+            return True
+
+        fits = True
+        for name, engine in self._engines.items():
+            # Недоступная реплика не должна мешать запуску приложения
+            try:
+                available = await self._get_available_connections(engine)
+            except (OSError, SQLAlchemyError) as e:
+                logger.warning(f"Could not check connection limit of {name}: {e!s}")
+                continue
+
+            if self.required_connections > available:
+                fits = False
+                logger.warning(
+                    f"Connection pools of {self._server_config.workers} workers "
+                    f"need up to {self.required_connections} connections, "
+                    f"but {name} accepts only {available}"
+                )
+        return fits
+
+    @staticmethod
+    async def _get_available_connections(engine: AsyncEngine) -> int:
+        async with (
+            asyncio.timeout(CAPACITY_CHECK_TIMEOUT_SECONDS),
+            engine.connect() as conn,
+        ):
+            max_connections = int(await conn.scalar(text("SHOW max_connections")))
+            reserved = int(
+                await conn.scalar(text("SHOW superuser_reserved_connections"))
+            )
+        return max_connections - reserved
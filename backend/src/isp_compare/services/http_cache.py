@@ -0,0 +1,41 @@
+from fastapi import Request
+
+from isp_compare.core.config import HttpCacheConfig
+from isp_compare.core.exceptions import NotModifiedException
+from isp_compare.services.catalog_version import CatalogVersion
+
+
+class HttpCache:
+    def __init__(
+        self,
+        request: Request,
+        catalog_version: CatalogVersion,
+        config: HttpCacheConfig,
+    ) -> None:
+        self._request = request
+        self._catalog_version = catalog_version
+        self._config = config
+
+    async def check_catalog(self) -> dict[str, str]:
+        version = await self._catalog_version.get()
+        headers = {
+            "ETag": f'"catalog-{version}"',
+            "Cache-Control": self._config.catalog_cache_control,
+        }
+
+        if self._is_not_modified(headers["ETag"]):
+            raise NotModifiedException(headers=headers)
+
+        return headers
+
+    def _is_not_modified(self, etag: str) -> bool:
+        if_none_match = self._request.headers.get("If-None-Match")
+        if not if_none_match:
+            return False
+
+        # nginx со сжатием ослабляет ETag до W/"...", для If-None-Match
+        # достаточно слабого сравнения
+        candidates = {
+            value.strip().removeprefix("W/") for value in if_none_match.split(",")
+        }
+        return "*" in candidates or etag in candidates
@@ -0,0 +1,185 @@
+import asyncio
+import contextlib
+import json
+import logging
+import secrets
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
+
+from dishka import AsyncContainer
+from redis.asyncio import Redis
+
+from isp_compare.core.config import ParserConfig
+from isp_compare.parsers import PARSERS
+from isp_compare.services.parser_service import ParserService
+from isp_compare.services.redis_lock import RedisLock
+
+logger = logging.getLogger(__name__)
+
+PARSER_LOCK_KEY = "parser:lock"
+PARSER_QUEUE_KEY = "parser:queue"
+PARSER_NEXT_RUN_KEY = "parser:next_run:{provider_name}"
+
+
+class ParserScheduler:
+    def __init__(
+        self,
+        container: AsyncContainer,
+        redis_client: Redis,
+        config: ParserConfig,
+    ) -> None:
+        self._container = container
+        self._redis = redis_client
+        self._config = config
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def supported_providers(self) -> list[str]:
+        return list(PARSERS)
+
+    async def enqueue(self, provider_names: list[str]) -> UUID:
+        job_id = uuid4()
+        await self._push_job(job_id, provider_names)
+        logger.info(f"Parser job {job_id} enqueued for {', '.join(provider_names)}")
+        return job_id
+
+    def start(self) -> None:
+        self._tasks.append(asyncio.create_task(self._consume_queue()))
+        if self._config.scheduler_enabled:
+            self._tasks.append(asyncio.create_task(self._run_periodically()))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+
+        for task in self._tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+        self._tasks.clear()
+
+    async def process_next_job(self) -> bool:
+        item = await self._redis.blpop(
+            [PARSER_QUEUE_KEY], timeout=self._config.poll_interval_seconds
+        )
+        if not item:
+            return False
+
+        _, payload = item
+        job = json.loads(payload)
+        if not await self.run_job(UUID(job["job_id"]), job["providers"]):
+            # Задача вернулась в очередь; пауза, чтобы не выбирать ее
+            # снова, пока парсеры заняты другим воркером
+            await asyncio.sleep(self._config.poll_interval_seconds)
+        return True
+
+    async def run_due_providers(self) -> list[str]:
+        lock = self._create_lock()
+        if not await lock.acquire():
+            return []
+
+        executed = []
+        async with self._holding(lock):
+            # Проверяем срок под блокировкой: другой воркер мог только что
+            # завершить тот же парсер и сдвинуть время следующего запуска.
+            for provider_name in PARSERS:
+                if await self._is_due(provider_name):
+                    await self._run_provider(uuid4(), provider_name)
+                    executed.append(provider_name)
+
+        return executed
+
+    async def run_job(self, job_id: UUID, provider_names: list[str]) -> bool:
+        lock = self._create_lock()
+        if not await lock.acquire():
+            # Задача уже снята с очереди, а администратор получил ее job_id:
+            # не ждем блокировку, а возвращаем задачу в очередь
+            await self._push_job(job_id, provider_names)
+            logger.info(f"Parser job {job_id} requeued: parsers are busy")
+            return False
+
+        async with self._holding(lock):
+            for provider_name in provider_names:
+                await self._run_provider(job_id, provider_name)
+
+        return True
+
+    @contextlib.asynccontextmanager
+    async def _holding(self, lock: RedisLock) -> AsyncIterator[None]:
+        # Парсинг всех провайдеров может длиться дольше таймаута блокировки:
+        # продлеваем ее, пока идет запуск, а TTL остается страховкой от
+        # упавшего воркера
+        renewal = asyncio.create_task(self._renew_lock(lock))
+        try:
+            yield
+        finally:
+            renewal.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await renewal
+            await lock.release()
+
+    async def _renew_lock(self, lock: RedisLock) -> None:
+        while True:
+            await asyncio.sleep(self._config.lock_timeout_seconds / 3)
+            if not await lock.extend():
+                logger.warning("Parser lock lost before the run finished")
+                return
+
+    async def _push_job(self, job_id: UUID, provider_names: list[str]) -> None:
+        job = {"job_id": str(job_id), "providers": provider_names}
+        await self._redis.rpush(PARSER_QUEUE_KEY, json.dumps(job))
+
+    async def _run_provider(self, job_id: UUID, provider_name: str) -> None:
+        try:
+            async with self._container() as request_container:
+                service = await request_container.get(ParserService)
+                count = await service.update_provider_tariffs(provider_name, job_id)
+        except Exception as e:
+            logger.exception(f"Parser job {job_id} failed for {provider_name}: {e!s}")
+        else:
+            logger.info(f"Parser job {job_id}: {count} tariffs for {provider_name}")
+
+        await self._schedule_next_run(provider_name)
+
+    async def _run_periodically(self) -> None:
+        while True:
+            try:
+                await self.run_due_providers()
+            except Exception as e:
+                logger.exception(f"Parser scheduler iteration failed: {e!s}")
+
+            await asyncio.sleep(self._config.poll_interval_seconds)
+
+    async def _consume_queue(self) -> None:
+        while True:
+            try:
+                await self.process_next_job()
+            except Exception as e:
+                logger.exception(f"Parser queue iteration failed: {e!s}")
+                await asyncio.sleep(self._config.poll_interval_seconds)
+
+    async def _is_due(self, provider_name: str) -> bool:
+        key = PARSER_NEXT_RUN_KEY.format(provider_name=provider_name)
+        now = int(datetime.now(UTC).timestamp())
+
+        # Первый воркер, увидевший провайдера, назначает ему время запуска
+        # со случайным смещением, чтобы после деплоя парсеры не стартовали разом.
+        await self._redis.set(key, now + self._jitter(), nx=True)
+
+        next_run = await self._redis.get(key)
+        return next_run is not None and int(next_run) <= now
+
+    async def _schedule_next_run(self, provider_name: str) -> None:
+        key = PARSER_NEXT_RUN_KEY.format(provider_name=provider_name)
+        now = int(datetime.now(UTC).timestamp())
+        interval = self._config.get_interval_seconds(provider_name)
+        await self._redis.set(key, now + interval + self._jitter())
+
+    def _create_lock(self) -> RedisLock:
+        return RedisLock(
+            self._redis, PARSER_LOCK_KEY, timeout=self._config.lock_timeout_seconds
+        )
+
+    def _jitter(self) -> int:
+        return secrets.randbelow(self._config.jitter_seconds + 1)
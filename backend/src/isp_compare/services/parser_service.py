@@ -1,18 +1,22 @@
+import asyncio
 import logging
-from typing import TYPE_CHECKING
-
-from isp_compare.models.tariff import Tariff
-from isp_compare.parsers.beeline import BeelineParser
-from isp_compare.parsers.domru import DomruParser
-from isp_compare.parsers.rostelecom import RostelecomParser
+from datetime import UTC, datetime
+from time import perf_counter
+from typing import Any
+from uuid import UUID, uuid4
+
+from isp_compare.core.config import ParserConfig
+from isp_compare.core.exceptions import ProviderNotFoundException
+from isp_compare.models.parser_run import ParserRun, ParserRunStatus
+from isp_compare.parsers import PARSERS
+from isp_compare.parsers.base import BaseParser
+from isp_compare.repositories.parser_run import ParserRunRepository
 from isp_compare.repositories.provider import ProviderRepository
 from isp_compare.repositories.tariff import TariffRepository
-from isp_compare.schemas.tariff import TariffCreate
+from isp_compare.schemas.parser import ParserRunResponse
+from isp_compare.services.catalog_version import CatalogVersion
 from isp_compare.services.transaction_manager import TransactionManager
 
-if TYPE_CHECKING:
-    from isp_compare.parsers.base import BaseParser
-
 logger = logging.getLogger(__name__)
 
 
@@ -21,76 +25,181 @@ class ParserService:
         self,
         provider_repository: ProviderRepository,
         tariff_repository: TariffRepository,
+        parser_run_repository: ParserRunRepository,
         transaction_manager: TransactionManager,
+        config: ParserConfig,
+        catalog_version: CatalogVersion,
     ) -> None:
         self._provider_repository = provider_repository
         self._tariff_repository = tariff_repository
+        self._parser_run_repository = parser_run_repository
         self._transaction_manager = transaction_manager
+        self._config = config
+        self._catalog_version = catalog_version
 
-        self._parsers: dict[str, type[BaseParser]] = {
-            "Ростелеком": RostelecomParser,
-            "Дом.ру": DomruParser,
-            "Билайн": BeelineParser,
-        }
+        self._parsers = PARSERS
 
-    async def parse_provider_tariffs(self, provider_name: str) -> list[TariffCreate]:
+    async def update_provider_tariffs(
+        self, provider_name: str, job_id: UUID | None = None
+    ) -> int:
         if provider_name not in self._parsers:
             logger.error(f"Parser for provider '{provider_name}' not found")
-            return []
-
-        parser_class = self._parsers[provider_name]
-        parser = parser_class()
-
-        try:
-            providers_with_counts = await self._provider_repository.get_all()
-            for provider, _ in providers_with_counts:
-                if provider.name == provider_name:
-                    parser.provider_id = provider.id
-                    break
-
-            if not parser.provider_id:
-                logger.error(f"Provider '{provider_name}' not found in database")
-                return []
-
-            tariffs = await parser.parse_tariffs()
-            logger.info(
-                f"Successfully parsed {len(tariffs)} tariffs for {provider_name}"
-            )
-
-        except Exception as e:
-            logger.exception(f"Error parsing tariffs for {provider_name}: {e!s}")
-            return []
-        else:
-            return tariffs
-
-    async def update_provider_tariffs(self, provider_name: str) -> int:
-        tariffs = await self.parse_provider_tariffs(provider_name)
-        if not tariffs:
             return 0
 
         parser = self._parsers[provider_name]()
-        provider_id = parser.provider_id
 
-        count = 0
-        for tariff_data in tariffs:
-            try:
-                tariff = Tariff(**tariff_data.model_dump(), provider_id=provider_id)
-                await self._tariff_repository.create(tariff)
-                count += 1
+        parser_run = ParserRun(
+            job_id=job_id or uuid4(),
+            provider_name=provider_name,
+            status=ParserRunStatus.RUNNING,
+            started_at=datetime.now(UTC),
+        )
+        await self._parser_run_repository.create(parser_run)
+        await self._transaction_manager.commit()
+        parser_run_id = parser_run.id
 
-            except Exception as e:
-                logger.exception(f"Error saving tariff {tariff_data.name}: {e!s}")
-                continue
+        stats: dict[str, Any] = {}
+        try:
+            count = await self._run_parser(parser, stats)
+        except Exception as e:
+            logger.exception(f"Error updating tariffs for {provider_name}: {e!s}")
+            await self._transaction_manager.rollback()
+            stats["status"] = ParserRunStatus.FAILED
+            stats["error"] = str(e)
+            count = 0
+        else:
+            stats["status"] = ParserRunStatus.SUCCESS
+            logger.info(f"Updated {count} tariffs for {provider_name}")
+            await self._catalog_version.bump()
 
+        stats["provider_id"] = parser.provider_id
+        stats["finished_at"] = datetime.now(UTC)
+        await self._parser_run_repository.update(parser_run_id, stats)
         await self._transaction_manager.commit()
-        logger.info(f"Updated {count} tariffs for {provider_name}")
+
         return count
 
     async def update_all_tariffs(self) -> dict[str, int]:
+        job_id = uuid4()
         results = {}
 
         for provider_name in self._parsers:
-            count = await self.update_provider_tariffs(provider_name)
+            count = await self.update_provider_tariffs(provider_name, job_id)
             results[provider_name] = count
 
         return results
+
+    async def get_parser_runs(
+        self,
+        limit: int,
+        offset: int,
+        provider_name: str | None = None,
+        job_id: UUID | None = None,
+    ) -> list[ParserRunResponse]:
+        parser_runs = await self._parser_run_repository.get_list(
+            limit=limit,
+            offset=offset,
+            provider_name=provider_name,
+            job_id=job_id,
+        )
+        return [ParserRunResponse.model_validate(run) for run in parser_runs]
+
+    async def _run_parser(self, parser: BaseParser, stats: dict[str, Any]) -> int:
+        started_at = perf_counter()
+        provider = await self._provider_repository.get_by_name(parser.provider_name)
+        stats["db_time"] = perf_counter() - started_at
+
+        if not provider:
+            raise ProviderNotFoundException(
+                detail=f"Provider '{parser.provider_name}' not found in database"
+            )
+
+        parser.provider_id = provider.id
+
+        started_at = perf_counter()
+        html = await parser.fetch()
+        stats["http_time"] = perf_counter() - started_at
+
+        # Текущие тарифы провайдера заменяются результатом разбора в той же
+        # транзакции: совпадающие по названию обновляются на месте (id не
+        # меняется), новые добавляются, пропавшие с сайта деактивируются
+        current = {
+            tariff["name"]: tariff
+            for tariff in await self._tariff_repository.get_active_by_provider(
+                provider.id
+            )
+        }
+        seen: set[str] = set()
+        added = changed = 0
+
+        stats["parse_time"] = 0.0
+        stats["items_count"] = 0
+        inserts: list[dict[str, Any]] = []
+        updates: list[dict[str, Any]] = []
+        pending: asyncio.Task[float] | None = None
+
+        tariffs = parser.parse(html)
+        try:
+            while True:
+                started_at = perf_counter()
+                tariff_data = await anext(tariffs, None)
+                stats["parse_time"] += perf_counter() - started_at
+                if tariff_data is None:
+                    break
+
+                stats["items_count"] += 1
+                data = {**tariff_data.model_dump(), "provider_id": provider.id}
+                if data["name"] in seen:
+                    continue
+                seen.add(data["name"])
+
+                existing = current.get(data["name"])
+                if existing is None:
+                    inserts.append(data)
+                    added += 1
+                elif any(existing.get(key) != value for key, value in data.items()):
+                    updates.append({**data, "id": existing["id"]})
+                    changed += 1
+
+                if len(inserts) + len(updates) < self._config.batch_size:
+                    continue
+
+                # Пока пачка пишется в БД, парсер разбирает следующие карточки;
+                # перед новой записью дожидаемся предыдущей - сессия одна.
+                if pending:
+                    stats["db_time"] += await pending
+                pending = asyncio.create_task(self._save_batch(inserts, updates))
+                inserts = []
+                updates = []
+        finally:
+            if pending:
+                stats["db_time"] += await pending
+
+        if not seen:
+            # Пустой разбор - скорее всего сменилась верстка сайта, а не
+            # провайдер убрал все тарифы: каталог не трогаем
+            raise ValueError(f"No tariffs parsed for '{parser.provider_name}'")
+
+        stats["db_time"] += await self._save_batch(inserts, updates)
+
+        removed = [tariff["id"] for name, tariff in current.items() if name not in seen]
+        started_at = perf_counter()
+        await self._tariff_repository.deactivate_many(removed)
+        await self._transaction_manager.commit()
+        stats["db_time"] += perf_counter() - started_at
+        stats["errors_count"] = parser.errors_count
+        stats["changes_count"] = added + changed + len(removed)
+
+        logger.info(
+            f"Tariff changes for {parser.provider_name}: {added} added, "
+            f"{changed} changed, {len(removed)} removed"
+        )
+        return len(seen)
+
+    async def _save_batch(
+        self, inserts: list[dict[str, Any]], updates: list[dict[str, Any]]
+    ) -> float:
+        started_at = perf_counter()
+        await self._tariff_repository.create_many(inserts)
+        await self._tariff_repository.update_many(updates)
+        return perf_counter() - started_at
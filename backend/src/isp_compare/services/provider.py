@@ -1,72 +1,91 @@
-import json
 from uuid import UUID
 
-from redis.asyncio import Redis
+from pydantic import TypeAdapter
 
 from isp_compare.core.exceptions import ProviderNotFoundException
 from isp_compare.repositories.provider import ProviderRepository
 from isp_compare.schemas.provider import (
     ProviderResponse,
 )
+from isp_compare.services.cache import RedisCache
+from isp_compare.services.catalog_version import CatalogVersion
+from isp_compare.services.transaction_manager import TransactionManager
+
+ALL_PROVIDERS_CACHE_KEY = "all_providers"
+PROVIDER_CACHE_KEY = "provider:{provider_id}"
+ALL_PROVIDERS_CACHE_TTL = 30 * 60
+# После истечения TTL список еще столько отдается как есть, пока один
+# запрос пересчитывает его; остальные не ждут и не нагружают БД.
+ALL_PROVIDERS_CACHE_STALE_TTL = 10 * 60
+
+provider_adapter = TypeAdapter(ProviderResponse)
+providers_adapter = TypeAdapter(list[ProviderResponse])
 
 
 class ProviderService:
     def __init__(
         self,
         provider_repository: ProviderRepository,
-        redis_client: Redis,
+        cache: RedisCache,
+        transaction_manager: TransactionManager,
+        catalog_version: CatalogVersion,
     ) -> None:
         self._provider_repository = provider_repository
-        self._redis_client = redis_client
+        self._cache = cache
+        self._transaction_manager = transaction_manager
+        self._catalog_version = catalog_version
 
     async def get_provider(self, provider_id: UUID) -> ProviderResponse:
-        result = await self._provider_repository.get_by_id(provider_id)
+        return await self._cache.get_or_set(
+            PROVIDER_CACHE_KEY.format(provider_id=provider_id),
+            lambda: self._load_provider(provider_id),
+            provider_adapter,
+            ttl=ALL_PROVIDERS_CACHE_TTL,
+            stale_ttl=ALL_PROVIDERS_CACHE_STALE_TTL,
+        )
 
-        if not result:
-            raise ProviderNotFoundException
+    async def get_all_providers_json(self) -> bytes:
+        # Кеш хранит готовое тело ответа: при попадании не нужно ни
+        # собирать модели, ни заново сериализовать их в JSON.
+        return await self._cache.get_or_set_raw(
+            ALL_PROVIDERS_CACHE_KEY,
+            self._serialize_all_providers,
+            ttl=ALL_PROVIDERS_CACHE_TTL,
+            stale_ttl=ALL_PROVIDERS_CACHE_STALE_TTL,
+        )
+
+    async def recalculate_review_stats(self) -> int:
+        updated = await self._provider_repository.recalculate_review_stats()
+        await self._transaction_manager.commit()
 
-        provider, reviews_count = result
-        return ProviderResponse(
-            id=provider.id,
-            name=provider.name,
-            description=provider.description,
-            website=provider.website,
-            phone=provider.phone,
-            logo_url=provider.logo_url,
-            rating=provider.rating,
-            reviews_count=reviews_count,
+        providers = await self._provider_repository.get_all()
+        await self._cache.invalidate(
+            ALL_PROVIDERS_CACHE_KEY,
+            *(
+                PROVIDER_CACHE_KEY.format(provider_id=provider.id)
+                for provider in providers
+            ),
         )
+        await self._catalog_version.bump()
+        return updated
 
-    async def get_all_providers(self) -> list[ProviderResponse]:
-        cache_key = "all_providers"
+    async def _load_provider(self, provider_id: UUID) -> ProviderResponse:
+        # Свежий общий список уже содержит нужного провайдера
+        providers = await self._cache.get(ALL_PROVIDERS_CACHE_KEY, providers_adapter)
+        for provider in providers or []:
+            if provider.id == provider_id:
+                return provider
 
-        cached_data = await self._redis_client.get(cache_key)
-        if cached_data:
-            try:
-                providers_data = json.loads(cached_data)
-                return [ProviderResponse(**provider) for provider in providers_data]
-            except (json.JSONDecodeError, TypeError, KeyError):
-                pass
-        providers_with_counts = await self._provider_repository.get_all()
+        provider = await self._provider_repository.get_by_id(provider_id)
+        await self._transaction_manager.release()
+        if not provider:
+            raise ProviderNotFoundException
 
-        providers_response = [
-            ProviderResponse(
-                id=provider.id,
-                name=provider.name,
-                description=provider.description,
-                website=provider.website,
-                phone=provider.phone,
-                logo_url=provider.logo_url,
-                rating=provider.rating,
-                reviews_count=reviews_count,
-            )
-            for provider, reviews_count in providers_with_counts
-        ]
+        return ProviderResponse.model_validate(provider)
 
-        serialized_data = json.dumps(
-            [provider.model_dump() for provider in providers_response],
-            default=str,
+    async def _serialize_all_providers(self) -> bytes:
+        providers = await self._provider_repository.get_all()
+        await self._transaction_manager.release()
+        return providers_adapter.dump_json(
+            [ProviderResponse.model_validate(provider) for provider in providers]
         )
-        await self._redis_client.set(cache_key, serialized_data, ex=1800)
-
-        return providers_response
@@ -12,54 +12,30 @@ class RateLimiter:
         self, key: str, max_attempts: int, window_minutes: int
     ) -> tuple[bool, int]:
         window_seconds = window_minutes * 60
-        current_time = int(datetime.now(UTC).timestamp())
-        window_start_time = current_time - window_seconds
-
-        await self._redis.zremrangebyscore(key, 0, window_start_time)
-        attempt_count = await self._redis.zcard(key)
+        attempt_count = await self._count_attempts(key, window_seconds)
         if attempt_count >= max_attempts:
-            remaining_attempts = 0
-            is_allowed = False
-        else:
-            member = str(uuid4())
-            await self._redis.zadd(key, {member: current_time})
-            attempt_count += 1
+            return False, 0
 
-            is_allowed = attempt_count <= max_attempts
-            remaining_attempts = max(0, max_attempts - attempt_count)
+        await self._add_attempt(key, window_seconds)
+        attempt_count += 1
 
-        await self._redis.expire(key, window_seconds)
+        is_allowed = attempt_count <= max_attempts
+        remaining_attempts = max(0, max_attempts - attempt_count)
         return is_allowed, remaining_attempts
 
     async def add_failed_attempt(self, key: str, window_minutes: int) -> None:
-        current_time = int(datetime.now(UTC).timestamp())
-        window_seconds = window_minutes * 60
-
-        member = str(uuid4())
-        await self._redis.zadd(key, {member: current_time})
-        await self._redis.expire(key, window_seconds)
+        await self._add_attempt(key, window_minutes * 60)
 
     async def check_failed_login_limit(
         self, username: str, ip_address: str
     ) -> tuple[bool, int]:
         key = f"failed_login_limit:{username}:{ip_address}"
-        window_seconds = 5 * 60
-        current_time = int(datetime.now(UTC).timestamp())
-        window_start_time = current_time - window_seconds
-
-        await self._redis.zremrangebyscore(key, 0, window_start_time)
-        attempt_count = await self._redis.zcard(key)
+        attempt_count = await self._count_attempts(key, 5 * 60)
 
         max_attempts = 10
         if attempt_count >= max_attempts:
-            remaining_attempts = 0
-            is_allowed = False
-        else:
-            remaining_attempts = max_attempts - attempt_count
-            is_allowed = True
-
-        await self._redis.expire(key, window_seconds)
-        return is_allowed, remaining_attempts
+            return False, 0
+        return True, max_attempts - attempt_count
 
     async def add_failed_login_attempt(self, username: str, ip_address: str) -> None:
         key = f"failed_login_limit:{username}:{ip_address}"
@@ -67,23 +43,12 @@ class RateLimiter:
 
     async def check_password_change_limit(self, user_id: UUID) -> tuple[bool, int]:
         key = f"failed_password_change_limit:{user_id}"
-        window_seconds = 24 * 60 * 60
-        current_time = int(datetime.now(UTC).timestamp())
-        window_start_time = current_time - window_seconds
-
-        await self._redis.zremrangebyscore(key, 0, window_start_time)
-        attempt_count = await self._redis.zcard(key)
+        attempt_count = await self._count_attempts(key, 24 * 60 * 60)
 
         max_attempts = 10
         if attempt_count >= max_attempts:
-            remaining_attempts = 0
-            is_allowed = False
-        else:
-            remaining_attempts = max_attempts - attempt_count
-            is_allowed = True
-
-        await self._redis.expire(key, window_seconds)
-        return is_allowed, remaining_attempts
+            return False, 0
+        return True, max_attempts - attempt_count
 
     async def add_password_change_attempt(self, user_id: UUID) -> None:
         key = f"failed_password_change_limit:{user_id}"
@@ -96,3 +61,20 @@ class RateLimiter:
     async def username_change_rate_limit(self, user_id: UUID) -> tuple[bool, int]:
         key = f"username_change_limit:{user_id}"
         return await self.check_rate_limit(key, 10, 60)
+
+    async def _count_attempts(self, key: str, window_seconds: int) -> int:
+        # Очистка окна, подсчет и продление ключа уходят в Redis одним запросом
+        window_start_time = int(datetime.now(UTC).timestamp()) - window_seconds
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.zremrangebyscore(key, 0, window_start_time)
+            pipe.zcard(key)
+            pipe.expire(key, window_seconds)
+            _, attempt_count, _ = await pipe.execute()
+        return attempt_count
+
+    async def _add_attempt(self, key: str, window_seconds: int) -> None:
+        current_time = int(datetime.now(UTC).timestamp())
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.zadd(key, {str(uuid4()): current_time})
+            pipe.expire(key, window_seconds)
+            await pipe.execute()
@@ -0,0 +1,71 @@
+import asyncio
+from collections.abc import Callable
+from time import monotonic
+from uuid import uuid4
+
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+from redis.exceptions import WatchError
+
+
+class RedisLock:
+    def __init__(self, redis_client: Redis, key: str, timeout: int) -> None:
+        self._redis = redis_client
+        self._key = key
+        self._timeout = timeout
+        self._token: str | None = None
+
+    async def acquire(
+        self, blocking_timeout: float = 0, retry_interval: float = 0.5
+    ) -> bool:
+        token = str(uuid4())
+        deadline = monotonic() + blocking_timeout
+
+        while True:
+            if await self._redis.set(self._key, token, nx=True, ex=self._timeout):
+                self._token = token
+                return True
+
+            if monotonic() >= deadline:
+                return False
+
+            await asyncio.sleep(retry_interval)
+
+    async def extend(self) -> bool:
+        if self._token is None:
+            return False
+
+        return await self._run_if_owned(
+            self._token, lambda pipe: pipe.expire(self._key, self._timeout)
+        )
+
+    async def release(self) -> None:
+        if self._token is None:
+            return
+
+        token, self._token = self._token, None
+        await self._run_if_owned(token, lambda pipe: pipe.delete(self._key))
+
+    async def _run_if_owned(
+        self, token: str, command: Callable[[Pipeline], object]
+    ) -> bool:
+        # Меняем ключ только если он все еще принадлежит нам: по истечении
+        # таймаута блокировку мог захватить другой воркер.
+        async with self._redis.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(self._key)
+                value = await pipe.get(self._key)
+                if isinstance(value, bytes):
+                    value = value.decode()
+
+                if value != token:
+                    await pipe.unwatch()
+                    return False
+
+                pipe.multi()
+                command(pipe)
+                await pipe.execute()
+            except WatchError:
+                return False
+
+        return True
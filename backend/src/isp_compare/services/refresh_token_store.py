@@ -0,0 +1,289 @@
+from abc import ABC, abstractmethod
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from redis.asyncio import Redis
+
+from isp_compare.core.config import RefreshTokenConfig
+from isp_compare.core.exceptions import (
+    InvalidTokenException,
+    TokenExpiredException,
+    TokenRevokedException,
+)
+from isp_compare.models.token import RefreshToken
+from isp_compare.repositories.token import RefreshTokenRepository
+from isp_compare.services.transaction_manager import TransactionManager
+
+# Ключи токена и поколения пользователя в одном hash tag {user_id}, поэтому
+# скрипты работают только с объявленными в KEYS ключами одного слота
+# (Redis Cluster, прокси с маршрутизацией по ключу). Владелец токена
+# хранится отдельно: по нему находим user_id до запуска скрипта.
+REFRESH_TOKEN_KEY = "refresh_token:{{{user_id}}}:{token_hash}"  # noqa: S105
+REFRESH_TOKEN_GENERATION_KEY = "refresh_token_generation:{{{user_id}}}"  # noqa: S105
+REFRESH_TOKEN_OWNER_KEY = "refresh_token_owner:{token_hash}"  # noqa: S105
+
+# Общая часть скриптов. Токен действителен, пока его поколение совпадает с
+# поколением пользователя: отзыв всех токенов - INCR поколения.
+# Отозванный по одному токен живет еще retention мс, чтобы распознать его
+# повторное использование, но не дольше собственного срока.
+_COMMON_LUA = """
+local function revoke(key, retention)
+    if redis.call('HGET', key, 'revoked') == '0' then
+        redis.call('HSET', key, 'revoked', '1')
+        local ttl = redis.call('PTTL', key)
+        if ttl < 0 or ttl > retention then
+            redis.call('PEXPIRE', key, retention)
+        end
+    end
+end
+
+local function extend(generation_key, ttl)
+    if redis.call('PTTL', generation_key) < ttl then
+        redis.call('PEXPIRE', generation_key, ttl)
+    end
+end
+
+local function revoke_all(generation_key, ttl)
+    redis.call('INCR', generation_key)
+    extend(generation_key, ttl)
+end
+
+local function current_generation(generation_key)
+    return tonumber(redis.call('GET', generation_key) or '0')
+end
+
+local function add(key, generation_key, generation, ttl)
+    redis.call('HSET', key, 'generation', generation, 'revoked', '0')
+    redis.call('PEXPIRE', key, ttl)
+    extend(generation_key, ttl)
+end
+"""
+
+# KEYS: новый токен, поколение пользователя; ARGV: ttl, отозвать ли
+# остальные токены пользователя
+_CREATE_LUA = (
+    _COMMON_LUA
+    + """
+local ttl = tonumber(ARGV[1])
+if ARGV[2] == '1' then
+    revoke_all(KEYS[2], ttl)
+end
+add(KEYS[1], KEYS[2], current_generation(KEYS[2]), ttl)
+"""
+)
+
+# KEYS: текущий и новый токен, поколение пользователя; ARGV: ttl, retention.
+# Возвращает 0 - токена нет (или истек), 1 - ротация выполнена,
+# 2 - повторное использование отозванного токена
+_ROTATE_LUA = (
+    _COMMON_LUA
+    + """
+local token = redis.call('HMGET', KEYS[1], 'generation', 'revoked')
+if not token[1] then
+    return 0
+end
+
+local ttl = tonumber(ARGV[1])
+local generation = current_generation(KEYS[3])
+if token[2] == '1' or tonumber(token[1]) ~= generation then
+    revoke_all(KEYS[3], ttl)
+    return 2
+end
+
+revoke(KEYS[1], tonumber(ARGV[2]))
+add(KEYS[2], KEYS[3], generation, ttl)
+return 1
+"""
+)
+
+_REVOKE_ONE_LUA = (
+    _COMMON_LUA
+    + """
+revoke(KEYS[1], tonumber(ARGV[1]))
+"""
+)
+
+ROTATE_OK = 1
+ROTATE_REUSED = 2
+
+
+class RefreshTokenStore(ABC):
+    @abstractmethod
+    async def create(
+        self,
+        user_id: UUID,
+        token_hash: bytes,
+        expires_at: datetime,
+        revoke_existing: bool = True,
+    ) -> None: ...
+
+    @abstractmethod
+    async def rotate(
+        self, token_hash: bytes, new_token_hash: bytes, expires_at: datetime
+    ) -> UUID: ...
+
+    @abstractmethod
+    async def revoke(self, token_hash: bytes) -> None: ...
+
+
+class SqlRefreshTokenStore(RefreshTokenStore):
+    def __init__(
+        self,
+        refresh_token_repository: RefreshTokenRepository,
+        transaction_manager: TransactionManager,
+    ) -> None:
+        self._refresh_token_repository = refresh_token_repository
+        self._transaction_manager = transaction_manager
+
+    async def create(
+        self,
+        user_id: UUID,
+        token_hash: bytes,
+        expires_at: datetime,
+        revoke_existing: bool = True,
+    ) -> None:
+        if revoke_existing:
+            await self._refresh_token_repository.create_revoking_others(
+                user_id, token_hash, expires_at
+            )
+        else:
+            refresh_token = RefreshToken(
+                token_hash=token_hash,
+                user_id=user_id,
+                expires_at=expires_at,
+            )
+            await self._refresh_token_repository.create(refresh_token)
+        await self._transaction_manager.commit()
+
+    async def rotate(
+        self, token_hash: bytes, new_token_hash: bytes, expires_at: datetime
+    ) -> UUID:
+        refresh_token = await self._refresh_token_repository.get_by_token_hash(
+            token_hash
+        )
+
+        if not refresh_token:
+            raise InvalidTokenException
+
+        now = datetime.now(UTC)
+        if refresh_token.expires_at < now:
+            raise TokenExpiredException
+
+        if refresh_token.revoked:
+            await self._refresh_token_repository.revoke_all_for_user(
+                refresh_token.user_id
+            )
+            await self._transaction_manager.commit()
+
+            raise TokenRevokedException
+
+        await self._refresh_token_repository.revoke(token_hash)
+
+        new_refresh_token = RefreshToken(
+            token_hash=new_token_hash,
+            user_id=refresh_token.user_id,
+            expires_at=expires_at,
+        )
+        await self._refresh_token_repository.create(new_refresh_token)
+
+        await self._transaction_manager.commit()
+
+        return refresh_token.user_id
+
+    async def revoke(self, token_hash: bytes) -> None:
+        await self._refresh_token_repository.revoke(token_hash)
+        await self._transaction_manager.commit()
+
+
+class RedisRefreshTokenStore(RefreshTokenStore):
+    # Токены живут в Redis с TTL до истечения срока, поэтому отдельная
+    # очистка не нужна; изменения токенов пользователя - один атомарный скрипт
+    def __init__(self, redis_client: Redis, config: RefreshTokenConfig) -> None:
+        self._redis = redis_client
+        self._retention_ms = int(
+            timedelta(days=config.revoked_retention_days).total_seconds() * 1000
+        )
+        self._create_script = redis_client.register_script(_CREATE_LUA)
+        self._rotate_script = redis_client.register_script(_ROTATE_LUA)
+        self._revoke_script = redis_client.register_script(_REVOKE_ONE_LUA)
+
+    async def create(
+        self,
+        user_id: UUID,
+        token_hash: bytes,
+        expires_at: datetime,
+        revoke_existing: bool = True,
+    ) -> None:
+        ttl_ms = self._ttl_ms(expires_at)
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.set(self._owner_key(token_hash), str(user_id), px=ttl_ms)
+            await self._create_script(
+                keys=[
+                    self._token_key(user_id, token_hash),
+                    self._generation_key(user_id),
+                ],
+                args=[ttl_ms, int(revoke_existing)],
+                client=pipe,
+            )
+            await pipe.execute()
+
+    async def rotate(
+        self, token_hash: bytes, new_token_hash: bytes, expires_at: datetime
+    ) -> UUID:
+        user_id = await self._get_owner(token_hash)
+        if user_id is None:
+            raise InvalidTokenException
+
+        ttl_ms = self._ttl_ms(expires_at)
+        # Владелец нового токена записывается вместе со скриптом: если
+        # ротация не пройдет, ключ просто истечет
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.set(self._owner_key(new_token_hash), str(user_id), px=ttl_ms)
+            await self._rotate_script(
+                keys=[
+                    self._token_key(user_id, token_hash),
+                    self._token_key(user_id, new_token_hash),
+                    self._generation_key(user_id),
+                ],
+                args=[ttl_ms, self._retention_ms],
+                client=pipe,
+            )
+            _, result = await pipe.execute()
+
+        if result == ROTATE_REUSED:
+            raise TokenRevokedException
+        if result != ROTATE_OK:
+            raise InvalidTokenException
+
+        return user_id
+
+    async def revoke(self, token_hash: bytes) -> None:
+        user_id = await self._get_owner(token_hash)
+        if user_id is None:
+            return
+
+        await self._revoke_script(
+            keys=[self._token_key(user_id, token_hash)], args=[self._retention_ms]
+        )
+
+    async def _get_owner(self, token_hash: bytes) -> UUID | None:
+        owner = await self._redis.get(self._owner_key(token_hash))
+        if owner is None:
+            return None
+        return UUID(owner.decode() if isinstance(owner, bytes) else owner)
+
+    @staticmethod
+    def _token_key(user_id: UUID, token_hash: bytes) -> str:
+        return REFRESH_TOKEN_KEY.format(user_id=user_id, token_hash=token_hash.hex())
+
+    @staticmethod
+    def _generation_key(user_id: UUID) -> str:
+        return REFRESH_TOKEN_GENERATION_KEY.format(user_id=user_id)
+
+    @staticmethod
+    def _owner_key(token_hash: bytes) -> str:
+        return REFRESH_TOKEN_OWNER_KEY.format(token_hash=token_hash.hex())
+
+    @staticmethod
+    def _ttl_ms(expires_at: datetime) -> int:
+        return max(1, int((expires_at - datetime.now(UTC)).total_seconds() * 1000))
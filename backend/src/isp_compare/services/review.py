@@ -1,5 +1,7 @@
 from uuid import UUID
 
+from pydantic import TypeAdapter
+
 from isp_compare.core.exceptions import (
     ProviderNotFoundException,
     ReviewNotFoundException,
@@ -8,9 +10,24 @@ from isp_compare.models.review import Review
 from isp_compare.repositories.provider import ProviderRepository
 from isp_compare.repositories.review import ReviewRepository
 from isp_compare.schemas.review import ReviewCreate, ReviewResponse, ReviewUpdate
+from isp_compare.services.cache import RedisCache
+from isp_compare.services.catalog_version import CatalogVersion
+from isp_compare.services.cursor import decode_cursor
 from isp_compare.services.identity_provider import IdentityProvider
+from isp_compare.services.provider import (
+    ALL_PROVIDERS_CACHE_KEY,
+    PROVIDER_CACHE_KEY,
+)
 from isp_compare.services.transaction_manager import TransactionManager
 
+PROVIDER_REVIEWS_CACHE_KEY = "provider_reviews:{provider_id}"
+# В кеше хранится начало ленты отзывов: первая страница с любым limit
+# до этого значения отдается срезом без запроса к БД.
+PROVIDER_REVIEWS_CACHE_SIZE = 50
+PROVIDER_REVIEWS_CACHE_TTL = 30 * 60
+
+reviews_adapter = TypeAdapter(list[ReviewResponse])
+
 
 class ReviewService:
     def __init__(
@@ -19,23 +36,26 @@ class ReviewService:
         provider_repository: ProviderRepository,
         transaction_manager: TransactionManager,
         identity_provider: IdentityProvider,
+        cache: RedisCache,
+        catalog_version: CatalogVersion,
     ) -> None:
         self._review_repository = review_repository
         self._provider_repository = provider_repository
         self._transaction_manager = transaction_manager
         self._identity_provider = identity_provider
+        self._cache = cache
+        self._catalog_version = catalog_version
 
     async def create_review(
         self, provider_id: UUID, data: ReviewCreate
     ) -> ReviewResponse:
         user = await self._identity_provider.get_current_user()
 
-        provider = await self._provider_repository.get_by_id(provider_id=provider_id)
-        if not provider:
+        if not await self._provider_repository.exists(provider_id):
             raise ProviderNotFoundException
 
         existing_review = await self._review_repository.get_by_user_and_provider(
-            user_id=user.id, provider_id=provider_id
+            user_id=user.id, provider_id=provider_id, for_update=True
         )
 
         if existing_review:
@@ -43,19 +63,17 @@ class ReviewService:
                 "rating": data.rating,
                 "comment": data.comment,
             }
-            await self._review_repository.update(existing_review.id, update_data)
-            await self._transaction_manager.commit()
-
-            avg_rating = await self._review_repository.calculate_average_rating(
-                provider_id=provider_id
-            )
-            await self._provider_repository.update(
-                provider_id=provider_id, update_data={"rating": avg_rating}
+            old_rating = existing_review.rating
+            await self._review_repository.update(existing_review, update_data)
+            await self._provider_repository.apply_review_change(
+                provider_id,
+                rating_delta=data.rating - old_rating,
+                count_delta=0,
             )
             await self._transaction_manager.commit()
+            await self._invalidate_cache(provider_id)
 
-            updated_review = await self._review_repository.get_by_id(existing_review.id)
-            return ReviewResponse.model_validate(updated_review)
+            return ReviewResponse.model_validate(existing_review)
 
         review = Review(
             user_id=user.id,
@@ -65,33 +83,42 @@ class ReviewService:
         )
 
         await self._review_repository.create(review)
-        await self._transaction_manager.commit()
-
-        avg_rating = await self._review_repository.calculate_average_rating(
-            provider_id=provider_id
+        await self._provider_repository.apply_review_change(
+            provider_id, rating_delta=data.rating, count_delta=1
         )
-        await self._provider_repository.update(provider_id, {"rating": avg_rating})
         await self._transaction_manager.commit()
+        await self._invalidate_cache(provider_id)
 
         return ReviewResponse.model_validate(review)
 
     async def get_review(self, review_id: UUID) -> ReviewResponse:
         review = await self._review_repository.get_by_id(review_id)
+        await self._transaction_manager.release()
         if not review:
             raise ReviewNotFoundException
 
         return ReviewResponse.model_validate(review)
 
     async def get_provider_reviews(
-        self, provider_id: UUID, limit: int, offset: int
+        self,
+        provider_id: UUID,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
     ) -> list[ReviewResponse]:
-        provider = await self._provider_repository.get_by_id(provider_id)
-        if not provider:
+        if cursor is None and offset == 0 and 0 < limit <= PROVIDER_REVIEWS_CACHE_SIZE:
+            reviews = await self._get_first_page(provider_id)
+            return reviews[:limit]
+
+        decoded_cursor = decode_cursor(cursor) if cursor else None
+
+        if not await self._provider_repository.exists(provider_id):
             raise ProviderNotFoundException
 
         reviews = await self._review_repository.get_by_provider(
-            provider_id, limit, offset
+            provider_id, limit, offset=offset, cursor=decoded_cursor
         )
+        await self._transaction_manager.release()
         return [ReviewResponse.model_validate(review) for review in reviews]
 
     async def update_review(
@@ -109,17 +136,16 @@ class ReviewService:
         update_data = data.model_dump(exclude_unset=True)
 
         if update_data:
-            await self._review_repository.update(review_id, update_data)
+            old_rating = review.rating
+            await self._review_repository.update(review, update_data)
+            if "rating" in update_data:
+                await self._provider_repository.apply_review_change(
+                    review.provider_id,
+                    rating_delta=update_data["rating"] - old_rating,
+                    count_delta=0,
+                )
             await self._transaction_manager.commit()
-
-            avg_rating = await self._review_repository.calculate_average_rating(
-                review.provider_id
-            )
-            await self._provider_repository.update(
-                review.provider_id, {"rating": avg_rating}
-            )
-            await self._transaction_manager.commit()
-            review = await self._review_repository.get_by_id(review.id)
+            await self._invalidate_cache(review.provider_id)
 
         return ReviewResponse.model_validate(review)
 
@@ -133,11 +159,36 @@ class ReviewService:
         if review.user_id != user.id and not user.is_admin:
             raise ReviewNotFoundException
 
-        provider_id = review.provider_id
-
         await self._review_repository.delete(review)
+        await self._provider_repository.apply_review_change(
+            review.provider_id, rating_delta=-review.rating, count_delta=-1
+        )
         await self._transaction_manager.commit()
+        await self._invalidate_cache(review.provider_id)
+
+    async def _get_first_page(self, provider_id: UUID) -> list[ReviewResponse]:
+        return await self._cache.get_or_set(
+            PROVIDER_REVIEWS_CACHE_KEY.format(provider_id=provider_id),
+            lambda: self._load_first_page(provider_id),
+            reviews_adapter,
+            ttl=PROVIDER_REVIEWS_CACHE_TTL,
+        )
 
-        avg_rating = await self._review_repository.calculate_average_rating(provider_id)
-        await self._provider_repository.update(provider_id, {"rating": avg_rating})
-        await self._transaction_manager.commit()
+    async def _load_first_page(self, provider_id: UUID) -> list[ReviewResponse]:
+        if not await self._provider_repository.exists(provider_id):
+            raise ProviderNotFoundException
+
+        reviews = await self._review_repository.get_by_provider(
+            provider_id, PROVIDER_REVIEWS_CACHE_SIZE
+        )
+        await self._transaction_manager.release()
+        return [ReviewResponse.model_validate(review) for review in reviews]
+
+    async def _invalidate_cache(self, provider_id: UUID) -> None:
+        # Отзыв меняет ленту провайдера и его рейтинг, в том числе в общем списке
+        await self._cache.invalidate(
+            PROVIDER_REVIEWS_CACHE_KEY.format(provider_id=provider_id),
+            PROVIDER_CACHE_KEY.format(provider_id=provider_id),
+            ALL_PROVIDERS_CACHE_KEY,
+        )
+        await self._catalog_version.bump()
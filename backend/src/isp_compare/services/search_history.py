@@ -1,8 +1,10 @@
 from uuid import UUID
 
 from isp_compare.core.exceptions import SearchHistoryNotFoundException
+from isp_compare.repositories.popular_search import PopularSearchRepository
 from isp_compare.repositories.search_history import SearchHistoryRepository
 from isp_compare.schemas.search_history import (
+    PopularSearchResponse,
     SearchHistoryResponse,
 )
 from isp_compare.services.identity_provider import IdentityProvider
@@ -13,10 +15,12 @@ class SearchHistoryService:
     def __init__(
         self,
         search_history_repository: SearchHistoryRepository,
+        popular_search_repository: PopularSearchRepository,
         transaction_manager: TransactionManager,
         identity_provider: IdentityProvider,
     ) -> None:
         self._search_history_repository = search_history_repository
+        self._popular_search_repository = popular_search_repository
         self._transaction_manager = transaction_manager
         self._identity_provider = identity_provider
 
@@ -27,6 +31,7 @@ class SearchHistoryService:
         search_histories = await self._search_history_repository.get_by_user(
             user.id, limit, offset
         )
+        await self._transaction_manager.release()
         return [
             SearchHistoryResponse.model_validate(history)
             for history in search_histories
@@ -37,10 +42,21 @@ class SearchHistoryService:
         latest_search = await self._search_history_repository.get_latest_by_user(
             user.id
         )
+        await self._transaction_manager.release()
         if not latest_search:
             return None
         return SearchHistoryResponse.model_validate(latest_search)
 
+    async def get_popular_searches(self, limit: int) -> list[PopularSearchResponse]:
+        await self._identity_provider.ensure_is_admin()
+
+        popular_searches = await self._popular_search_repository.get_top(limit)
+        await self._transaction_manager.release()
+        return [
+            PopularSearchResponse.model_validate(popular_search)
+            for popular_search in popular_searches
+        ]
+
     async def delete_search_history(self, search_history_id: UUID) -> None:
         user = await self._identity_provider.get_current_user()
         search_history = await self._search_history_repository.get_by_id(
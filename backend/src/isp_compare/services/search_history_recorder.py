@@ -0,0 +1,243 @@
+import asyncio
+import contextlib
+import json
+import logging
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from dishka import AsyncContainer
+from redis.asyncio import Redis
+
+from isp_compare.core.config import SearchHistoryConfig
+from isp_compare.repositories.popular_search import PopularSearchRepository
+from isp_compare.repositories.search_history import SearchHistoryRepository
+from isp_compare.services.transaction_manager import TransactionManager
+
+logger = logging.getLogger(__name__)
+
+SEARCH_HISTORY_QUEUE_KEY = "search_history:queue"
+SEARCH_HISTORY_PURGE_KEY = "search_history:purge"
+SEARCH_HISTORY_DEAD_LETTER_KEY = "search_history:dead_letter"
+SEARCH_HISTORY_DEAD_LETTER_SIZE = 10_000
+# Пагинация не делает поиск другим набором фильтров
+PAGINATION_PARAMS = frozenset({"limit", "offset"})
+
+
+class SearchHistoryRecorder:
+    def __init__(
+        self,
+        container: AsyncContainer,
+        redis_client: Redis,
+        config: SearchHistoryConfig,
+    ) -> None:
+        self._container = container
+        self._redis = redis_client
+        self._config = config
+        self._task: asyncio.Task | None = None
+
+    async def record(self, user_id: UUID, search_params: dict[str, Any]) -> None:
+        # Запрос поиска только ставит запись в очередь, в БД ее
+        # пачкой пишет фоновая задача
+        entry = {
+            "user_id": str(user_id),
+            "search_params": search_params,
+            "created_at": datetime.now(UTC).isoformat(),
+        }
+        await self._redis.rpush(SEARCH_HISTORY_QUEUE_KEY, json.dumps(entry))
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._flush_periodically())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        await self.flush()
+
+    async def flush(self) -> int:
+        saved = 0
+        while True:
+            items = await self._redis.lpop(
+                SEARCH_HISTORY_QUEUE_KEY, self._config.batch_size
+            )
+            if not items:
+                return saved
+
+            entries = await self._parse_entries(items)
+            if not entries:
+                continue
+
+            try:
+                saved += await self._save_batch(entries)
+            except Exception:
+                # Возвращаем пачку в начало очереди, чтобы повторить позже
+                await self._requeue(entries)
+                raise
+
+    async def _parse_entries(self, items: list[Any]) -> list[dict[str, Any]]:
+        entries = []
+        malformed = []
+        for item in items:
+            entry = self._parse_entry(item)
+            if entry is None:
+                malformed.append(item)
+            else:
+                entries.append(entry)
+
+        if malformed:
+            logger.warning(f"Search history: {len(malformed)} malformed entries")
+            await self._dead_letter(malformed)
+        return entries
+
+    @staticmethod
+    def _parse_entry(item: Any) -> dict[str, Any] | None:
+        try:
+            entry = json.loads(item)
+            UUID(entry["user_id"])
+            datetime.fromisoformat(entry["created_at"])
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return None
+        if not isinstance(entry.get("search_params"), dict):
+            return None
+        return entry
+
+    async def _requeue(self, entries: list[dict[str, Any]]) -> None:
+        # Пачка, которая падает всегда (например, из-за FK на удаленного
+        # пользователя), не должна бесконечно блокировать очередь
+        retry = []
+        failed = []
+        for entry in entries:
+            entry["attempts"] = entry.get("attempts", 0) + 1
+            if entry["attempts"] >= self._config.max_flush_attempts:
+                failed.append(json.dumps(entry))
+            else:
+                retry.append(json.dumps(entry))
+
+        if failed:
+            logger.error(
+                f"Search history: {len(failed)} entries failed "
+                f"{self._config.max_flush_attempts} times, moved to dead letter"
+            )
+            await self._dead_letter(failed)
+        if retry:
+            await self._redis.lpush(SEARCH_HISTORY_QUEUE_KEY, *reversed(retry))
+
+    async def _dead_letter(self, items: list[Any]) -> None:
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.rpush(SEARCH_HISTORY_DEAD_LETTER_KEY, *items)
+            pipe.ltrim(
+                SEARCH_HISTORY_DEAD_LETTER_KEY, -SEARCH_HISTORY_DEAD_LETTER_SIZE, -1
+            )
+            await pipe.execute()
+
+    async def _save_batch(self, entries: list[dict[str, Any]]) -> int:
+        async with self._container() as request_container:
+            repository = await request_container.get(SearchHistoryRepository)
+            popular_search_repository = await request_container.get(
+                PopularSearchRepository
+            )
+            transaction_manager = await request_container.get(TransactionManager)
+
+            user_ids = {UUID(entry["user_id"]) for entry in entries}
+            last_params = await repository.get_latest_params_by_users(user_ids)
+
+            rows = []
+            for entry in sorted(entries, key=lambda item: item["created_at"]):
+                user_id = UUID(entry["user_id"])
+                if user_id not in last_params:
+                    continue
+
+                # Повтор того же поиска подряд не засоряет историю
+                if last_params[user_id] == entry["search_params"]:
+                    continue
+
+                last_params[user_id] = entry["search_params"]
+                rows.append(
+                    {
+                        "user_id": user_id,
+                        "search_params": entry["search_params"],
+                        "created_at": datetime.fromisoformat(entry["created_at"]),
+                    }
+                )
+
+            if rows:
+                await repository.create_many(rows)
+                await repository.trim_to_limit(
+                    {row["user_id"] for row in rows}, self._config.max_per_user
+                )
+                popular_searches = self._count_filters(rows)
+                if popular_searches:
+                    await popular_search_repository.increment(popular_searches)
+                await transaction_manager.commit()
+
+        return len(rows)
+
+    @staticmethod
+    def _count_filters(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        # Агрегат обновляется на каждой пачке, без пересчета по всей истории
+        counts: dict[str, dict[str, Any]] = {}
+        for row in rows:
+            filters = {
+                key: value
+                for key, value in row["search_params"].items()
+                if key not in PAGINATION_PARAMS
+            }
+            if not filters:
+                continue
+
+            key = json.dumps(filters, sort_keys=True)
+            if key not in counts:
+                counts[key] = {
+                    "filters": filters,
+                    "searches_count": 0,
+                    "last_searched_at": row["created_at"],
+                }
+            counts[key]["searches_count"] += 1
+            counts[key]["last_searched_at"] = max(
+                counts[key]["last_searched_at"], row["created_at"]
+            )
+        return list(counts.values())
+
+    async def purge_expired(self) -> int:
+        created_before = datetime.now(UTC) - timedelta(days=self._config.retention_days)
+
+        # Удаляем порциями, чтобы не держать долгих блокировок
+        purged = 0
+        while True:
+            async with self._container() as request_container:
+                repository = await request_container.get(SearchHistoryRepository)
+                transaction_manager = await request_container.get(TransactionManager)
+                deleted = await repository.delete_created_before(
+                    created_before, self._config.batch_size
+                )
+                await transaction_manager.commit()
+
+            purged += deleted
+            if deleted < self._config.batch_size:
+                return purged
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._config.flush_interval_seconds)
+            try:
+                await self.flush()
+                if await self._is_purge_due():
+                    purged = await self.purge_expired()
+                    logger.info(f"Search history purged: {purged} expired entries")
+            except Exception as e:
+                logger.exception(f"Search history flush failed: {e!s}")
+
+    async def _is_purge_due(self) -> bool:
+        # Очистку за интервал выполняет только один воркер
+        return bool(
+            await self._redis.set(
+                SEARCH_HISTORY_PURGE_KEY,
+                1,
+                nx=True,
+                ex=self._config.purge_interval_minutes * 60,
+            )
+        )
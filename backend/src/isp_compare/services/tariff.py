@@ -5,10 +5,8 @@ from isp_compare.core.exceptions import (
     ProviderNotFoundException,
     TariffNotFoundException,
 )
-from isp_compare.models import SearchHistory, User
 from isp_compare.models.tariff import Tariff
 from isp_compare.repositories.provider import ProviderRepository
-from isp_compare.repositories.search_history import SearchHistoryRepository
 from isp_compare.repositories.tariff import TariffRepository
 from isp_compare.schemas.tariff import (
     TariffCreate,
@@ -16,7 +14,9 @@ from isp_compare.schemas.tariff import (
     TariffSearchParams,
     TariffUpdate,
 )
+from isp_compare.services.catalog_version import CatalogVersion
 from isp_compare.services.identity_provider import IdentityProvider
+from isp_compare.services.search_history_recorder import SearchHistoryRecorder
 from isp_compare.services.transaction_manager import TransactionManager
 
 
@@ -25,51 +25,54 @@ class TariffService:
         self,
         tariff_repository: TariffRepository,
         provider_repository: ProviderRepository,
-        search_history_repository: SearchHistoryRepository,
+        search_history_recorder: SearchHistoryRecorder,
         transaction_manager: TransactionManager,
         identity_provider: IdentityProvider,
+        catalog_version: CatalogVersion,
     ) -> None:
         self._tariff_repository = tariff_repository
         self._provider_repository = provider_repository
-        self._search_history_repository = search_history_repository
+        self._search_history_recorder = search_history_recorder
         self._transaction_manager = transaction_manager
         self._identity_provider = identity_provider
+        self._catalog_version = catalog_version
 
     async def create_tariff(
         self, provider_id: UUID, data: TariffCreate
     ) -> TariffResponse:
         await self._identity_provider.ensure_is_admin()
 
-        provider = await self._provider_repository.get_by_id(provider_id)
-        if not provider:
+        if not await self._provider_repository.exists(provider_id):
             raise ProviderNotFoundException
 
         tariff = Tariff(**data.model_dump(), provider_id=provider_id)
         await self._tariff_repository.create(tariff)
         await self._transaction_manager.commit()
+        await self._catalog_version.bump()
         return TariffResponse.model_validate(tariff)
 
     async def get_tariff(self, tariff_id: UUID) -> TariffResponse:
         tariff = await self._tariff_repository.get_by_id(tariff_id)
+        await self._transaction_manager.release()
         if not tariff:
             raise TariffNotFoundException
         return TariffResponse.model_validate(tariff)
 
     async def get_all_tariffs(self, limit: int, offset: int) -> list[TariffResponse]:
         tariffs = await self._tariff_repository.get_all(limit=limit, offset=offset)
+        await self._transaction_manager.release()
         return [TariffResponse.model_validate(tariff) for tariff in tariffs]
 
     async def get_provider_tariffs(
         self, provider_id: UUID, limit: int, offset: int
     ) -> list[TariffResponse]:
-        provider_result = await self._provider_repository.get_by_id(provider_id)
-
-        if not provider_result:
+        if not await self._provider_repository.exists(provider_id):
             raise ProviderNotFoundException
 
         tariffs = await self._tariff_repository.get_by_provider(
             provider_id, limit, offset
         )
+        await self._transaction_manager.release()
 
         return [TariffResponse.model_validate(tariff) for tariff in tariffs]
 
@@ -85,6 +88,7 @@ class TariffService:
         update_data = data.model_dump(exclude_unset=True)
         await self._tariff_repository.update(tariff_id, update_data)
         await self._transaction_manager.commit()
+        await self._catalog_version.bump()
         await self._transaction_manager.refresh(tariff)
         return TariffResponse.model_validate(tariff)
 
@@ -97,6 +101,7 @@ class TariffService:
 
         await self._tariff_repository.delete(tariff)
         await self._transaction_manager.commit()
+        await self._catalog_version.bump()
 
     async def search_tariffs(
         self, search_params: TariffSearchParams
@@ -112,22 +117,18 @@ class TariffService:
             offset=search_params.offset,
         )
 
-        user = await self._get_user_safe()
-
-        tariff_responses = [TariffResponse.model_validate(tariff) for tariff in tariffs]
+        await self._transaction_manager.release()
 
-        if user:
-            search_history = SearchHistory(
-                user_id=user.id,
-                search_params=search_params.model_dump(exclude_none=True, mode="json"),
+        user_id = await self._get_user_id_safe()
+        if user_id:
+            await self._search_history_recorder.record(
+                user_id, search_params.model_dump(exclude_none=True, mode="json")
             )
-            await self._search_history_repository.create(search_history)
-            await self._transaction_manager.commit()
 
-        return tariff_responses
+        return [TariffResponse.model_validate(tariff) for tariff in tariffs]
 
-    async def _get_user_safe(self) -> User | None:
+    async def _get_user_id_safe(self) -> UUID | None:
         try:
-            return await self._identity_provider.get_current_user()
+            return await self._identity_provider.get_current_user_id()
         except AppException:
             return None
@@ -1,3 +1,4 @@
+import hashlib
 import secrets
 from datetime import UTC, datetime, timedelta
 from typing import Any
@@ -37,6 +38,10 @@ class TokenProcessor:
         )
         return token, expires_at
 
+    @staticmethod
+    def hash_refresh_token(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
     def decode_token(self, token: str) -> dict[str, Any]:
         return jwt.decode(
             token,
@@ -0,0 +1,92 @@
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+
+from dishka import AsyncContainer
+from redis.asyncio import Redis
+
+from isp_compare.core.config import RefreshTokenConfig
+from isp_compare.repositories.token import RefreshTokenRepository
+from isp_compare.services.transaction_manager import TransactionManager
+
+logger = logging.getLogger(__name__)
+
+REFRESH_TOKEN_PURGE_KEY = "refresh_token:purge"  # noqa: S105
+
+
+class RefreshTokenPurger:
+    def __init__(
+        self,
+        container: AsyncContainer,
+        redis_client: Redis,
+        config: RefreshTokenConfig,
+    ) -> None:
+        self._container = container
+        self._redis = redis_client
+        self._config = config
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._purge_periodically())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def purge(self) -> int:
+        revoked_before = datetime.now(UTC) - timedelta(
+            days=self._config.revoked_retention_days
+        )
+        expired = await self._delete_in_batches(
+            lambda repository: repository.delete_expired(self._config.purge_batch_size)
+        )
+        revoked = await self._delete_in_batches(
+            lambda repository: repository.delete_revoked_before(
+                revoked_before, self._config.purge_batch_size
+            )
+        )
+        return expired + revoked
+
+    async def _delete_in_batches(
+        self, delete_batch: Callable[[RefreshTokenRepository], Awaitable[int]]
+    ) -> int:
+        # Каждая порция - отдельная короткая транзакция, чтобы не держать
+        # блокировки и не раздувать WAL одним огромным DELETE
+        deleted_total = 0
+        while True:
+            async with self._container() as request_container:
+                repository = await request_container.get(RefreshTokenRepository)
+                transaction_manager = await request_container.get(TransactionManager)
+                deleted = await delete_batch(repository)
+                await transaction_manager.commit()
+
+            deleted_total += deleted
+            if deleted < self._config.purge_batch_size:
+                return deleted_total
+
+    async def _purge_periodically(self) -> None:
+        while True:
+            try:
+                if await self._is_purge_due():
+                    purged = await self.purge()
+                    logger.info(f"Refresh tokens purged: {purged}")
+            except Exception as e:
+                logger.exception(f"Refresh token purge failed: {e!s}")
+
+            await asyncio.sleep(self._config.purge_interval_minutes * 60)
+
+    async def _is_purge_due(self) -> bool:
+        # Очистку за интервал выполняет только один воркер
+        return bool(
+            await self._redis.set(
+                REFRESH_TOKEN_PURGE_KEY,
+                1,
+                nx=True,
+                ex=self._config.purge_interval_minutes * 60,
+            )
+        )
@@ -13,6 +13,12 @@ class TransactionManager:
     async def flush(self, objects: Sequence | None = None) -> None:
         await self.session.flush(objects)
 
+    async def release(self) -> None:
+        # Завершает читающую транзакцию, чтобы соединение вернулось в пул
+        # сразу после последнего запроса, а не в конце обработки HTTP-запроса
+        if self.session.in_transaction():
+            await self.session.commit()
+
     async def rollback(self) -> None:
         await self.session.rollback()
 
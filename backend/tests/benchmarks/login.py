@@ -0,0 +1,148 @@
+import asyncio
+import logging
+import secrets
+import statistics
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from time import perf_counter
+
+from redis.asyncio import Redis
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from isp_compare.core.config import PostgresConfig, RedisConfig
+from isp_compare.core.di.providers.database import create_engine
+from isp_compare.models.token import RefreshToken
+from isp_compare.models.user import User
+from isp_compare.repositories.token import RefreshTokenRepository
+from isp_compare.repositories.user import UserRepository
+from isp_compare.services.rate_limiter import RateLimiter
+from isp_compare.services.refresh_token_store import SqlRefreshTokenStore
+from isp_compare.services.token_processor import TokenProcessor
+from isp_compare.services.transaction_manager import TransactionManager
+
+logger = logging.getLogger(__name__)
+
+ITERATIONS = 500
+USERNAME = "benchmark_login_user"
+IP_ADDRESS = "127.0.0.1"
+
+LoginPath = Callable[[AsyncSession, Redis], Awaitable[None]]
+
+
+def new_token() -> tuple[bytes, datetime]:
+    return (
+        TokenProcessor.hash_refresh_token(secrets.token_hex(32)),
+        datetime.now(UTC) + timedelta(days=7),
+    )
+
+
+async def login_sequential(session: AsyncSession, redis_client: Redis) -> None:
+    # Прежний путь: каждый запрос к Redis и Postgres ждет предыдущий
+    key = f"failed_login_limit:{USERNAME}:{IP_ADDRESS}"
+    window_seconds = 5 * 60
+    window_start_time = int(datetime.now(UTC).timestamp()) - window_seconds
+    await redis_client.zremrangebyscore(key, 0, window_start_time)
+    await redis_client.zcard(key)
+    await redis_client.expire(key, window_seconds)
+
+    user = await session.scalar(select(User).where(User.username == USERNAME))
+    assert user is not None
+
+    await session.execute(
+        update(RefreshToken)
+        .where(RefreshToken.user_id == user.id, ~RefreshToken.revoked)
+        .values(revoked=True, revoked_at=datetime.now(UTC))
+    )
+    token_hash, expires_at = new_token()
+    session.add(
+        RefreshToken(token_hash=token_hash, user_id=user.id, expires_at=expires_at)
+    )
+    await session.commit()
+
+
+async def login_combined(session: AsyncSession, redis_client: Redis) -> None:
+    transaction_manager = TransactionManager(session)
+    _, user = await asyncio.gather(
+        RateLimiter(redis_client).check_failed_login_limit(USERNAME, IP_ADDRESS),
+        UserRepository(session).get_by_username(USERNAME),
+    )
+    await transaction_manager.release()
+    assert user is not None
+
+    store = SqlRefreshTokenStore(
+        refresh_token_repository=RefreshTokenRepository(session),
+        transaction_manager=transaction_manager,
+    )
+    await store.create(user.id, *new_token())
+
+
+async def measure(
+    session_maker: async_sessionmaker[AsyncSession],
+    redis_client: Redis,
+    login: LoginPath,
+) -> tuple[float, float]:
+    timings = []
+    for _ in range(ITERATIONS):
+        async with session_maker() as session:
+            started_at = perf_counter()
+            await login(session, redis_client)
+            timings.append(perf_counter() - started_at)
+
+    timings.sort()
+    median = statistics.median(timings) * 1000
+    p95 = timings[int(len(timings) * 0.95)] * 1000
+    return median, p95
+
+
+async def run() -> None:
+    postgres_config = PostgresConfig()
+    redis_config = RedisConfig()
+    engine = create_engine(postgres_config, postgres_config.build_dsn())
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    redis_client = Redis(
+        host=redis_config.host,
+        port=redis_config.port,
+        password=redis_config.password.get_secret_value(),
+    )
+
+    async with session_maker() as session:
+        # bcrypt в замер не входит: хеш пароля не проверяется
+        user = User(
+            fullname="Benchmark User",
+            username=USERNAME,
+            email="benchmark_login_user@example.com",
+            hashed_password="-",
+        )
+        session.add(user)
+        await session.commit()
+
+    try:
+        for name, login in (
+            ("sequential", login_sequential),
+            ("combined", login_combined),
+        ):
+            # Прогрев пула соединений и кеша подготовленных выражений
+            await measure(session_maker, redis_client, login)
+            median, p95 = await measure(session_maker, redis_client, login)
+            logger.info(f"{name}: median {median:.2f} ms, p95 {p95:.2f} ms")
+    finally:
+        async with session_maker() as session:
+            await session.execute(
+                delete(RefreshToken).where(RefreshToken.user_id == user.id)
+            )
+            await session.execute(delete(User).where(User.id == user.id))
+            await session.commit()
+
+        await redis_client.aclose()
+        await engine.dispose()
+
+
+def main() -> None:
+    logging.basicConfig(format="%(message)s")
+    logger.setLevel(logging.INFO)
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
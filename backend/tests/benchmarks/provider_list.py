@@ -0,0 +1,89 @@
+import asyncio
+import json
+import logging
+import uuid
+from time import perf_counter
+
+import fakeredis.aioredis
+from fastapi import FastAPI, Response
+from httpx import ASGITransport, AsyncClient
+
+from isp_compare.schemas.provider import ProviderResponse
+from isp_compare.services.provider import ALL_PROVIDERS_CACHE_KEY, providers_adapter
+
+logger = logging.getLogger(__name__)
+
+PROVIDERS_COUNT = 50
+REQUESTS_COUNT = 5000
+
+
+def create_app() -> FastAPI:
+    redis_client = fakeredis.aioredis.FakeRedis()
+    app = FastAPI()
+
+    # Прежний путь: json.loads, модель на каждую строку и повторная
+    # сериализация ответа в FastAPI.
+    @app.get("/models")
+    async def get_models() -> list[ProviderResponse]:
+        cached_data = await redis_client.get(ALL_PROVIDERS_CACHE_KEY)
+        return [ProviderResponse(**provider) for provider in json.loads(cached_data)]
+
+    @app.get("/raw", response_model=list[ProviderResponse])
+    async def get_raw() -> Response:
+        content = await redis_client.get(ALL_PROVIDERS_CACHE_KEY)
+        return Response(content=content, media_type="application/json")
+
+    app.state.redis_client = redis_client
+    return app
+
+
+async def fill_cache(app: FastAPI) -> None:
+    providers = [
+        ProviderResponse(
+            id=uuid.uuid4(),
+            name=f"Provider {i}",
+            description="Домашний интернет и цифровое телевидение. " * 10,
+            website=f"https://provider{i}.ru",
+            phone="+7 800 000-00-00",
+            logo_url=f"https://provider{i}.ru/logo.png",
+            rating=4.5,
+            reviews_count=i,
+        )
+        for i in range(PROVIDERS_COUNT)
+    ]
+    await app.state.redis_client.set(
+        ALL_PROVIDERS_CACHE_KEY, providers_adapter.dump_json(providers)
+    )
+
+
+async def measure(client: AsyncClient, url: str) -> float:
+    started_at = perf_counter()
+    for _ in range(REQUESTS_COUNT):
+        response = await client.get(url)
+        response.raise_for_status()
+    return REQUESTS_COUNT / (perf_counter() - started_at)
+
+
+async def run() -> None:
+    app = create_app()
+    await fill_cache(app)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        models_body = (await client.get("/models")).json()
+        raw_body = (await client.get("/raw")).json()
+        assert models_body == raw_body
+
+        for url in ("/models", "/raw"):
+            rps = await measure(client, url)
+            logger.info(f"{url}: {rps:.0f} requests/s")
+
+
+def main() -> None:
+    logging.basicConfig(format="%(message)s")
+    logger.setLevel(logging.INFO)
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
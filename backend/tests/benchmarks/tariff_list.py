@@ -0,0 +1,86 @@
+import asyncio
+import logging
+import uuid
+from decimal import Decimal
+from time import perf_counter
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from isp_compare.api.responses import FastJSONResponse
+from isp_compare.schemas.tariff import TariffResponse
+
+logger = logging.getLogger(__name__)
+
+TARIFFS_COUNT = 100
+REQUESTS_COUNT = 2000
+
+
+def create_tariffs() -> list[TariffResponse]:
+    provider_id = uuid.uuid4()
+    return [
+        TariffResponse(
+            id=uuid.uuid4(),
+            provider_id=provider_id,
+            name=f"Тариф {i}",
+            description="Домашний интернет с роутером в аренду.",
+            price=Decimal("650.00") + i,
+            speed=100 + i,
+            has_tv=i % 2 == 0,
+            has_phone=i % 3 == 0,
+            connection_cost=Decimal("0.00"),
+            promo_price=Decimal("325.00"),
+            promo_period=3,
+            is_active=True,
+            url=f"https://provider.ru/tariffs/{i}",
+        )
+        for i in range(TARIFFS_COUNT)
+    ]
+
+
+def create_app(tariffs: list[TariffResponse]) -> FastAPI:
+    app = FastAPI()
+
+    # Прежний путь: повторная валидация по response_model, jsonable_encoder
+    # и json.dumps в стандартном JSONResponse.
+    @app.get("/default")
+    async def get_default() -> list[TariffResponse]:
+        return tariffs
+
+    @app.get("/fast", response_model=list[TariffResponse])
+    async def get_fast() -> FastJSONResponse:
+        return FastJSONResponse(tariffs)
+
+    return app
+
+
+async def measure(client: AsyncClient, url: str) -> float:
+    started_at = perf_counter()
+    for _ in range(REQUESTS_COUNT):
+        response = await client.get(url)
+        response.raise_for_status()
+    return REQUESTS_COUNT / (perf_counter() - started_at)
+
+
+async def run() -> None:
+    app = create_app(create_tariffs())
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        default_body = (await client.get("/default")).json()
+        fast_body = (await client.get("/fast")).json()
+        assert default_body == fast_body
+
+        for url in ("/default", "/fast"):
+            rps = await measure(client, url)
+            logger.info(f"{url}: {rps:.0f} requests/s")
+
+
+def main() -> None:
+    logging.basicConfig(format="%(message)s")
+    logger.setLevel(logging.INFO)
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from decimal import Decimal
+from time import perf_counter
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from isp_compare.core.config import PostgresConfig
+from isp_compare.models.provider import Provider
+from isp_compare.models.tariff import Tariff
+from isp_compare.repositories.tariff import TariffRepository
+from isp_compare.schemas.tariff import TariffResponse
+
+logger = logging.getLogger(__name__)
+
+TARIFFS_COUNT = 1000
+ITERATIONS = 200
+
+
+async def load_orm(session: AsyncSession) -> list[TariffResponse]:
+    # Прежний путь: полные ORM-объекты в identity map
+    result = await session.execute(
+        select(Tariff).where(Tariff.is_active.is_(True)).limit(TARIFFS_COUNT)
+    )
+    tariffs = [TariffResponse.model_validate(tariff) for tariff in result.scalars()]
+    session.expunge_all()
+    return tariffs
+
+
+async def load_rows(session: AsyncSession) -> list[TariffResponse]:
+    rows = await TariffRepository(session).get_all(TARIFFS_COUNT, 0)
+    return [TariffResponse.model_validate(row) for row in rows]
+
+
+async def measure(
+    session: AsyncSession, load: Callable[[AsyncSession], Awaitable[list]]
+) -> float:
+    # Лучшее время из всех прогонов меньше зависит от шума на машине
+    timings = []
+    for _ in range(ITERATIONS):
+        started_at = perf_counter()
+        assert len(await load(session)) == TARIFFS_COUNT
+        timings.append(perf_counter() - started_at)
+    return min(timings) * 1000
+
+
+async def run() -> None:
+    engine = create_async_engine(PostgresConfig().build_dsn())
+
+    async with AsyncSession(engine) as session, session.begin():
+        provider = Provider(
+            name="Benchmark Provider", website="https://example.com", phone="0"
+        )
+        session.add(provider)
+        await session.flush()
+        await session.execute(
+            insert(Tariff),
+            [
+                {
+                    "provider_id": provider.id,
+                    "name": f"Тариф {i}",
+                    "description": "Домашний интернет с роутером в аренду.",
+                    "price": Decimal("650.00") + i,
+                    "speed": 100 + i,
+                    "connection_cost": Decimal("0.00"),
+                    "promo_price": Decimal("325.00"),
+                    "promo_period": 3,
+                    "url": f"https://example.com/tariffs/{i}",
+                }
+                for i in range(TARIFFS_COUNT)
+            ],
+        )
+        session.expunge_all()
+        await load_orm(session)
+
+        for name, load in (("orm", load_orm), ("rows", load_rows)):
+            elapsed = await measure(session, load)
+            logger.info(f"{name}: {elapsed:.1f} ms per {TARIFFS_COUNT} tariffs")
+
+        # Данные бенчмарка не сохраняются
+        await session.rollback()
+
+    await engine.dispose()
+
+
+def main() -> None:
+    logging.basicConfig(format="%(message)s")
+    logger.setLevel(logging.INFO)
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterable
+from time import perf_counter
+
+import fakeredis
+from dishka import Provider, Scope, make_async_container, provide
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from isp_compare.core.config import PostgresConfig, RefreshTokenConfig
+from isp_compare.core.di.providers.database import create_engine
+from isp_compare.models.token import RefreshToken
+from isp_compare.models.user import User
+from isp_compare.repositories.token import RefreshTokenRepository
+from isp_compare.services.token_purger import RefreshTokenPurger
+from isp_compare.services.transaction_manager import TransactionManager
+
+logger = logging.getLogger(__name__)
+
+EXPIRED_TOKENS = 2_000_000
+ACTIVE_TOKENS = 1000
+BATCH_SIZE = 100_000
+
+
+class BenchmarkProvider(Provider):
+    scope = Scope.REQUEST
+
+    refresh_token_repository = provide(RefreshTokenRepository)
+    transaction_manager = provide(TransactionManager)
+
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession]) -> None:
+        super().__init__()
+        self._session_maker = session_maker
+
+    @provide
+    async def session(self) -> AsyncIterable[AsyncSession]:
+        async with self._session_maker() as session:
+            yield session
+
+
+async def insert_tokens(session: AsyncSession, user: User) -> None:
+    await session.execute(
+        text(
+            "INSERT INTO refresh_tokens (id, token_hash, user_id, expires_at, revoked) "
+            "SELECT gen_random_uuid(), sha256(int8send(i)), :user_id, "
+            "now() - make_interval(secs => i), false "
+            "FROM generate_series(1, :count) AS i"
+        ),
+        {"user_id": user.id, "count": EXPIRED_TOKENS},
+    )
+    await session.execute(
+        text(
+            "INSERT INTO refresh_tokens (id, token_hash, user_id, expires_at, revoked) "
+            "SELECT gen_random_uuid(), sha256(int8send(-i)), :user_id, "
+            "now() + interval '7 days', false "
+            "FROM generate_series(1, :count) AS i"
+        ),
+        {"user_id": user.id, "count": ACTIVE_TOKENS},
+    )
+    await session.commit()
+    await session.execute(text("ANALYZE refresh_tokens"))
+
+
+async def run() -> None:
+    postgres_config = PostgresConfig()
+    engine = create_engine(postgres_config, postgres_config.build_dsn())
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    container = make_async_container(BenchmarkProvider(session_maker))
+    purger = RefreshTokenPurger(
+        container=container,
+        redis_client=fakeredis.aioredis.FakeRedis(),
+        config=RefreshTokenConfig(purge_batch_size=BATCH_SIZE),
+    )
+
+    async with session_maker() as session:
+        user = User(
+            fullname="Benchmark User",
+            username="benchmark_purge_user",
+            email="benchmark_purge_user@example.com",
+            hashed_password="-",
+        )
+        session.add(user)
+        await session.commit()
+        user_id = user.id
+
+        try:
+            started_at = perf_counter()
+            await insert_tokens(session, user)
+            logger.info(
+                f"insert: {perf_counter() - started_at:.1f} s "
+                f"for {EXPIRED_TOKENS + ACTIVE_TOKENS} tokens"
+            )
+
+            started_at = perf_counter()
+            purged = await purger.purge()
+            elapsed = perf_counter() - started_at
+            remaining = await session.scalar(
+                select(func.count())
+                .select_from(RefreshToken)
+                .where(RefreshToken.user_id == user_id)
+            )
+            logger.info(
+                f"purge: {elapsed:.1f} s for {purged} tokens "
+                f"in batches of {BATCH_SIZE}, {remaining} active left"
+            )
+        finally:
+            # Данные бенчмарка не сохраняются
+            await session.rollback()
+            await session.execute(
+                delete(RefreshToken).where(RefreshToken.user_id == user_id)
+            )
+            await session.execute(delete(User).where(User.id == user_id))
+            await session.commit()
+
+    await container.close()
+    await engine.dispose()
+
+
+def main() -> None:
+    logging.basicConfig(format="%(message)s")
+    logger.setLevel(logging.INFO)
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
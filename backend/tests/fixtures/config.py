@@ -5,9 +5,14 @@ from isp_compare.core.config import (
     ApplicationConfig,
     Config,
     CookieConfig,
+    HttpCacheConfig,
     JWTConfig,
+    ParserConfig,
     PostgresConfig,
     RedisConfig,
+    RefreshTokenConfig,
+    SearchHistoryConfig,
+    ServerConfig,
 )
 
 
@@ -61,6 +66,48 @@ def app_config() -> ApplicationConfig:
     )
 
 
+@pytest.fixture(scope="session")
+def parser_config() -> ParserConfig:
+    return ParserConfig(
+        scheduler_enabled=False,
+        interval_minutes=60,
+        jitter_seconds=0,
+        poll_interval_seconds=1,
+        lock_timeout_seconds=60,
+    )
+
+
+@pytest.fixture(scope="session")
+def http_cache_config() -> HttpCacheConfig:
+    return HttpCacheConfig(catalog_cache_control="public, max-age=60")
+
+
+@pytest.fixture(scope="session")
+def server_config() -> ServerConfig:
+    return ServerConfig(workers=1)
+
+
+@pytest.fixture(scope="session")
+def search_history_config() -> SearchHistoryConfig:
+    return SearchHistoryConfig(
+        flush_interval_seconds=0.1,
+        batch_size=100,
+        max_per_user=10,
+        retention_days=30,
+        purge_interval_minutes=60,
+        max_flush_attempts=3,
+    )
+
+
+@pytest.fixture(scope="session")
+def refresh_token_config() -> RefreshTokenConfig:
+    return RefreshTokenConfig(
+        purge_interval_minutes=60,
+        purge_batch_size=100,
+        revoked_retention_days=1,
+    )
+
+
 @pytest.fixture(scope="session")
 def config(
     app_config: ApplicationConfig,
@@ -68,6 +115,11 @@ def config(
     cookie_config: CookieConfig,
     postgres_config: PostgresConfig,
     redis_config: RedisConfig,
+    parser_config: ParserConfig,
+    http_cache_config: HttpCacheConfig,
+    server_config: ServerConfig,
+    search_history_config: SearchHistoryConfig,
+    refresh_token_config: RefreshTokenConfig,
 ) -> Config:
     return Config(
         app=app_config,
@@ -75,4 +127,9 @@ def config(
         cookie=cookie_config,
         postgres=postgres_config,
         redis=redis_config,
+        parser=parser_config,
+        http_cache=http_cache_config,
+        server=server_config,
+        search_history=search_history_config,
+        refresh_token=refresh_token_config,
     )
@@ -4,6 +4,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from isp_compare.models.provider import Provider
 from isp_compare.models.review import Review
 from isp_compare.models.user import User
+from isp_compare.repositories.provider import ProviderRepository
+
+
+async def _sync_provider_stats(session: AsyncSession) -> None:
+    # Отзывы добавляются в обход ReviewService, поэтому пересчитываем
+    # счетчики провайдеров так же, как это делает команда восстановления.
+    await ProviderRepository(session=session).recalculate_review_stats()
+    await session.commit()
 
 
 @pytest.fixture
@@ -18,6 +26,7 @@ async def review(
     )
     session.add(test_review)
     await session.commit()
+    await _sync_provider_stats(session)
     return test_review
 
 
@@ -33,6 +42,7 @@ async def review_2(
     )
     session.add(test_review)
     await session.commit()
+    await _sync_provider_stats(session)
     return test_review
 
 
@@ -72,4 +82,5 @@ async def reviews(
 
     session.add_all(test_reviews)
     await session.commit()
+    await _sync_provider_stats(session)
     return test_reviews
@@ -0,0 +1,65 @@
+import importlib.util
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from isp_compare.core.config import Config
+from isp_compare.core.exceptions import TokenRevokedException
+from isp_compare.models import User
+from isp_compare.models.token import RefreshToken
+from tests.utils import check_response
+
+pytestmark = pytest.mark.skipif(
+    importlib.util.find_spec("lupa") is None, reason="fakeredis[lua] is required"
+)
+
+
+@pytest.fixture
+def config(config: Config) -> Config:
+    refresh_token = config.refresh_token.model_copy(update={"store": "redis"})
+    return config.model_copy(update={"refresh_token": refresh_token})
+
+
+async def test_refresh_token_rotation(
+    client: AsyncClient, session: AsyncSession, regular_user: User
+) -> None:
+    login_response = await client.post(
+        "/auth/login",
+        json={"username": regular_user.username, "password": "Password123!"},
+    )
+    check_response(login_response, 200)
+    first_token = login_response.cookies["refresh_token"]
+
+    refresh_response = await client.post("/auth/refresh")
+    check_response(refresh_response, 200)
+    assert refresh_response.cookies["refresh_token"] != first_token
+
+    tokens_in_db = await session.scalar(select(func.count()).select_from(RefreshToken))
+    assert tokens_in_db == 0
+
+
+async def test_refresh_token_reuse_revokes_session(
+    client: AsyncClient, regular_user: User
+) -> None:
+    login_response = await client.post(
+        "/auth/login",
+        json={"username": regular_user.username, "password": "Password123!"},
+    )
+    stolen_token = login_response.cookies["refresh_token"]
+    refresh_response = await client.post("/auth/refresh")
+    check_response(refresh_response, 200)
+
+    reuse_response = await client.post(
+        "/auth/refresh", cookies={"refresh_token": stolen_token}
+    )
+    check_response(reuse_response, 401, expected_detail=TokenRevokedException.detail)
+
+    # Токен, выданный при ротации, отозван вместе с остальными
+    client.cookies.clear()
+    next_response = await client.post(
+        "/auth/refresh",
+        cookies={"refresh_token": refresh_response.cookies["refresh_token"]},
+    )
+    check_response(next_response, 401, expected_detail=TokenRevokedException.detail)
@@ -0,0 +1,88 @@
+from collections.abc import AsyncGenerator, Callable
+from typing import Any
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from isp_compare.core.config import PostgresConfig
+from isp_compare.core.di.providers.database import create_engine
+from isp_compare.models.provider import Provider
+
+EngineFactory = Callable[..., AsyncEngine]
+
+
+def emulate_transaction_pooling(engine: AsyncEngine) -> None:
+    # Замена PgBouncer: каждое взятие соединения из пула выглядит как
+    # переход на другое серверное соединение, где наших подготовленных
+    # выражений нет
+    def on_checkout(dbapi_connection: Any, *_: Any) -> None:
+        dbapi_connection.run_async(lambda conn: conn.execute("DEALLOCATE ALL"))
+
+    event.listen(engine.sync_engine.pool, "checkout", on_checkout)
+
+
+@pytest.fixture
+async def engine_factory(
+    postgres_config: PostgresConfig,
+) -> AsyncGenerator[EngineFactory]:
+    engines: list[AsyncEngine] = []
+
+    def factory(*, transaction_pooling: bool) -> AsyncEngine:
+        config = postgres_config.model_copy(
+            update={
+                "pool_size": 1,
+                "max_overflow": 0,
+                "transaction_pooling": transaction_pooling,
+            }
+        )
+        engine = create_engine(config, config.build_dsn())
+        emulate_transaction_pooling(engine)
+        engines.append(engine)
+        return engine
+
+    yield factory
+
+    for engine in engines:
+        await engine.dispose()
+
+
+async def run_transactions(engine: AsyncEngine, provider: Provider) -> None:
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    for _ in range(3):
+        async with session_maker() as session:
+            result = await session.scalar(
+                select(Provider.name).where(Provider.id == provider.id)
+            )
+            await session.commit()
+            assert result == provider.name
+
+
+async def test_prepared_statements_break_without_transaction_pooling(
+    engine_factory: EngineFactory, provider: Provider
+) -> None:
+    engine = engine_factory(transaction_pooling=False)
+
+    with pytest.raises(DBAPIError, match="prepared statement"):
+        await run_transactions(engine, provider)
+
+
+async def test_transaction_pooling_mode(
+    engine_factory: EngineFactory, provider: Provider
+) -> None:
+    engine = engine_factory(transaction_pooling=True)
+
+    await run_transactions(engine, provider)
+
+
+async def test_transaction_pooling_statement_names_are_unique(
+    postgres_config: PostgresConfig,
+) -> None:
+    config = postgres_config.model_copy(update={"transaction_pooling": True})
+    connect_args = config.build_connect_args()
+
+    name_func = connect_args["prepared_statement_name_func"]
+    assert name_func() != name_func()
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
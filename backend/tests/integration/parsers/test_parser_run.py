@@ -0,0 +1,53 @@
+import json
+
+from httpx import AsyncClient
+from redis.asyncio import Redis
+
+from isp_compare.core.exceptions import AdminAccessDeniedException
+from isp_compare.parsers import PARSERS
+from isp_compare.services.parser_scheduler import PARSER_QUEUE_KEY
+from tests.utils import check_response
+
+
+async def test_run_parser_enqueues_job(
+    admin_client: AsyncClient, redis_client: Redis
+) -> None:
+    response = await admin_client.post("/parsers/run/Билайн")
+    data = check_response(response, 202)
+
+    assert data["providers"] == ["Билайн"]
+
+    queued_jobs = await redis_client.lrange(PARSER_QUEUE_KEY, 0, -1)
+    assert len(queued_jobs) == 1
+    assert json.loads(queued_jobs[0]) == {
+        "job_id": data["job_id"],
+        "providers": ["Билайн"],
+    }
+
+
+async def test_run_parser_unsupported_provider(
+    admin_client: AsyncClient, redis_client: Redis
+) -> None:
+    response = await admin_client.post("/parsers/run/Unknown")
+    check_response(response, 400, expected_detail="Неподдерживаемый провайдер")
+
+    assert await redis_client.llen(PARSER_QUEUE_KEY) == 0
+
+
+async def test_run_parser_as_regular_user(
+    auth_client: AsyncClient, redis_client: Redis
+) -> None:
+    response = await auth_client.post("/parsers/run/Билайн")
+    check_response(response, 403, expected_detail=AdminAccessDeniedException.detail)
+
+    assert await redis_client.llen(PARSER_QUEUE_KEY) == 0
+
+
+async def test_run_all_parsers_enqueues_single_job(
+    admin_client: AsyncClient, redis_client: Redis
+) -> None:
+    response = await admin_client.post("/parsers/run-all")
+    data = check_response(response, 202)
+
+    assert data["providers"] == list(PARSERS)
+    assert await redis_client.llen(PARSER_QUEUE_KEY) == 1
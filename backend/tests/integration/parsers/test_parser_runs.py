@@ -0,0 +1,94 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from isp_compare.core.exceptions import AdminAccessDeniedException
+from isp_compare.models.parser_run import ParserRun, ParserRunStatus
+from tests.utils import check_response
+
+
+@pytest.fixture
+async def parser_runs(session: AsyncSession) -> list[ParserRun]:
+    job_id = uuid.uuid4()
+    started_at = datetime.now(UTC) - timedelta(hours=1)
+    runs = [
+        ParserRun(
+            job_id=job_id,
+            provider_name=provider_name,
+            status=ParserRunStatus.SUCCESS,
+            started_at=started_at + timedelta(minutes=i),
+            finished_at=started_at + timedelta(minutes=i, seconds=30),
+            http_time=1.5 + i,
+            parse_time=0.2,
+            db_time=0.1,
+            items_count=10,
+            errors_count=i,
+            changes_count=10 - i,
+        )
+        for i, provider_name in enumerate(["Ростелеком", "Дом.ru", "Билайн"])
+    ]
+    session.add_all(runs)
+    await session.commit()
+    return runs
+
+
+async def test_get_parser_runs(
+    admin_client: AsyncClient, parser_runs: list[ParserRun]
+) -> None:
+    response = await admin_client.get("/parsers/runs")
+    data = check_response(response, 200)
+
+    assert [run["id"] for run in data] == [str(run.id) for run in parser_runs[::-1]]
+    assert data[0]["provider_name"] == "Билайн"
+    assert data[0]["status"] == ParserRunStatus.SUCCESS
+    assert data[0]["http_time"] == 3.5
+    assert data[0]["errors_count"] == 2
+    assert data[0]["changes_count"] == 8
+
+
+async def test_get_parser_runs_filter_by_provider(
+    admin_client: AsyncClient, parser_runs: list[ParserRun]
+) -> None:
+    response = await admin_client.get(
+        "/parsers/runs", params={"provider_name": "Дом.ru"}
+    )
+    data = check_response(response, 200)
+
+    assert len(data) == 1
+    assert data[0]["id"] == str(parser_runs[1].id)
+
+
+async def test_get_parser_runs_filter_by_job(
+    admin_client: AsyncClient, parser_runs: list[ParserRun]
+) -> None:
+    response = await admin_client.get(
+        "/parsers/runs", params={"job_id": str(parser_runs[0].job_id)}
+    )
+    data = check_response(response, 200)
+    assert len(data) == len(parser_runs)
+
+    response = await admin_client.get(
+        "/parsers/runs", params={"job_id": str(uuid.uuid4())}
+    )
+    data = check_response(response, 200)
+    assert data == []
+
+
+@pytest.mark.parametrize(
+    "params", [{"limit": 0}, {"limit": 101}, {"limit": -1}, {"offset": -1}]
+)
+async def test_get_parser_runs_invalid_pagination(
+    admin_client: AsyncClient, params: dict[str, int]
+) -> None:
+    response = await admin_client.get("/parsers/runs", params=params)
+    check_response(response, 422)
+
+
+async def test_get_parser_runs_as_regular_user(
+    auth_client: AsyncClient, parser_runs: list[ParserRun]
+) -> None:
+    response = await auth_client.get("/parsers/runs")
+    check_response(response, 403, expected_detail=AdminAccessDeniedException.detail)
@@ -0,0 +1,112 @@
+from collections.abc import AsyncIterator
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+from redis.asyncio import Redis
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from isp_compare.core.config import ParserConfig
+from isp_compare.models.parser_run import ParserRun
+from isp_compare.models.provider import Provider
+from isp_compare.models.tariff import Tariff
+from isp_compare.parsers.base import BaseParser
+from isp_compare.repositories.parser_run import ParserRunRepository
+from isp_compare.repositories.provider import ProviderRepository
+from isp_compare.repositories.tariff import TariffRepository
+from isp_compare.schemas.tariff import TariffCreate
+from isp_compare.services.catalog_version import CatalogVersion
+from isp_compare.services.parser_service import ParserService
+from isp_compare.services.transaction_manager import TransactionManager
+
+
+class FakeParser(BaseParser):
+    provider_name = "Test Provider"
+    tariffs_url = "https://testprovider.com/tariffs"
+
+    tariffs: tuple[tuple[str, int], ...] = (
+        ("Tariff 1", 100),
+        ("Tariff 2", 200),
+        ("Tariff 3", 300),
+    )
+
+    async def fetch(self) -> str:
+        return "<html></html>"
+
+    async def parse(self, html: str) -> AsyncIterator[TariffCreate]:  # noqa: ARG002
+        for name, speed in self.tariffs:
+            yield TariffCreate(name=name, price=Decimal(speed), speed=speed)
+
+
+@pytest.fixture
+def parser_service(session: AsyncSession, redis_client: Redis) -> ParserService:
+    service = ParserService(
+        provider_repository=ProviderRepository(session),
+        tariff_repository=TariffRepository(session),
+        parser_run_repository=ParserRunRepository(session),
+        transaction_manager=TransactionManager(session),
+        config=ParserConfig(batch_size=2),
+        catalog_version=CatalogVersion(redis_client),
+    )
+    service._parsers = {FakeParser.provider_name: FakeParser}
+    return service
+
+
+async def get_tariffs(session: AsyncSession, provider_id: UUID) -> dict[str, Tariff]:
+    tariffs = await session.scalars(
+        select(Tariff)
+        .where(Tariff.provider_id == provider_id)
+        .execution_options(populate_existing=True)
+    )
+    return {tariff.name: tariff for tariff in tariffs}
+
+
+async def test_parser_rerun_keeps_tariffs(
+    parser_service: ParserService, session: AsyncSession, provider: Provider
+) -> None:
+    await parser_service.update_provider_tariffs(FakeParser.provider_name)
+    first_run = await get_tariffs(session, provider.id)
+
+    await parser_service.update_provider_tariffs(FakeParser.provider_name)
+    second_run = await get_tariffs(session, provider.id)
+
+    active_count = await session.scalar(
+        select(func.count())
+        .select_from(Tariff)
+        .where(Tariff.provider_id == provider.id, Tariff.is_active)
+    )
+    assert active_count == len(FakeParser.tariffs)
+    assert {name: tariff.id for name, tariff in second_run.items()} == {
+        name: tariff.id for name, tariff in first_run.items()
+    }
+
+    changes = await session.scalars(
+        select(ParserRun.changes_count).order_by(ParserRun.started_at)
+    )
+    assert list(changes) == [len(FakeParser.tariffs), 0]
+
+
+async def test_parser_rerun_applies_changes(
+    parser_service: ParserService,
+    session: AsyncSession,
+    provider: Provider,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    await parser_service.update_provider_tariffs(FakeParser.provider_name)
+    first_run = await get_tariffs(session, provider.id)
+
+    monkeypatch.setattr(
+        FakeParser, "tariffs", (("Tariff 1", 100), ("Tariff 2", 250), ("Tariff 4", 400))
+    )
+    await parser_service.update_provider_tariffs(FakeParser.provider_name)
+    tariffs = await get_tariffs(session, provider.id)
+
+    assert {name for name, tariff in tariffs.items() if tariff.is_active} == {
+        "Tariff 1",
+        "Tariff 2",
+        "Tariff 4",
+    }
+    assert tariffs["Tariff 2"].id == first_run["Tariff 2"].id
+    assert tariffs["Tariff 2"].speed == 250
+    assert not tariffs["Tariff 3"].is_active
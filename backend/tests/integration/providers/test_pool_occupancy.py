@@ -0,0 +1,158 @@
+import asyncio
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+from redis.asyncio import Redis
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from isp_compare.core.config import PostgresConfig
+from isp_compare.core.di.providers.database import create_engine
+from isp_compare.models.provider import Provider
+from isp_compare.repositories.provider import ProviderRepository
+from isp_compare.services.cache import RedisCache
+from isp_compare.services.catalog_version import CatalogVersion
+from isp_compare.services.provider import (
+    ALL_PROVIDERS_CACHE_KEY,
+    PROVIDER_CACHE_KEY,
+    ProviderService,
+)
+from isp_compare.services.transaction_manager import TransactionManager
+
+POOL_SIZE = 2
+
+
+@dataclass
+class PoolOccupancy:
+    checkouts: int = 0
+    current: int = 0
+    peak: int = 0
+
+
+@contextmanager
+def track_pool(engine: AsyncEngine) -> Iterator[PoolOccupancy]:
+    occupancy = PoolOccupancy()
+
+    def on_checkout(*_: Any) -> None:
+        occupancy.checkouts += 1
+        occupancy.current += 1
+        occupancy.peak = max(occupancy.peak, occupancy.current)
+
+    def on_checkin(*_: Any) -> None:
+        occupancy.current -= 1
+
+    event.listen(engine.sync_engine.pool, "checkout", on_checkout)
+    event.listen(engine.sync_engine.pool, "checkin", on_checkin)
+    try:
+        yield occupancy
+    finally:
+        event.remove(engine.sync_engine.pool, "checkout", on_checkout)
+        event.remove(engine.sync_engine.pool, "checkin", on_checkin)
+
+
+@pytest.fixture
+async def pool_engine(
+    postgres_config: PostgresConfig,
+) -> AsyncGenerator[AsyncEngine]:
+    config = postgres_config.model_copy(
+        update={"pool_size": POOL_SIZE, "max_overflow": 0, "pool_timeout": 5}
+    )
+    engine = create_engine(config, config.build_dsn())
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def request_session_maker(
+    pool_engine: AsyncEngine,
+) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(bind=pool_engine, expire_on_commit=False)
+
+
+async def handle_request(
+    session_maker: async_sessionmaker[AsyncSession],
+    redis_client: Redis,
+    provider_id: Any = None,
+) -> None:
+    async with session_maker() as session:
+        service = ProviderService(
+            provider_repository=ProviderRepository(session=session),
+            cache=RedisCache(redis_client),
+            transaction_manager=TransactionManager(session=session),
+            catalog_version=CatalogVersion(redis_client),
+        )
+        if provider_id is None:
+            await service.get_all_providers_json()
+        else:
+            await service.get_provider(provider_id)
+
+        # Остаток обработки (сериализация, отправка ответа) идет
+        # уже без соединения с БД
+        assert not session.in_transaction()
+        await asyncio.sleep(0.01)
+
+
+async def run_mixed_load(
+    session_maker: async_sessionmaker[AsyncSession],
+    redis_client: Redis,
+    providers: list[Provider],
+    rounds: int = 10,
+) -> None:
+    requests = []
+    for _ in range(rounds):
+        requests.append(handle_request(session_maker, redis_client))
+        requests.extend(
+            handle_request(session_maker, redis_client, provider.id)
+            for provider in providers
+        )
+    await asyncio.gather(*requests)
+
+
+async def warm_cache(
+    session_maker: async_sessionmaker[AsyncSession],
+    redis_client: Redis,
+    providers: list[Provider],
+) -> None:
+    await handle_request(session_maker, redis_client)
+    for provider in providers:
+        await handle_request(session_maker, redis_client, provider.id)
+
+
+async def test_cache_hits_do_not_use_connections(
+    request_session_maker: async_sessionmaker[AsyncSession],
+    pool_engine: AsyncEngine,
+    redis_client: Redis,
+    providers: list[Provider],
+) -> None:
+    await warm_cache(request_session_maker, redis_client, providers)
+
+    with track_pool(pool_engine) as occupancy:
+        await run_mixed_load(request_session_maker, redis_client, providers)
+
+    assert occupancy.checkouts == 0
+
+
+async def test_pool_occupancy_under_mixed_load(
+    request_session_maker: async_sessionmaker[AsyncSession],
+    pool_engine: AsyncEngine,
+    redis_client: Redis,
+    providers: list[Provider],
+) -> None:
+    await warm_cache(request_session_maker, redis_client, providers)
+    cache = RedisCache(redis_client)
+    await cache.invalidate(
+        ALL_PROVIDERS_CACHE_KEY,
+        PROVIDER_CACHE_KEY.format(provider_id=providers[0].id),
+    )
+
+    with track_pool(pool_engine) as occupancy:
+        await run_mixed_load(request_session_maker, redis_client, providers)
+
+    # 60 запросов, из них промахи кеша только по двум ключам: каждый
+    # пересчитывается одним запросом, остальные соединение не берут
+    assert 1 <= occupancy.checkouts <= 2
+    assert occupancy.peak <= POOL_SIZE
+    assert occupancy.current == 0
@@ -68,3 +68,21 @@ async def test_get_provider_invalid_id(client: AsyncClient) -> None:
     invalid_id = "not-a-uuid"
     response = await client.get(f"/providers/{invalid_id}")
     check_response(response, 422)
+
+
+async def test_get_provider_reflects_new_review(
+    auth_client: AsyncClient, provider: Provider
+) -> None:
+    response = await auth_client.get(f"/providers/{provider.id}")
+    assert check_response(response, 200)["reviews_count"] == 0
+
+    response = await auth_client.post(
+        f"/providers/{provider.id}/reviews",
+        json={"rating": 4, "comment": "Хорошая скорость."},
+    )
+    check_response(response, 201)
+
+    response = await auth_client.get(f"/providers/{provider.id}")
+    data = check_response(response, 200)
+    assert data["reviews_count"] == 1
+    assert data["rating"] == 4
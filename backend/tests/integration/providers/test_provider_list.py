@@ -42,3 +42,63 @@ async def test_list_providers_as_admin(
 
     assert isinstance(data, list)
     assert len(data) == len(providers)
+
+
+async def test_list_providers_reflects_new_review(
+    auth_client: AsyncClient, provider: Provider
+) -> None:
+    response = await auth_client.get("/providers")
+    data = check_response(response, 200)
+    assert data[0]["reviews_count"] == 0
+
+    response = await auth_client.post(
+        f"/providers/{provider.id}/reviews",
+        json={"rating": 3, "comment": "Нормальный провайдер."},
+    )
+    check_response(response, 201)
+
+    response = await auth_client.get("/providers")
+    data = check_response(response, 200)
+    assert data[0]["reviews_count"] == 1
+    assert data[0]["rating"] == 3
+
+
+async def test_list_providers_served_from_cache(
+    client: AsyncClient, providers: list[Provider]
+) -> None:
+    first = await client.get("/providers")
+    second = await client.get("/providers")
+
+    assert second.headers["content-type"] == "application/json"
+    assert first.content == second.content
+    assert len(check_response(second, 200)) == len(providers)
+
+
+async def test_list_providers_not_modified(
+    client: AsyncClient, providers: list[Provider]
+) -> None:
+    response = await client.get("/providers")
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "public, max-age=60"
+
+    response = await client.get("/providers", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+async def test_list_providers_etag_changes_after_review(
+    auth_client: AsyncClient, provider: Provider
+) -> None:
+    response = await auth_client.get("/providers")
+    etag = response.headers["etag"]
+
+    response = await auth_client.post(
+        f"/providers/{provider.id}/reviews",
+        json={"rating": 5, "comment": "Все отлично."},
+    )
+    check_response(response, 201)
+
+    response = await auth_client.get("/providers", headers={"If-None-Match": etag})
+    check_response(response, 200)
+    assert response.headers["etag"] != etag
@@ -1,8 +1,12 @@
+import pytest
 import uuid
 
 from httpx import AsyncClient
 
-from isp_compare.core.exceptions import ProviderNotFoundException
+from isp_compare.core.exceptions import (
+    InvalidCursorException,
+    ProviderNotFoundException,
+)
 from isp_compare.models.provider import Provider
 from isp_compare.models.review import Review
 from tests.utils import check_response
@@ -37,6 +41,14 @@ async def test_get_provider_reviews_with_limit(
     assert len(data) == limit
 
 
+@pytest.mark.parametrize("params", [{"limit": 0}, {"limit": -1}, {"offset": -1}])
+async def test_get_provider_reviews_invalid_pagination(
+    client: AsyncClient, provider: Provider, params: dict[str, int]
+) -> None:
+    response = await client.get(f"/providers/{provider.id}/reviews", params=params)
+    check_response(response, 422)
+
+
 async def test_get_provider_reviews_with_offset(
     client: AsyncClient, provider: Provider, reviews: list[Review]
 ) -> None:
@@ -71,3 +83,58 @@ async def test_get_provider_reviews_empty_list(
     assert isinstance(data, list)
 
     assert len(data) == 0
+
+
+async def test_get_provider_reviews_with_cursor(
+    client: AsyncClient, provider: Provider, reviews: list[Review]
+) -> None:
+    all_response = await client.get(f"/providers/{provider.id}/reviews")
+    all_ids = [review["id"] for review in check_response(all_response, 200)]
+
+    ids = []
+    params = {"limit": 1}
+    while True:
+        response = await client.get(f"/providers/{provider.id}/reviews", params=params)
+        data = check_response(response, 200)
+        ids.extend(review["id"] for review in data)
+
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if not next_cursor:
+            break
+        params["cursor"] = next_cursor
+
+    assert ids == all_ids
+    assert len(ids) == sum(1 for r in reviews if r.provider_id == provider.id)
+
+
+async def test_get_provider_reviews_invalid_cursor(
+    client: AsyncClient, provider: Provider
+) -> None:
+    response = await client.get(
+        f"/providers/{provider.id}/reviews", params={"cursor": "invalid"}
+    )
+    check_response(response, 400, expected_detail=InvalidCursorException.detail)
+
+
+async def test_get_provider_reviews_cache_invalidated_on_write(
+    auth_client: AsyncClient, provider: Provider, review_2: Review
+) -> None:
+    response = await auth_client.get(f"/providers/{provider.id}/reviews")
+    assert len(check_response(response, 200)) == 1
+
+    review_data = {"rating": 3, "comment": "Новый отзыв после кеширования."}
+    response = await auth_client.post(
+        f"/providers/{provider.id}/reviews", json=review_data
+    )
+    created = check_response(response, 201)
+
+    response = await auth_client.get(f"/providers/{provider.id}/reviews")
+    data = check_response(response, 200)
+    assert [review["id"] for review in data] == [created["id"], str(review_2.id)]
+
+    response = await auth_client.delete(f"/reviews/{created['id']}")
+    check_response(response, 204)
+
+    response = await auth_client.get(f"/providers/{provider.id}/reviews")
+    data = check_response(response, 200)
+    assert [review["id"] for review in data] == [str(review_2.id)]
@@ -110,3 +110,4 @@ async def test_review_creation_updates_provider_rating(
 
     assert updated_rating != initial_rating
     assert updated_rating == 5.0
+    assert updated_provider_data["reviews_count"] == provider_data["reviews_count"] + 1
@@ -61,3 +61,5 @@ async def test_delete_review_updates_provider_rating(
 
     current_rating = updated_provider_data["rating"]
     assert current_rating == 5.0 != initial_rating
+    assert provider_data["reviews_count"] == 2
+    assert updated_provider_data["reviews_count"] == 1
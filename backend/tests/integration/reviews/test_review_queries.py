@@ -0,0 +1,131 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from redis.asyncio import Redis
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from isp_compare.models.provider import Provider
+from isp_compare.models.review import Review
+from isp_compare.models.user import User
+from isp_compare.repositories.provider import ProviderRepository
+from isp_compare.repositories.review import ReviewRepository
+from isp_compare.schemas.review import ReviewCreate, ReviewUpdate
+from isp_compare.services.cache import RedisCache
+from isp_compare.services.catalog_version import CatalogVersion
+from isp_compare.services.identity_provider import IdentityProvider
+from isp_compare.services.review import ReviewService
+from isp_compare.services.transaction_manager import TransactionManager
+
+
+@dataclass
+class QueryCounter:
+    statements: int = 0
+    commits: int = 0
+
+
+@contextmanager
+def count_queries(engine: AsyncEngine, session: AsyncSession) -> Iterator[QueryCounter]:
+    counter = QueryCounter()
+
+    def on_execute(*_: Any) -> None:
+        counter.statements += 1
+
+    def on_commit(*_: Any) -> None:
+        counter.commits += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", on_execute)
+    event.listen(session.sync_session, "after_commit", on_commit)
+    try:
+        yield counter
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", on_execute)
+        event.remove(session.sync_session, "after_commit", on_commit)
+
+
+@pytest.fixture
+def review_service(
+    session: AsyncSession, regular_user: User, redis_client: Redis
+) -> ReviewService:
+    identity_provider = AsyncMock(spec=IdentityProvider)
+    identity_provider.get_current_user.return_value = regular_user
+
+    return ReviewService(
+        review_repository=ReviewRepository(session=session),
+        provider_repository=ProviderRepository(session=session),
+        transaction_manager=TransactionManager(session=session),
+        identity_provider=identity_provider,
+        cache=RedisCache(redis_client),
+        catalog_version=CatalogVersion(redis_client),
+    )
+
+
+async def test_create_review_queries(
+    engine: AsyncEngine,
+    session: AsyncSession,
+    review_service: ReviewService,
+    provider: Provider,
+) -> None:
+    data = ReviewCreate(rating=5, comment="Стабильное подключение.")
+
+    with count_queries(engine, session) as counter:
+        await review_service.create_review(provider.id, data)
+
+    # провайдер, существующий отзыв, INSERT отзыва, UPDATE счетчиков
+    assert counter.statements == 4
+    assert counter.commits == 1
+
+
+async def test_create_review_over_existing_queries(
+    engine: AsyncEngine,
+    session: AsyncSession,
+    review_service: ReviewService,
+    provider: Provider,
+    review: Review,
+) -> None:
+    data = ReviewCreate(rating=2, comment="Стало хуже.")
+
+    with count_queries(engine, session) as counter:
+        result = await review_service.create_review(provider.id, data)
+
+    assert result.id == review.id
+    assert result.rating == data.rating
+    # провайдер, существующий отзыв, UPDATE отзыва, UPDATE счетчиков
+    assert counter.statements == 4
+    assert counter.commits == 1
+
+
+async def test_update_review_queries(
+    engine: AsyncEngine,
+    session: AsyncSession,
+    review_service: ReviewService,
+    review: Review,
+) -> None:
+    data = ReviewUpdate(rating=1)
+
+    with count_queries(engine, session) as counter:
+        result = await review_service.update_review(review.id, data)
+
+    assert result.rating == data.rating
+    assert result.user.id == review.user_id
+    # отзыв с автором FOR UPDATE, UPDATE отзыва, UPDATE счетчиков
+    assert counter.statements == 3
+    assert counter.commits == 1
+
+
+async def test_delete_review_queries(
+    engine: AsyncEngine,
+    session: AsyncSession,
+    review_service: ReviewService,
+    review: Review,
+) -> None:
+    with count_queries(engine, session) as counter:
+        await review_service.delete_review(review.id)
+
+    # отзыв с автором FOR UPDATE, UPDATE счетчиков, DELETE отзыва
+    assert counter.statements == 3
+    assert counter.commits == 1
@@ -1,6 +1,9 @@
 import uuid
 
+import pytest
+from faker import Faker
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from isp_compare.core.exceptions import (
     InvalidTokenException,
@@ -8,6 +11,8 @@ from isp_compare.core.exceptions import (
 )
 from isp_compare.models import Provider
 from isp_compare.models.review import Review
+from isp_compare.models.user import User
+from isp_compare.repositories.provider import ProviderRepository
 from tests.utils import check_response
 
 
@@ -46,17 +51,53 @@ async def test_update_review_unauthorized(client: AsyncClient, review: Review) -
     check_response(response, 401, expected_detail=InvalidTokenException.detail)
 
 
+@pytest.fixture
+async def detached_review(
+    session_maker: async_sessionmaker[AsyncSession], provider: Provider, faker: Faker
+) -> Review:
+    # Автор и отзыв создаются в отдельной сессии, чтобы сессия запроса
+    # не держала автора в identity map
+    async with session_maker() as other_session:
+        author = User(
+            fullname=faker.name(),
+            username=faker.unique.user_name(),
+            hashed_password="-",
+            email=faker.unique.email(),
+        )
+        other_session.add(author)
+        await other_session.flush()
+        test_review = Review(
+            user_id=author.id,
+            provider_id=provider.id,
+            rating=4,
+            comment="Отзыв другого пользователя.",
+        )
+        other_session.add(test_review)
+        await other_session.flush()
+        await ProviderRepository(session=other_session).recalculate_review_stats()
+        await other_session.commit()
+        test_review.user = author
+    return test_review
+
+
 async def test_update_review_not_owner(
-    admin_client: AsyncClient, review: Review
+    admin_client: AsyncClient, detached_review: Review
 ) -> None:
     update_data = {"rating": 5, "comment": "Администратор изменил отзыв."}
 
-    response = await admin_client.patch(f"/reviews/{review.id}", json=update_data)
+    response = await admin_client.patch(
+        f"/reviews/{detached_review.id}", json=update_data
+    )
     data = check_response(response, 200)
 
-    assert data["id"] == str(review.id)
+    assert data["id"] == str(detached_review.id)
     assert data["rating"] == update_data["rating"]
     assert data["comment"] == update_data["comment"]
+    assert data["user"] == {
+        "id": str(detached_review.user.id),
+        "username": detached_review.user.username,
+        "fullname": detached_review.user.fullname,
+    }
 
 
 async def test_update_review_not_found(auth_client: AsyncClient) -> None:
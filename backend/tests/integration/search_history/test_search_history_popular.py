@@ -0,0 +1,56 @@
+from datetime import UTC, datetime
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from isp_compare.core.exceptions import AdminAccessDeniedException
+from isp_compare.models.popular_search import PopularSearch
+from tests.utils import check_response
+
+
+@pytest.fixture
+async def popular_searches(session: AsyncSession) -> list[PopularSearch]:
+    searches = [
+        PopularSearch(
+            filters={"min_speed": 100},
+            searches_count=3,
+            last_searched_at=datetime.now(UTC),
+        ),
+        PopularSearch(
+            filters={"has_tv": True, "max_price": "600"},
+            searches_count=7,
+            last_searched_at=datetime.now(UTC),
+        ),
+    ]
+    session.add_all(searches)
+    await session.commit()
+    return searches
+
+
+async def test_get_popular_searches(
+    admin_client: AsyncClient, popular_searches: list[PopularSearch]
+) -> None:
+    response = await admin_client.get("/search-history/popular", params={"limit": 1})
+    data = check_response(response, 200)
+
+    assert len(data) == 1
+    assert data[0]["filters"] == {"has_tv": True, "max_price": "600"}
+    assert data[0]["searches_count"] == 7
+
+
+async def test_get_popular_searches_as_regular_user(
+    auth_client: AsyncClient, popular_searches: list[PopularSearch]
+) -> None:
+    response = await auth_client.get("/search-history/popular")
+    check_response(response, 403, expected_detail=AdminAccessDeniedException.detail)
+
+
+@pytest.mark.parametrize("limit", [0, -1, 51])
+async def test_get_popular_searches_invalid_limit(
+    admin_client: AsyncClient, limit: int
+) -> None:
+    response = await admin_client.get(
+        "/search-history/popular", params={"limit": limit}
+    )
+    check_response(response, 422)
@@ -0,0 +1,18 @@
+from httpx import AsyncClient
+
+from isp_compare.core.exceptions import AdminAccessDeniedException
+from tests.utils import check_response
+
+
+async def test_get_db_pool_stats(admin_client: AsyncClient) -> None:
+    response = await admin_client.get("/system/db-pool")
+    data = check_response(response, 200)
+
+    assert [pool["name"] for pool in data] == ["primary"]
+    assert data[0]["max_connections"] == 15
+    assert data[0]["checked_out"] >= 0
+
+
+async def test_get_db_pool_stats_as_regular_user(auth_client: AsyncClient) -> None:
+    response = await auth_client.get("/system/db-pool")
+    check_response(response, 403, expected_detail=AdminAccessDeniedException.detail)
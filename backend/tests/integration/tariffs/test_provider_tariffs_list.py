@@ -75,3 +75,16 @@ async def test_get_provider_tariffs_provider_not_found(client: AsyncClient) -> N
 
     response = await client.get(f"/providers/{non_existent_id}/tariffs")
     check_response(response, 404, expected_detail=ProviderNotFoundException.detail)
+
+
+async def test_get_provider_tariffs_not_modified(
+    client: AsyncClient, tariffs: list[Tariff], provider: Provider
+) -> None:
+    response = await client.get(f"/providers/{provider.id}/tariffs")
+    etag = response.headers["etag"]
+
+    response = await client.get(
+        f"/providers/{provider.id}/tariffs", headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == 304
@@ -25,6 +25,18 @@ async def test_get_tariff_success(client: AsyncClient, tariff: Tariff) -> None:
     assert data["provider_id"] == str(tariff.provider_id)
 
 
+async def test_get_tariff_not_modified(client: AsyncClient, tariff: Tariff) -> None:
+    response = await client.get(f"/tariffs/{tariff.id}")
+    etag = response.headers["etag"]
+
+    response = await client.get(
+        f"/tariffs/{tariff.id}", headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+
+
 async def test_get_tariff_not_found(client: AsyncClient) -> None:
     non_existent_id = str(uuid.uuid4())
     response = await client.get(f"/tariffs/{non_existent_id}")
@@ -1,6 +1,8 @@
 from httpx import AsyncClient
+from redis.asyncio import Redis
 
 from isp_compare.models.tariff import Tariff
+from isp_compare.services.catalog_version import CatalogVersion
 from tests.utils import check_response
 
 
@@ -47,3 +49,42 @@ async def test_get_all_tariffs_with_offset(
 
         for i in range(min(len(data), len(all_data) - offset)):
             assert data[i]["id"] == all_data[i + offset]["id"]
+
+
+async def test_get_all_tariffs_cache_headers(
+    client: AsyncClient, tariffs: list[Tariff]
+) -> None:
+    response = await client.get("/tariffs")
+    check_response(response, 200)
+
+    assert response.headers["etag"].startswith('"catalog-')
+    assert response.headers["cache-control"] == "public, max-age=60"
+
+
+async def test_get_all_tariffs_not_modified(
+    client: AsyncClient, tariffs: list[Tariff]
+) -> None:
+    response = await client.get("/tariffs")
+    etag = response.headers["etag"]
+
+    response = await client.get("/tariffs", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    response = await client.get("/tariffs", headers={"If-None-Match": f"W/{etag}"})
+    assert response.status_code == 304
+
+
+async def test_get_all_tariffs_modified_after_catalog_change(
+    client: AsyncClient, tariffs: list[Tariff], redis_client: Redis
+) -> None:
+    response = await client.get("/tariffs")
+    etag = response.headers["etag"]
+
+    await CatalogVersion(redis_client).bump()
+
+    response = await client.get("/tariffs", headers={"If-None-Match": etag})
+    check_response(response, 200)
+    assert response.headers["etag"] != etag
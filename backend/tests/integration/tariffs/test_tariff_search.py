@@ -1,6 +1,8 @@
+from dishka import AsyncContainer
 from httpx import AsyncClient
 
 from isp_compare.models.tariff import Tariff
+from isp_compare.services.search_history_recorder import SearchHistoryRecorder
 from tests.utils import check_response
 
 
@@ -123,7 +125,7 @@ async def test_search_tariffs_invalid_params(auth_client: AsyncClient) -> None:
 
 
 async def test_search_tariffs_creates_history(
-    auth_client: AsyncClient, tariffs: list[Tariff]
+    auth_client: AsyncClient, container: AsyncContainer, tariffs: list[Tariff]
 ) -> None:
     initial_response = await auth_client.get("/search-history")
     initial_data = initial_response.json()
@@ -136,6 +138,8 @@ async def test_search_tariffs_creates_history(
     }
 
     await auth_client.get("/tariffs/search", params=search_params)
+    recorder = await container.get(SearchHistoryRecorder)
+    await recorder.flush()
 
     history_response = await auth_client.get("/search-history")
     history_data = history_response.json()
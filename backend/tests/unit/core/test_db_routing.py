@@ -0,0 +1,221 @@
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from isp_compare.core.config import PostgresConfig
+from isp_compare.core.db_routing import (
+    PRIMARY_STICKY_COOKIE,
+    REPLICA_ENGINES_KEY,
+    ReplicaRoutingMiddleware,
+    RoutingSession,
+    replica_reads,
+)
+from isp_compare.models.provider import Provider
+
+
+@pytest.fixture
+async def replica_engine(
+    engine: AsyncEngine, postgres_config: PostgresConfig
+) -> AsyncGenerator[AsyncEngine]:
+    # Вместо реплики - отдельный engine к той же тестовой базе
+    replica = create_async_engine(postgres_config.build_dsn())
+    yield replica
+    await replica.dispose()
+
+
+@pytest.fixture
+async def routing_session(
+    engine: AsyncEngine, replica_engine: AsyncEngine
+) -> AsyncGenerator[AsyncSession]:
+    session_maker = async_sessionmaker(
+        bind=engine,
+        sync_session_class=RoutingSession,
+        expire_on_commit=False,
+        info={REPLICA_ENGINES_KEY: [replica_engine.sync_engine]},
+    )
+    async with session_maker() as session:
+        yield session
+
+
+@contextmanager
+def count_statements(engine: AsyncEngine) -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def on_execute(_conn: Any, _cursor: Any, statement: str, *_: Any) -> None:
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", on_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", on_execute)
+
+
+@contextmanager
+def replica_reads_enabled() -> Iterator[None]:
+    token = replica_reads.set(True)
+    try:
+        yield
+    finally:
+        replica_reads.reset(token)
+
+
+async def test_reads_go_to_primary_by_default(
+    engine: AsyncEngine,
+    replica_engine: AsyncEngine,
+    routing_session: AsyncSession,
+    provider: Provider,
+) -> None:
+    with count_statements(engine) as primary, count_statements(replica_engine) as rep:
+        await routing_session.scalar(select(Provider).where(Provider.id == provider.id))
+
+    assert primary
+    assert not rep
+
+
+async def test_reads_go_to_replica(
+    engine: AsyncEngine,
+    replica_engine: AsyncEngine,
+    routing_session: AsyncSession,
+    provider: Provider,
+) -> None:
+    with (
+        replica_reads_enabled(),
+        count_statements(engine) as primary,
+        count_statements(replica_engine) as rep,
+    ):
+        result = await routing_session.scalar(
+            select(Provider).where(Provider.id == provider.id)
+        )
+
+    assert result is not None
+    assert result.id == provider.id
+    assert rep
+    assert not primary
+
+
+async def test_locking_reads_go_to_primary(
+    engine: AsyncEngine,
+    replica_engine: AsyncEngine,
+    routing_session: AsyncSession,
+    provider: Provider,
+) -> None:
+    with (
+        replica_reads_enabled(),
+        count_statements(engine) as primary,
+        count_statements(replica_engine) as rep,
+    ):
+        await routing_session.scalar(
+            select(Provider).where(Provider.id == provider.id).with_for_update()
+        )
+
+    assert primary
+    assert not rep
+
+
+async def test_reads_after_write_go_to_primary(
+    engine: AsyncEngine,
+    replica_engine: AsyncEngine,
+    routing_session: AsyncSession,
+    provider: Provider,
+) -> None:
+    with (
+        replica_reads_enabled(),
+        count_statements(engine) as primary,
+        count_statements(replica_engine) as rep,
+    ):
+        db_provider = await routing_session.get(Provider, provider.id)
+        assert db_provider is not None
+        db_provider.description = "Обновленное описание"
+        await routing_session.flush()
+        reads_before_write = len(rep)
+
+        result = await routing_session.scalar(
+            select(Provider.description).where(Provider.id == provider.id)
+        )
+        await routing_session.rollback()
+
+    assert reads_before_write == 1
+    assert len(rep) == reads_before_write
+    assert result == "Обновленное описание"
+    assert any(statement.startswith("UPDATE") for statement in primary)
+
+
+@pytest.fixture
+def routing_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/read")
+    async def read() -> dict[str, bool]:
+        return {"replica": replica_reads.get()}
+
+    @app.get("/read/{item_id}")
+    async def read_item(item_id: int) -> dict[str, bool]:
+        return {"replica": replica_reads.get()}
+
+    @app.get("/private")
+    async def private() -> dict[str, bool]:
+        return {"replica": replica_reads.get()}
+
+    @app.post("/write")
+    async def write() -> dict[str, bool]:
+        return {"replica": replica_reads.get()}
+
+    app.add_middleware(
+        ReplicaRoutingMiddleware, sticky_seconds=5, read_prefixes=("/read",)
+    )
+    return app
+
+
+@pytest.fixture
+async def routing_client(routing_app: FastAPI) -> AsyncGenerator[AsyncClient]:
+    async with AsyncClient(
+        transport=ASGITransport(app=routing_app), base_url="http://test"
+    ) as client:
+        yield client
+
+
+async def test_middleware_routes_reads_to_replica(
+    routing_client: AsyncClient,
+) -> None:
+    response = await routing_client.get("/read")
+
+    assert response.json() == {"replica": True}
+    assert PRIMARY_STICKY_COOKIE not in response.cookies
+
+    response = await routing_client.get("/read/1")
+
+    assert response.json() == {"replica": True}
+
+
+async def test_middleware_keeps_other_reads_on_primary(
+    routing_client: AsyncClient,
+) -> None:
+    response = await routing_client.get("/private")
+
+    assert response.json() == {"replica": False}
+
+
+async def test_middleware_sticks_to_primary_after_write(
+    routing_client: AsyncClient,
+) -> None:
+    write_response = await routing_client.post("/write")
+
+    assert write_response.json() == {"replica": False}
+    assert write_response.cookies[PRIMARY_STICKY_COOKIE] == "1"
+    assert "Max-Age=5" in write_response.headers["set-cookie"]
+
+    response = await routing_client.get("/read")
+
+    assert response.json() == {"replica": False}
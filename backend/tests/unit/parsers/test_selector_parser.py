@@ -0,0 +1,145 @@
+from decimal import Decimal
+
+import pytest
+
+from isp_compare.parsers import (
+    PARSERS,
+    BaseParser,
+    ParserFactory,
+    ParserSpec,
+    SelectorSpec,
+)
+from isp_compare.parsers.providers import BEELINE, DOMRU, ROSTELECOM
+from isp_compare.schemas.tariff import TariffCreate
+
+SPEC = ParserSpec(
+    provider_name="Test Provider",
+    base_url="https://testprovider.com",
+    tariffs_url="https://testprovider.com/tariffs",
+    selectors=SelectorSpec(
+        card=".card",
+        name=".name",
+        price=".price",
+        speed=".speed",
+        description=".desc",
+        features=".features",
+        link="a.more",
+        promo_price=".promo .promo-price",
+        promo_period=".promo .promo-period",
+    ),
+)
+
+HTML = """
+<div class="card">
+    <h3 class="name"> Домашний 100 </h3>
+    <div class="speed">100 Мбит/с</div>
+    <div class="price">650 ₽/мес</div>
+    <p class="desc">Интернет и ТВ</p>
+    <ul class="features"><li>Телевидение</li><li>Роутер</li></ul>
+    <div class="promo">
+        <span class="promo-price">325,50 ₽</span>
+        <span class="promo-period">2 месяца</span>
+    </div>
+    <a class="more" href="/tariffs/100">Подробнее</a>
+</div>
+<div class="card">
+    <h3 class="name">Домашний 500</h3>
+    <div class="speed">500 Мбит/с</div>
+    <div class="price">900 ₽/мес</div>
+    <p class="desc">Домашний телефон в подарок</p>
+    <ul class="features"><li>Телефон</li></ul>
+</div>
+<div class="card">
+    <h3 class="name">Сломанная карточка</h3>
+</div>
+"""
+
+
+async def parse_all(parser: BaseParser, html: str) -> list[TariffCreate]:
+    return [tariff async for tariff in parser.parse(html)]
+
+
+async def test_parse_extracts_all_fields() -> None:
+    parser = ParserFactory(SPEC)()
+
+    tariffs = await parse_all(parser, HTML)
+
+    assert len(tariffs) == 2
+    assert parser.errors_count == 1
+
+    first, second = tariffs
+    assert first.name == "Домашний 100"
+    assert first.description == "Интернет и ТВ"
+    assert first.price == Decimal("650")
+    assert first.speed == 100
+    assert first.has_tv is True
+    assert first.has_phone is False
+    assert first.promo_price == Decimal("325.5")
+    assert first.promo_period == 2
+    assert first.url == "https://testprovider.com/tariffs/100"
+
+    assert second.has_tv is False
+    assert second.has_phone is True
+    assert second.promo_price is None
+    assert second.promo_period is None
+    assert second.url is None
+
+
+async def test_parse_without_features_selector_uses_card_text() -> None:
+    selectors = SelectorSpec(
+        card=".card",
+        name=".name",
+        price=".price",
+        speed=".speed",
+        description=".desc",
+        link="a.more",
+        promo_price=".promo .promo-price",
+        promo_period=".promo .promo-period",
+    )
+    spec = ParserSpec(
+        provider_name=SPEC.provider_name,
+        base_url=SPEC.base_url,
+        tariffs_url=SPEC.tariffs_url,
+        selectors=selectors,
+    )
+
+    tariffs = await parse_all(ParserFactory(spec)(), HTML)
+
+    # Без отдельного блока признаков учитывается описание карточки
+    assert tariffs[1].has_phone is True
+    assert tariffs[0].has_tv is True
+
+
+async def test_parse_takes_first_match_in_document_order() -> None:
+    html = """
+    <div class="card">
+        <span class="name">Первый</span><span class="name">Второй</span>
+        <div class="price">100</div><div class="speed">50</div>
+        <div class="desc">Описание</div><div class="features"></div>
+    </div>
+    """
+
+    tariffs = await parse_all(ParserFactory(SPEC)(), html)
+
+    assert tariffs[0].name == "Первый"
+
+
+async def test_factory_creates_independent_parsers() -> None:
+    factory = ParserFactory(SPEC)
+    first, second = factory(), factory()
+
+    await parse_all(first, HTML)
+
+    assert first is not second
+    assert second.errors_count == 0
+    assert first.provider_name == SPEC.provider_name
+    assert first.tariffs_url == SPEC.tariffs_url
+
+
+@pytest.mark.parametrize("spec", [ROSTELECOM, DOMRU, BEELINE])
+async def test_provider_specs_registered(spec: ParserSpec) -> None:
+    parser = PARSERS[spec.provider_name]()
+
+    assert parser.provider_name == spec.provider_name
+    assert parser.headers == spec.headers
+    assert await parse_all(parser, "<html></html>") == []
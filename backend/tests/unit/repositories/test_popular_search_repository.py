@@ -0,0 +1,70 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from isp_compare.repositories.popular_search import PopularSearchRepository
+
+
+@pytest.fixture
+async def popular_search_repository(session: AsyncSession) -> PopularSearchRepository:
+    return PopularSearchRepository(session=session)
+
+
+async def test_increment_creates_and_updates(
+    session: AsyncSession, popular_search_repository: PopularSearchRepository
+) -> None:
+    searched_at = datetime.now(UTC)
+
+    await popular_search_repository.increment(
+        [
+            {
+                "filters": {"min_speed": 100, "has_tv": True},
+                "searches_count": 2,
+                "last_searched_at": searched_at,
+            },
+            {
+                "filters": {"max_price": "500"},
+                "searches_count": 1,
+                "last_searched_at": searched_at,
+            },
+        ]
+    )
+    await popular_search_repository.increment(
+        [
+            {
+                "filters": {"has_tv": True, "min_speed": 100},
+                "searches_count": 3,
+                "last_searched_at": searched_at - timedelta(minutes=1),
+            },
+        ]
+    )
+    await session.commit()
+
+    result = await popular_search_repository.get_top(10)
+
+    assert [(item.filters, item.searches_count) for item in result] == [
+        ({"min_speed": 100, "has_tv": True}, 5),
+        ({"max_price": "500"}, 1),
+    ]
+    assert result[0].last_searched_at == searched_at
+
+
+async def test_get_top_limit(
+    session: AsyncSession, popular_search_repository: PopularSearchRepository
+) -> None:
+    await popular_search_repository.increment(
+        [
+            {
+                "filters": {"min_speed": speed},
+                "searches_count": speed,
+                "last_searched_at": datetime.now(UTC),
+            }
+            for speed in (10, 30, 20)
+        ]
+    )
+    await session.commit()
+
+    result = await popular_search_repository.get_top(2)
+
+    assert [item.searches_count for item in result] == [30, 20]
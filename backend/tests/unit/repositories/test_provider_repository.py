@@ -3,9 +3,12 @@ import uuid
 import pytest
 from faker import Faker
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from isp_compare.models.provider import Provider
+from isp_compare.models.review import Review
+from isp_compare.models.user import User
 from isp_compare.repositories.provider import ProviderRepository
 
 
@@ -17,7 +20,7 @@ async def provider_repository(session: AsyncSession) -> ProviderRepository:
 @pytest.fixture
 async def test_provider(session: AsyncSession, faker: Faker) -> Provider:
     provider = Provider(
-        name=faker.company(),
+        name=faker.unique.company(),
         description=faker.paragraph(),
         website=faker.url(),
         phone=faker.phone_number(),
@@ -34,7 +37,7 @@ async def test_providers(session: AsyncSession, faker: Faker) -> list[Provider]:
     providers = []
     for _ in range(3):
         provider = Provider(
-            name=faker.company(),
+            name=faker.unique.company(),
             description=faker.paragraph(),
             website=faker.url(),
             phone=faker.phone_number(),
@@ -51,13 +54,14 @@ async def test_providers(session: AsyncSession, faker: Faker) -> list[Provider]:
 async def test_get_by_id(
     provider_repository: ProviderRepository, test_provider: Provider
 ) -> None:
-    result, reviews_count = await provider_repository.get_by_id(test_provider.id)
+    result = await provider_repository.get_by_id(test_provider.id)
 
     assert result is not None
     assert result.id == test_provider.id
     assert result.name == test_provider.name
     assert result.description == test_provider.description
-    assert reviews_count == 0
+    assert result.reviews_count == 0
+    assert result.rating_sum == 0
 
 
 async def test_get_by_id_not_found(provider_repository: ProviderRepository) -> None:
@@ -67,6 +71,42 @@ async def test_get_by_id_not_found(provider_repository: ProviderRepository) -> N
     assert result is None
 
 
+async def test_exists(
+    provider_repository: ProviderRepository, test_provider: Provider
+) -> None:
+    assert await provider_repository.exists(test_provider.id)
+    assert not await provider_repository.exists(uuid.uuid4())
+
+
+async def test_get_by_name(
+    provider_repository: ProviderRepository, test_providers: list[Provider]
+) -> None:
+    result = await provider_repository.get_by_name(test_providers[1].name)
+
+    assert result is not None
+    assert result.id == test_providers[1].id
+
+
+async def test_get_by_name_not_found(provider_repository: ProviderRepository) -> None:
+    result = await provider_repository.get_by_name("Non-existent Provider")
+
+    assert result is None
+
+
+async def test_name_is_unique(
+    session: AsyncSession, test_provider: Provider, faker: Faker
+) -> None:
+    duplicate = Provider(
+        name=test_provider.name, website=faker.url(), phone=faker.phone_number()
+    )
+    session.add(duplicate)
+
+    with pytest.raises(IntegrityError):
+        await session.flush()
+
+    await session.rollback()
+
+
 async def test_get_all(
     provider_repository: ProviderRepository, test_providers: list[Provider]
 ) -> None:
@@ -74,7 +114,7 @@ async def test_get_all(
 
     assert len(result) == len(test_providers)
 
-    provider_ids = {p[0].id for p in result}
+    provider_ids = {p.id for p in result}
     for provider in test_providers:
         assert provider.id in provider_ids
 
@@ -135,3 +175,105 @@ async def test_update_nonexistent(
     update_data = {"name": faker.company()}
 
     await provider_repository.update(non_existent_id, update_data)
+
+
+async def add_reviews(
+    session: AsyncSession, provider: Provider, ratings: list[int], faker: Faker
+) -> None:
+    for rating in ratings:
+        user = User(
+            fullname=faker.name(),
+            username=faker.unique.user_name(),
+            hashed_password=faker.sha256(),
+            email=faker.unique.email(),
+        )
+        session.add(user)
+        await session.flush()
+
+        session.add(
+            Review(
+                user_id=user.id,
+                provider_id=provider.id,
+                rating=rating,
+                comment=faker.paragraph(),
+            )
+        )
+
+    await session.commit()
+
+
+async def test_apply_review_change(
+    session: AsyncSession,
+    provider_repository: ProviderRepository,
+    test_provider: Provider,
+) -> None:
+    await provider_repository.apply_review_change(
+        test_provider.id, rating_delta=5, count_delta=1
+    )
+    await provider_repository.apply_review_change(
+        test_provider.id, rating_delta=2, count_delta=1
+    )
+    await session.commit()
+    await session.refresh(test_provider)
+
+    assert test_provider.rating_sum == 7
+    assert test_provider.reviews_count == 2
+    assert test_provider.rating == 3.5
+
+    await provider_repository.apply_review_change(
+        test_provider.id, rating_delta=-2, count_delta=-1
+    )
+    await provider_repository.apply_review_change(
+        test_provider.id, rating_delta=-5, count_delta=-1
+    )
+    await session.commit()
+    await session.refresh(test_provider)
+
+    assert test_provider.rating_sum == 0
+    assert test_provider.reviews_count == 0
+    assert test_provider.rating is None
+
+
+async def test_recalculate_review_stats(
+    session: AsyncSession,
+    provider_repository: ProviderRepository,
+    test_providers: list[Provider],
+    faker: Faker,
+) -> None:
+    first, second, third = test_providers
+    await add_reviews(session, first, [3, 4, 5], faker)
+    await add_reviews(session, second, [1], faker)
+    await provider_repository.update(
+        third.id, {"rating_sum": 42, "reviews_count": 10, "rating": 4.2}
+    )
+
+    updated = await provider_repository.recalculate_review_stats()
+    await session.commit()
+
+    assert updated == len(test_providers)
+    for provider in test_providers:
+        await session.refresh(provider)
+
+    assert (first.rating_sum, first.reviews_count, first.rating) == (12, 3, 4.0)
+    assert (second.rating_sum, second.reviews_count, second.rating) == (1, 1, 1.0)
+    assert (third.rating_sum, third.reviews_count, third.rating) == (0, 0, None)
+
+
+async def test_recalculate_review_stats_for_selected_providers(
+    session: AsyncSession,
+    provider_repository: ProviderRepository,
+    test_providers: list[Provider],
+    faker: Faker,
+) -> None:
+    first, second, _ = test_providers
+    await add_reviews(session, first, [2], faker)
+    await add_reviews(session, second, [4], faker)
+
+    updated = await provider_repository.recalculate_review_stats([first.id])
+    await session.commit()
+    await session.refresh(first)
+    await session.refresh(second)
+
+    assert updated == 1
+    assert first.reviews_count == 1
+    assert second.reviews_count == 0
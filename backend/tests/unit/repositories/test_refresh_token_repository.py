@@ -3,7 +3,7 @@ from datetime import UTC, datetime, timedelta
 
 import pytest
 from faker import Faker
-from sqlalchemy import select
+from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from isp_compare.models.token import RefreshToken
@@ -21,7 +21,7 @@ async def test_refresh_token(
     session: AsyncSession, regular_user: User, faker: Faker
 ) -> RefreshToken:
     token = RefreshToken(
-        token=faker.uuid4(),
+        token_hash=faker.binary(32),
         user_id=regular_user.id,
         expires_at=datetime.now(UTC) + timedelta(days=7),
         revoked=False,
@@ -38,7 +38,7 @@ async def test_refresh_tokens(
     tokens = []
     for _ in range(3):
         token = RefreshToken(
-            token=faker.uuid4(),
+            token_hash=faker.binary(32),
             user_id=regular_user.id,
             expires_at=datetime.now(UTC) + timedelta(days=7),
             revoked=False,
@@ -56,11 +56,11 @@ async def test_create(
     regular_user: User,
     faker: Faker,
 ) -> None:
-    token_value = faker.uuid4()
+    token_hash = faker.binary(32)
     expires_at = datetime.now(UTC) + timedelta(days=7)
 
     token = RefreshToken(
-        token=token_value,
+        token_hash=token_hash,
         user_id=regular_user.id,
         expires_at=expires_at,
         revoked=False,
@@ -74,28 +74,54 @@ async def test_create(
     saved_token = result.scalar_one()
 
     assert saved_token.id == token.id
-    assert saved_token.token == token_value
+    assert saved_token.token_hash == token_hash
     assert saved_token.user_id == regular_user.id
     assert saved_token.expires_at == expires_at
     assert saved_token.revoked is False
 
 
-async def test_get_by_token(
+async def test_create_revoking_others(
+    session: AsyncSession,
+    refresh_token_repository: RefreshTokenRepository,
+    test_refresh_tokens: list[RefreshToken],
+    regular_user: User,
+    faker: Faker,
+) -> None:
+    token_hash = faker.binary(32)
+
+    await refresh_token_repository.create_revoking_others(
+        regular_user.id, token_hash, datetime.now(UTC) + timedelta(days=7)
+    )
+    await session.commit()
+
+    result = await session.execute(
+        select(RefreshToken.token_hash, RefreshToken.revoked).where(
+            RefreshToken.user_id == regular_user.id
+        )
+    )
+    revoked = dict(result.tuples().all())
+    assert revoked.pop(token_hash) is False
+    assert len(revoked) == len(test_refresh_tokens)
+    assert all(revoked.values())
+
+
+async def test_get_by_token_hash(
     refresh_token_repository: RefreshTokenRepository, test_refresh_token: RefreshToken
 ) -> None:
-    result = await refresh_token_repository.get_by_token(test_refresh_token.token)
+    result = await refresh_token_repository.get_by_token_hash(
+        test_refresh_token.token_hash
+    )
 
     assert result is not None
     assert result.id == test_refresh_token.id
-    assert result.token == test_refresh_token.token
+    assert result.token_hash == test_refresh_token.token_hash
     assert result.user_id == test_refresh_token.user_id
 
 
-async def test_get_by_token_not_found(
+async def test_get_by_token_hash_not_found(
     refresh_token_repository: RefreshTokenRepository, faker: Faker
 ) -> None:
-    non_existent_token = faker.uuid4()
-    result = await refresh_token_repository.get_by_token(non_existent_token)
+    result = await refresh_token_repository.get_by_token_hash(faker.binary(32))
 
     assert result is None
 
@@ -127,7 +153,7 @@ async def test_revoke(
     refresh_token_repository: RefreshTokenRepository,
     test_refresh_token: RefreshToken,
 ) -> None:
-    await refresh_token_repository.revoke(test_refresh_token.token)
+    await refresh_token_repository.revoke(test_refresh_token.token_hash)
     await session.commit()
 
     stmt = select(RefreshToken).where(RefreshToken.id == test_refresh_token.id)
@@ -154,7 +180,7 @@ async def test_revoke_all_for_user(
     await session.flush()
 
     other_token = RefreshToken(
-        token=Faker().uuid4(),
+        token_hash=Faker().binary(32),
         user_id=other_user.id,
         expires_at=datetime.now(UTC) + timedelta(days=7),
         revoked=False,
@@ -189,7 +215,7 @@ async def test_delete_expired(
     expired_tokens = []
     for _ in range(2):
         token = RefreshToken(
-            token=faker.uuid4(),
+            token_hash=faker.binary(32),
             user_id=regular_user.id,
             expires_at=datetime.now(UTC) - timedelta(days=1),
             revoked=False,
@@ -198,7 +224,7 @@ async def test_delete_expired(
         session.add(token)
 
     active_token = RefreshToken(
-        token=faker.uuid4(),
+        token_hash=faker.binary(32),
         user_id=regular_user.id,
         expires_at=datetime.now(UTC) + timedelta(days=7),
         revoked=False,
@@ -206,9 +232,11 @@ async def test_delete_expired(
     session.add(active_token)
     await session.commit()
 
-    await refresh_token_repository.delete_expired()
+    deleted = await refresh_token_repository.delete_expired(10)
     await session.commit()
 
+    assert deleted == len(expired_tokens)
+
     for token in expired_tokens:
         stmt = select(RefreshToken).where(RefreshToken.id == token.id)
         result = await session.execute(stmt)
@@ -220,3 +248,83 @@ async def test_delete_expired(
     not_deleted_token = result.scalar_one_or_none()
     assert not_deleted_token is not None
     assert not_deleted_token.id == active_token.id
+
+
+async def test_delete_expired_limit(
+    session: AsyncSession,
+    refresh_token_repository: RefreshTokenRepository,
+    regular_user: User,
+    faker: Faker,
+) -> None:
+    session.add_all(
+        RefreshToken(
+            token_hash=faker.binary(32),
+            user_id=regular_user.id,
+            expires_at=datetime.now(UTC) - timedelta(days=1),
+        )
+        for _ in range(3)
+    )
+    await session.commit()
+
+    assert await refresh_token_repository.delete_expired(2) == 2
+    assert await refresh_token_repository.delete_expired(2) == 1
+    assert await refresh_token_repository.delete_expired(2) == 0
+
+
+async def test_delete_revoked_before(
+    session: AsyncSession,
+    refresh_token_repository: RefreshTokenRepository,
+    regular_user: User,
+    faker: Faker,
+) -> None:
+    now = datetime.now(UTC)
+    old_revoked_token = RefreshToken(
+        token_hash=faker.binary(32),
+        user_id=regular_user.id,
+        expires_at=now + timedelta(days=5),
+        revoked=True,
+        revoked_at=now - timedelta(days=2),
+    )
+    recently_revoked_token = RefreshToken(
+        token_hash=faker.binary(32),
+        user_id=regular_user.id,
+        expires_at=now + timedelta(days=5),
+        revoked=True,
+        revoked_at=now - timedelta(hours=1),
+    )
+    active_token = RefreshToken(
+        token_hash=faker.binary(32),
+        user_id=regular_user.id,
+        expires_at=now + timedelta(days=5),
+    )
+    session.add_all([old_revoked_token, recently_revoked_token, active_token])
+    await session.commit()
+
+    deleted = await refresh_token_repository.delete_revoked_before(
+        now - timedelta(days=1), 10
+    )
+    await session.commit()
+
+    assert deleted == 1
+    result = await refresh_token_repository.get_by_user_id(regular_user.id)
+    assert {token.id for token in result} == {
+        recently_revoked_token.id,
+        active_token.id,
+    }
+
+
+async def test_revoke_all_for_user_uses_partial_index(
+    session: AsyncSession, regular_user: User
+) -> None:
+    await session.execute(text("SET LOCAL enable_seqscan = off"))
+    await session.execute(text("SET LOCAL enable_bitmapscan = off"))
+    result = await session.scalars(
+        text(
+            "EXPLAIN UPDATE refresh_tokens SET revoked = true "
+            "WHERE user_id = :user_id AND NOT revoked"
+        ),
+        {"user_id": regular_user.id},
+    )
+    plan = "\n".join(result)
+
+    assert "ix_refresh_tokens_user_id" in plan
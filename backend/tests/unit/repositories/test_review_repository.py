@@ -125,6 +125,7 @@ async def test_get_by_id_for_update(
     assert result.id == test_review.id
     assert result.user_id == test_review.user_id
     assert result.provider_id == test_review.provider_id
+    assert result.user.id == test_review.user_id
 
 
 async def test_get_by_id_not_found(review_repository: ReviewRepository) -> None:
@@ -204,6 +205,31 @@ async def test_get_by_provider_with_offset(
         assert review.provider_id == test_provider.id
 
 
+async def test_get_by_provider_with_cursor(
+    review_repository: ReviewRepository,
+    test_provider: Provider,
+    test_reviews: list[Review],
+) -> None:
+    expected = await review_repository.get_by_provider(test_provider.id, 10)
+
+    pages = []
+    cursor = None
+    while True:
+        page = await review_repository.get_by_provider(
+            test_provider.id, 2, cursor=cursor
+        )
+        if not page:
+            break
+        pages.append(page)
+        cursor = page[-1].created_at, page[-1].id
+
+    assert [len(page) for page in pages] == [2, 1]
+    assert [review.id for page in pages for review in page] == [
+        review.id for review in expected
+    ]
+    assert len(expected) == len(test_reviews)
+
+
 async def test_update(
     session: AsyncSession,
     review_repository: ReviewRepository,
@@ -214,9 +240,15 @@ async def test_update(
     new_comment = faker.paragraph()
     update_data = {"rating": new_rating, "comment": new_comment}
 
-    await review_repository.update(test_review.id, update_data)
+    review = await review_repository.get_by_id(test_review.id, for_update=True)
+    await review_repository.update(review, update_data)
     await session.commit()
 
+    assert review.rating == new_rating
+    assert review.comment == new_comment
+    assert review.updated_at >= test_review.created_at
+    assert review.user.id == test_review.user_id
+
     stmt = select(Review).where(Review.id == test_review.id)
     result = await session.execute(stmt)
     updated_review = result.scalar_one()
@@ -238,45 +270,3 @@ async def test_delete(
     deleted_review = result.scalar_one_or_none()
 
     assert deleted_review is None
-
-
-async def test_calculate_average_rating(
-    session: AsyncSession,
-    review_repository: ReviewRepository,
-    test_provider: Provider,
-    regular_user: User,
-    faker: Faker,
-) -> None:
-    ratings = [3, 4, 5]
-    for rating in ratings:
-        user = User(
-            fullname=faker.name(),
-            username=faker.user_name(),
-            hashed_password=faker.sha256(),
-            email=faker.email(),
-        )
-        session.add(user)
-        await session.flush()
-
-        review = Review(
-            user_id=user.id,
-            provider_id=test_provider.id,
-            rating=rating,
-            comment=faker.paragraph(),
-        )
-        session.add(review)
-
-    await session.commit()
-
-    avg_rating = await review_repository.calculate_average_rating(test_provider.id)
-
-    assert avg_rating == 4.0
-
-
-async def test_calculate_average_rating_no_reviews(
-    review_repository: ReviewRepository,
-) -> None:
-    provider_id = uuid.uuid4()
-    avg_rating = await review_repository.calculate_average_rating(provider_id)
-
-    assert avg_rating is None
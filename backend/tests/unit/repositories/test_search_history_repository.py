@@ -1,8 +1,9 @@
 import uuid
+from datetime import UTC, datetime, timedelta
 
 import pytest
 from faker import Faker
-from sqlalchemy import select
+from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from isp_compare.models.search_history import SearchHistory
@@ -93,6 +94,63 @@ async def test_create(
     assert saved_search_history.search_params == search_params
 
 
+async def test_create_many(
+    session: AsyncSession,
+    search_history_repository: SearchHistoryRepository,
+    regular_user: User,
+) -> None:
+    created_at = datetime.now(UTC) - timedelta(minutes=1)
+    rows = [
+        {
+            "user_id": regular_user.id,
+            "search_params": {"min_speed": speed},
+            "created_at": created_at + timedelta(seconds=speed),
+        }
+        for speed in (50, 100)
+    ]
+
+    await search_history_repository.create_many(rows)
+    await session.commit()
+
+    result = await search_history_repository.get_by_user(regular_user.id, 10, 0)
+    assert [history.search_params for history in result] == [
+        {"min_speed": 100},
+        {"min_speed": 50},
+    ]
+    assert result[1].created_at == rows[0]["created_at"]
+
+
+async def test_get_latest_params_by_users(
+    session: AsyncSession,
+    search_history_repository: SearchHistoryRepository,
+    regular_user: User,
+    regular_user_2: User,
+) -> None:
+    created_at = datetime.now(UTC)
+    session.add_all(
+        [
+            SearchHistory(
+                user_id=regular_user.id,
+                search_params={"has_tv": False},
+                created_at=created_at - timedelta(minutes=1),
+            ),
+            SearchHistory(
+                user_id=regular_user.id,
+                search_params={"has_tv": True},
+                created_at=created_at,
+            ),
+        ]
+    )
+    await session.commit()
+    unknown_user_id = uuid.uuid4()
+
+    result = await search_history_repository.get_latest_params_by_users(
+        [regular_user.id, regular_user_2.id, unknown_user_id]
+    )
+
+    assert result == {regular_user.id: {"has_tv": True}, regular_user_2.id: None}
+
+
 async def test_get_by_id(
     search_history_repository: SearchHistoryRepository,
     test_search_history: SearchHistory,
@@ -278,3 +336,82 @@ async def test_delete_all_for_user(
 
     assert len(other_user_histories) == 1
     assert other_user_histories[0].id == other_search_history.id
+
+
+async def test_trim_to_limit(
+    session: AsyncSession,
+    search_history_repository: SearchHistoryRepository,
+    regular_user: User,
+    regular_user_2: User,
+) -> None:
+    created_at = datetime.now(UTC)
+    for user in (regular_user, regular_user_2):
+        session.add_all(
+            SearchHistory(
+                user_id=user.id,
+                search_params={"min_speed": i},
+                created_at=created_at - timedelta(minutes=i),
+            )
+            for i in range(5)
+        )
+    await session.commit()
+
+    deleted = await search_history_repository.trim_to_limit([regular_user.id], 2)
+    await session.commit()
+
+    assert deleted == 3
+    result = await search_history_repository.get_by_user(regular_user.id, 10, 0)
+    assert [history.search_params for history in result] == [
+        {"min_speed": 0},
+        {"min_speed": 1},
+    ]
+    other = await search_history_repository.get_by_user(regular_user_2.id, 10, 0)
+    assert len(other) == 5
+
+
+async def test_delete_created_before(
+    session: AsyncSession,
+    search_history_repository: SearchHistoryRepository,
+    regular_user: User,
+) -> None:
+    now = datetime.now(UTC)
+    session.add_all(
+        SearchHistory(
+            user_id=regular_user.id,
+            search_params={"min_speed": days},
+            created_at=now - timedelta(days=days),
+        )
+        for days in (1, 40, 50, 60)
+    )
+    await session.commit()
+
+    deleted = await search_history_repository.delete_created_before(
+        now - timedelta(days=30), limit=2
+    )
+    await session.commit()
+
+    assert deleted == 2
+    result = await search_history_repository.get_by_user(regular_user.id, 10, 0)
+    assert len(result) == 2
+    assert result[0].search_params == {"min_speed": 1}
+
+
+async def test_get_by_user_uses_index(
+    session: AsyncSession,
+    search_history_repository: SearchHistoryRepository,
+    regular_user: User,
+) -> None:
+    # На маленькой таблице планировщик предпочел бы полный просмотр
+    await session.execute(text("SET LOCAL enable_seqscan = off"))
+    await session.execute(text("SET LOCAL enable_bitmapscan = off"))
+    result = await session.scalars(
+        text(
+            "EXPLAIN SELECT * FROM search_history WHERE user_id = :user_id "
+            "ORDER BY created_at DESC LIMIT 10"
+        ),
+        {"user_id": regular_user.id},
+    )
+    plan = "\n".join(result)
+
+    assert "ix_search_history_user_id_created_at" in plan
+    assert "Sort" not in plan
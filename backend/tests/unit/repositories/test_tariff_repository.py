@@ -1,4 +1,5 @@
 import uuid
+from decimal import Decimal
 
 import pytest
 from faker import Faker
@@ -123,6 +124,90 @@ async def test_create_tariff(
     assert saved_tariff.promo_period == tariff.promo_period
 
 
+async def test_create_many(
+    session: AsyncSession,
+    tariff_repository: TariffRepository,
+    test_provider: Provider,
+) -> None:
+    tariffs_data = [
+        {
+            "provider_id": test_provider.id,
+            "name": f"Bulk Tariff {i}",
+            "price": Decimal(f"{i}00.00"),
+            "speed": i * 100,
+        }
+        for i in range(1, 4)
+    ]
+
+    await tariff_repository.create_many(tariffs_data)
+    await tariff_repository.create_many([])
+
+    stmt = (
+        select(Tariff)
+        .where(Tariff.provider_id == test_provider.id)
+        .order_by(Tariff.speed)
+    )
+    result = await session.execute(stmt)
+    saved_tariffs = list(result.scalars())
+
+    assert [tariff.name for tariff in saved_tariffs] == [
+        data["name"] for data in tariffs_data
+    ]
+    assert len({tariff.id for tariff in saved_tariffs}) == len(tariffs_data)
+    assert all(tariff.is_active for tariff in saved_tariffs)
+
+
+async def test_update_many(
+    session: AsyncSession,
+    tariff_repository: TariffRepository,
+    test_tariffs: list[Tariff],
+) -> None:
+    await tariff_repository.update_many(
+        [
+            {"id": tariff.id, "speed": 1000 + i}
+            for i, tariff in enumerate(test_tariffs[:2])
+        ]
+    )
+    await tariff_repository.update_many([])
+
+    for tariff in test_tariffs:
+        await session.refresh(tariff)
+    assert [tariff.speed for tariff in test_tariffs[:2]] == [1000, 1001]
+    assert all(tariff.speed < 1000 for tariff in test_tariffs[2:])
+
+
+async def test_deactivate_many(
+    session: AsyncSession,
+    tariff_repository: TariffRepository,
+    test_tariffs: list[Tariff],
+) -> None:
+    await tariff_repository.deactivate_many([test_tariffs[0].id])
+
+    for tariff in test_tariffs:
+        await session.refresh(tariff)
+    assert [tariff.is_active for tariff in test_tariffs] == [
+        False,
+        True,
+        True,
+        True,
+        True,
+    ]
+
+
+async def test_get_active_by_provider(
+    tariff_repository: TariffRepository,
+    test_provider: Provider,
+    test_tariffs: list[Tariff],
+) -> None:
+    await tariff_repository.deactivate_many([test_tariffs[0].id])
+
+    result = await tariff_repository.get_active_by_provider(test_provider.id)
+
+    assert {tariff["id"] for tariff in result} == {
+        tariff.id for tariff in test_tariffs[1:]
+    }
+
+
 async def test_get_by_id(
     tariff_repository: TariffRepository, test_tariff: Tariff
 ) -> None:
@@ -161,11 +246,28 @@ async def test_get_all(
 
     assert len(result) == len(test_tariffs)
 
-    tariff_ids = {t.id for t in result}
+    tariff_ids = {t["id"] for t in result}
     for tariff in test_tariffs:
         assert tariff.id in tariff_ids
 
 
+async def test_get_all_returns_plain_rows(
+    session: AsyncSession,
+    tariff_repository: TariffRepository,
+    test_tariffs: list[Tariff],
+) -> None:
+    session.expunge_all()
+
+    result = await tariff_repository.get_all(10, 0)
+
+    assert result
+    assert all(isinstance(tariff, dict) for tariff in result)
+    assert len(session.identity_map) == 0
+    assert result[0]["name"] == next(
+        tariff.name for tariff in test_tariffs if tariff.id == result[0]["id"]
+    )
+
+
 async def test_get_all_with_limit(
     tariff_repository: TariffRepository, test_tariffs: list[Tariff]
 ) -> None:
@@ -188,7 +290,7 @@ async def test_get_by_provider(
     assert len(result) == len(test_tariffs)
 
     for tariff in result:
-        assert tariff.provider_id == test_provider.id
+        assert tariff["provider_id"] == test_provider.id
 
 
 async def test_get_by_provider_with_limit_offset(
@@ -203,7 +305,7 @@ async def test_get_by_provider_with_limit_offset(
     assert len(result) == min(limit, len(test_tariffs) - offset)
 
     for tariff in result:
-        assert tariff.provider_id == test_provider.id
+        assert tariff["provider_id"] == test_provider.id
 
 
 async def test_update(
@@ -288,8 +390,8 @@ async def test_search(
 
     assert len(result) == len(tv_tariffs)
     for tariff in result:
-        assert tariff.has_tv is True
-        assert tariff.is_active is True
+        assert tariff["has_tv"] is True
+        assert tariff["is_active"] is True
 
 
 async def test_search_price_range(
@@ -309,22 +411,23 @@ async def test_search_price_range(
         offset=0,
     )
 
-    def get_effective_price(t: Tariff) -> float:
-        return float(t.promo_price) if t.promo_price is not None else float(t.price)
+    def get_effective_price(promo_price: float | None, price: float) -> float:
+        return float(promo_price) if promo_price is not None else float(price)
 
     active_tariffs_in_range = [
         t
         for t in test_tariffs
-        if t.is_active and min_price <= get_effective_price(t) <= max_price
+        if t.is_active
+        and min_price <= get_effective_price(t.promo_price, t.price) <= max_price
     ]
 
     assert len(result) == len(active_tariffs_in_range)
 
     for tariff in result:
-        effective_price = get_effective_price(tariff)
+        effective_price = get_effective_price(tariff["promo_price"], tariff["price"])
         assert effective_price >= min_price
         assert effective_price <= max_price
-        assert tariff.is_active is True
+        assert tariff["is_active"] is True
 
 
 async def test_search_with_tv(
@@ -345,8 +448,8 @@ async def test_search_with_tv(
 
     assert len(result) == len(active_tariffs_with_tv)
     for tariff in result:
-        assert tariff.has_tv is True
-        assert tariff.is_active is True
+        assert tariff["has_tv"] is True
+        assert tariff["is_active"] is True
 
 
 async def test_search_complex(
@@ -374,9 +477,9 @@ async def test_search_complex(
 
     assert len(result) == len(matching_tariffs)
     for tariff in result:
-        assert tariff.speed >= min_speed
-        assert tariff.has_phone is True
-        assert tariff.is_active is True
+        assert tariff["speed"] >= min_speed
+        assert tariff["has_phone"] is True
+        assert tariff["is_active"] is True
 
 
 async def test_search_limit_offset(
@@ -400,7 +503,7 @@ async def test_search_limit_offset(
     expected_count = min(limit, len(active_tariffs) - offset)
 
     assert len(result) == expected_count
-    assert result[0].id == active_tariffs[offset].id
+    assert result[0]["id"] == active_tariffs[offset].id
 
 
 async def test_promo_fields(
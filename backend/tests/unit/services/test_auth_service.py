@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock
@@ -360,6 +361,46 @@ async def test_login_success(
     assert result.access_token == access_token
 
 
+async def test_login_checks_limit_and_user_concurrently(
+    auth_service: AuthService,
+    response_mock: MagicMock,
+    user_repository_mock: AsyncMock,
+    password_hasher_mock: MagicMock,
+    token_service_mock: AsyncMock,
+    transaction_manager_mock: AsyncMock,
+    rate_limiter_mock: AsyncMock,
+    mock_user: User,
+) -> None:
+    user_requested = asyncio.Event()
+
+    async def check_failed_login_limit(**_: str) -> tuple[bool, int]:
+        # Завершится, только если выборка пользователя уже запущена
+        await asyncio.wait_for(user_requested.wait(), timeout=1)
+        return True, 10
+
+    async def get_by_username(_: str) -> User:
+        user_requested.set()
+        return mock_user
+
+    rate_limiter_mock.check_failed_login_limit.side_effect = check_failed_login_limit
+    user_repository_mock.get_by_username.side_effect = get_by_username
+    password_hasher_mock.verify.side_effect = (
+        lambda *_: transaction_manager_mock.release.assert_called_once() or True
+    )
+    token_service_mock.create_tokens.return_value = (
+        "test_access_token",
+        "test_refresh_token",
+        datetime.now(UTC) + timedelta(days=7),
+    )
+
+    result = await auth_service.login(
+        UserLogin(username="testuser", password="Password123"), response_mock
+    )
+
+    assert result.access_token == "test_access_token"
+    password_hasher_mock.verify.assert_called_once()
+
+
 async def test_login_rate_limit_exceeded_initial(
     auth_service: AuthService,
     response_mock: MagicMock,
@@ -0,0 +1,95 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from pydantic import TypeAdapter
+from redis.asyncio import Redis
+
+from isp_compare.services.cache import CACHE_FRESH_KEY, CACHE_LOCK_KEY, RedisCache
+
+CACHE_KEY = "test_cache"
+
+adapter = TypeAdapter(list[int])
+
+
+@pytest.fixture
+def cache(redis_client: Redis) -> RedisCache:
+    return RedisCache(redis_client)
+
+
+async def test_get_or_set_stores_value(cache: RedisCache, redis_client: Redis) -> None:
+    factory = AsyncMock(return_value=[1, 2, 3])
+
+    first = await cache.get_or_set(CACHE_KEY, factory, adapter, ttl=60, stale_ttl=30)
+    second = await cache.get_or_set(CACHE_KEY, factory, adapter, ttl=60, stale_ttl=30)
+
+    assert first == second == [1, 2, 3]
+    factory.assert_awaited_once()
+    assert 60 < await redis_client.ttl(CACHE_KEY) <= 90
+    assert 0 < await redis_client.ttl(CACHE_FRESH_KEY.format(key=CACHE_KEY)) <= 60
+
+
+async def test_get_or_set_single_flight_on_miss(cache: RedisCache) -> None:
+    calls = 0
+
+    async def factory() -> list[int]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.1)
+        return [calls]
+
+    results = await asyncio.gather(
+        *(cache.get_or_set(CACHE_KEY, factory, adapter, ttl=60) for _ in range(10))
+    )
+
+    assert calls == 1
+    assert all(result == [1] for result in results)
+
+
+async def test_get_or_set_serves_stale_while_revalidating(
+    cache: RedisCache, redis_client: Redis
+) -> None:
+    await cache.get_or_set(CACHE_KEY, AsyncMock(return_value=[1]), adapter, ttl=60)
+    await redis_client.delete(CACHE_FRESH_KEY.format(key=CACHE_KEY))
+
+    refreshed = asyncio.Event()
+
+    async def factory() -> list[int]:
+        await refreshed.wait()
+        return [2]
+
+    refresh = asyncio.create_task(cache.get_or_set(CACHE_KEY, factory, adapter, ttl=60))
+    await asyncio.sleep(0.05)
+
+    # Пока один запрос пересчитывает значение, остальные получают старое
+    stale = await cache.get_or_set(
+        CACHE_KEY, AsyncMock(side_effect=AssertionError), adapter, ttl=60
+    )
+    assert stale == [1]
+
+    refreshed.set()
+    assert await refresh == [2]
+    assert await cache.get_or_set(CACHE_KEY, AsyncMock(), adapter, ttl=60) == [2]
+    assert not await redis_client.exists(CACHE_LOCK_KEY.format(key=CACHE_KEY))
+
+
+async def test_invalidate(cache: RedisCache, redis_client: Redis) -> None:
+    await cache.get_or_set(CACHE_KEY, AsyncMock(return_value=[1]), adapter, ttl=60)
+
+    await cache.invalidate(CACHE_KEY)
+
+    assert not await redis_client.exists(CACHE_KEY)
+    assert not await redis_client.exists(CACHE_FRESH_KEY.format(key=CACHE_KEY))
+
+
+async def test_invalidate_during_refresh_skips_store(
+    cache: RedisCache, redis_client: Redis
+) -> None:
+    async def factory() -> list[int]:
+        await cache.invalidate(CACHE_KEY)
+        return [1]
+
+    result = await cache.get_or_set(CACHE_KEY, factory, adapter, ttl=60)
+
+    assert result == [1]
+    assert not await redis_client.exists(CACHE_KEY)
@@ -0,0 +1,32 @@
+from redis.asyncio import Redis
+
+from isp_compare.services.catalog_version import CATALOG_VERSION_KEY, CatalogVersion
+
+
+async def test_get_initializes_version(redis_client: Redis) -> None:
+    catalog_version = CatalogVersion(redis_client)
+
+    version = await catalog_version.get()
+
+    assert version == await redis_client.get(CATALOG_VERSION_KEY)
+    assert await catalog_version.get() == version
+
+
+async def test_bump_changes_version(redis_client: Redis) -> None:
+    catalog_version = CatalogVersion(redis_client)
+    version = await catalog_version.get()
+
+    await catalog_version.bump()
+
+    assert int(await catalog_version.get()) == int(version) + 1
+
+
+async def test_bump_after_reset_does_not_reuse_versions(redis_client: Redis) -> None:
+    catalog_version = CatalogVersion(redis_client)
+    await catalog_version.bump()
+    version = await catalog_version.get()
+
+    await redis_client.flushall()
+    await catalog_version.bump()
+
+    assert await catalog_version.get() != version
@@ -0,0 +1,106 @@
+import asyncio
+from collections.abc import AsyncGenerator
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from isp_compare.core.config import PostgresConfig, ServerConfig
+from isp_compare.core.db_routing import ReplicaEngines
+from isp_compare.core.di.providers.database import create_engine
+from isp_compare.services.database_pool import DatabasePoolMonitor
+
+
+@pytest.fixture
+def pool_config(postgres_config: PostgresConfig) -> PostgresConfig:
+    return postgres_config.model_copy(
+        update={"pool_size": 1, "max_overflow": 0, "pool_timeout": 5}
+    )
+
+
+@pytest.fixture
+async def pool_engine(pool_config: PostgresConfig) -> AsyncGenerator[AsyncEngine]:
+    engine = create_engine(pool_config, pool_config.build_dsn())
+    yield engine
+    await engine.dispose()
+
+
+def create_monitor(
+    engine: AsyncEngine, config: PostgresConfig, workers: int = 1
+) -> DatabasePoolMonitor:
+    return DatabasePoolMonitor(
+        engine=engine,
+        replica_engines=ReplicaEngines([]),
+        postgres_config=config,
+        server_config=ServerConfig(workers=workers),
+    )
+
+
+async def test_engine_uses_pool_settings(
+    pool_engine: AsyncEngine, pool_config: PostgresConfig
+) -> None:
+    (stats,) = create_monitor(pool_engine, pool_config).get_stats()
+
+    assert stats.name == "primary"
+    assert stats.size == 1
+    assert stats.max_connections == 1
+    assert stats.waits == 0
+
+
+async def test_pool_stats_track_checkouts_and_waits(
+    pool_engine: AsyncEngine, pool_config: PostgresConfig
+) -> None:
+    monitor = create_monitor(pool_engine, pool_config)
+    holding = asyncio.Event()
+    release = asyncio.Event()
+
+    async def hold_connection() -> None:
+        async with pool_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            holding.set()
+            await release.wait()
+
+    holder = asyncio.create_task(hold_connection())
+    await holding.wait()
+    (stats,) = monitor.get_stats()
+    assert stats.checked_out == 1
+
+    async def release_later() -> None:
+        await asyncio.sleep(0.2)
+        release.set()
+
+    releaser = asyncio.create_task(release_later())
+    async with pool_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    await asyncio.gather(holder, releaser)
+
+    (stats,) = monitor.get_stats()
+    assert stats.checked_out == 0
+    assert stats.waits == 2
+    assert stats.wait_time_max >= 0.15
+
+
+async def test_check_capacity(
+    pool_engine: AsyncEngine, pool_config: PostgresConfig
+) -> None:
+    assert await create_monitor(pool_engine, pool_config).check_capacity()
+    assert not await create_monitor(
+        pool_engine, pool_config, workers=100_000
+    ).check_capacity()
+
+
+async def test_check_capacity_skips_unreachable_replica(
+    pool_engine: AsyncEngine, pool_config: PostgresConfig
+) -> None:
+    replica = create_engine(pool_config, pool_config.build_dsn(port=1))
+    monitor = DatabasePoolMonitor(
+        engine=pool_engine,
+        replica_engines=ReplicaEngines([replica]),
+        postgres_config=pool_config,
+        server_config=ServerConfig(workers=1),
+    )
+
+    try:
+        assert await monitor.check_capacity()
+    finally:
+        await replica.dispose()
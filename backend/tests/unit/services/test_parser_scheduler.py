@@ -0,0 +1,198 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+from redis.asyncio import Redis
+
+from isp_compare.core.config import ParserConfig
+from isp_compare.parsers import PARSERS
+from isp_compare.services.parser_scheduler import (
+    PARSER_LOCK_KEY,
+    PARSER_NEXT_RUN_KEY,
+    PARSER_QUEUE_KEY,
+    ParserScheduler,
+)
+from isp_compare.services.parser_service import ParserService
+from isp_compare.services.redis_lock import RedisLock
+
+
+@pytest.fixture
+def parser_service_mock() -> AsyncMock:
+    service = AsyncMock(spec=ParserService)
+    service.update_provider_tariffs.return_value = 3
+    return service
+
+
+@pytest.fixture
+def container_mock(parser_service_mock: AsyncMock) -> MagicMock:
+    request_container = AsyncMock()
+    request_container.get.return_value = parser_service_mock
+
+    container = MagicMock()
+    container.return_value.__aenter__.return_value = request_container
+    return container
+
+
+@pytest.fixture
+def parser_scheduler(
+    container_mock: MagicMock, redis_client: Redis, parser_config: ParserConfig
+) -> ParserScheduler:
+    return ParserScheduler(
+        container=container_mock,
+        redis_client=redis_client,
+        config=parser_config,
+    )
+
+
+async def test_enqueue_and_process_job(
+    parser_scheduler: ParserScheduler,
+    parser_service_mock: AsyncMock,
+    redis_client: Redis,
+) -> None:
+    job_id = await parser_scheduler.enqueue(["Билайн", "Ростелеком"])
+
+    payload = await redis_client.lindex(PARSER_QUEUE_KEY, 0)
+    assert json.loads(payload)["job_id"] == str(job_id)
+
+    processed = await parser_scheduler.process_next_job()
+
+    assert processed is True
+    assert parser_service_mock.update_provider_tariffs.await_count == 2
+    parser_service_mock.update_provider_tariffs.assert_any_await("Билайн", job_id)
+    parser_service_mock.update_provider_tariffs.assert_any_await("Ростелеком", job_id)
+    assert await redis_client.llen(PARSER_QUEUE_KEY) == 0
+    assert await redis_client.get(PARSER_LOCK_KEY) is None
+
+
+async def test_process_job_empty_queue(
+    parser_scheduler: ParserScheduler, parser_service_mock: AsyncMock
+) -> None:
+    processed = await parser_scheduler.process_next_job()
+
+    assert processed is False
+    parser_service_mock.update_provider_tariffs.assert_not_awaited()
+
+
+async def test_process_job_requeued_when_locked(
+    parser_scheduler: ParserScheduler,
+    parser_service_mock: AsyncMock,
+    redis_client: Redis,
+) -> None:
+    await redis_client.set(PARSER_LOCK_KEY, "other-worker")
+    job_id = await parser_scheduler.enqueue(["Билайн"])
+
+    processed = await parser_scheduler.process_next_job()
+
+    assert processed is True
+    parser_service_mock.update_provider_tariffs.assert_not_awaited()
+    queued = await redis_client.lrange(PARSER_QUEUE_KEY, 0, -1)
+    assert [json.loads(item) for item in queued] == [
+        {"job_id": str(job_id), "providers": ["Билайн"]}
+    ]
+
+    await redis_client.delete(PARSER_LOCK_KEY)
+    await parser_scheduler.process_next_job()
+
+    parser_service_mock.update_provider_tariffs.assert_awaited_once_with(
+        "Билайн", job_id
+    )
+    assert await redis_client.llen(PARSER_QUEUE_KEY) == 0
+
+
+async def test_run_due_providers_schedules_next_run(
+    parser_scheduler: ParserScheduler,
+    parser_service_mock: AsyncMock,
+    redis_client: Redis,
+) -> None:
+    executed = await parser_scheduler.run_due_providers()
+
+    assert executed == list(PARSERS)
+    assert parser_service_mock.update_provider_tariffs.await_count == len(PARSERS)
+
+    for provider_name in PARSERS:
+        key = PARSER_NEXT_RUN_KEY.format(provider_name=provider_name)
+        assert await redis_client.get(key) is not None
+
+    executed = await parser_scheduler.run_due_providers()
+
+    assert executed == []
+    assert parser_service_mock.update_provider_tariffs.await_count == len(PARSERS)
+
+
+async def test_run_due_providers_skipped_when_locked(
+    parser_scheduler: ParserScheduler,
+    parser_service_mock: AsyncMock,
+    redis_client: Redis,
+) -> None:
+    await redis_client.set(PARSER_LOCK_KEY, "other-worker")
+
+    executed = await parser_scheduler.run_due_providers()
+
+    assert executed == []
+    parser_service_mock.update_provider_tariffs.assert_not_awaited()
+    assert await redis_client.get(PARSER_LOCK_KEY) == "other-worker"
+
+
+async def test_failed_provider_does_not_stop_job(
+    parser_scheduler: ParserScheduler,
+    parser_service_mock: AsyncMock,
+    redis_client: Redis,
+) -> None:
+    parser_service_mock.update_provider_tariffs.side_effect = [RuntimeError, 5]
+
+    job_id = await parser_scheduler.enqueue(["Билайн", "Ростелеком"])
+    result = await parser_scheduler.run_job(job_id, ["Билайн", "Ростелеком"])
+
+    assert result is True
+    assert parser_service_mock.update_provider_tariffs.await_count == 2
+    assert await redis_client.get(PARSER_LOCK_KEY) is None
+
+
+async def test_lock_renewed_while_job_runs(
+    container_mock: MagicMock,
+    parser_service_mock: AsyncMock,
+    redis_client: Redis,
+    parser_config: ParserConfig,
+) -> None:
+    parser_scheduler = ParserScheduler(
+        container=container_mock,
+        redis_client=redis_client,
+        config=parser_config.model_copy(update={"lock_timeout_seconds": 1}),
+    )
+    lock_values = []
+
+    async def slow_update(provider_name: str, job_id: UUID) -> int:
+        await asyncio.sleep(1.5)
+        lock_values.append(await redis_client.get(PARSER_LOCK_KEY))
+        return 3
+
+    parser_service_mock.update_provider_tariffs.side_effect = slow_update
+
+    await parser_scheduler.run_job(uuid4(), ["Билайн"])
+
+    assert lock_values[0] is not None
+    assert await redis_client.get(PARSER_LOCK_KEY) is None
+
+
+async def test_lock_extend_keeps_foreign_lock(redis_client: Redis) -> None:
+    lock = RedisLock(redis_client, "test:lock", timeout=60)
+    assert await lock.acquire() is True
+    assert await lock.extend() is True
+
+    await redis_client.set("test:lock", "other-worker")
+
+    assert await lock.extend() is False
+    assert await redis_client.ttl("test:lock") == -1
+
+
+async def test_lock_release_keeps_foreign_lock(redis_client: Redis) -> None:
+    lock = RedisLock(redis_client, "test:lock", timeout=60)
+    assert await lock.acquire() is True
+    assert await RedisLock(redis_client, "test:lock", timeout=60).acquire() is False
+
+    await redis_client.set("test:lock", "other-worker")
+    await lock.release()
+
+    assert await redis_client.get("test:lock") == "other-worker"
@@ -0,0 +1,281 @@
+import uuid
+from collections.abc import AsyncIterator
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+from faker import Faker
+
+from isp_compare.core.config import ParserConfig
+from isp_compare.models.parser_run import ParserRun, ParserRunStatus
+from isp_compare.models.provider import Provider
+from isp_compare.parsers.base import BaseParser
+from isp_compare.repositories.parser_run import ParserRunRepository
+from isp_compare.repositories.provider import ProviderRepository
+from isp_compare.repositories.tariff import TariffRepository
+from isp_compare.schemas.tariff import TariffCreate
+from isp_compare.services.catalog_version import CatalogVersion
+from isp_compare.services.parser_service import ParserService
+from isp_compare.services.transaction_manager import TransactionManager
+
+
+class FakeParser(BaseParser):
+    provider_name = "Test Provider"
+    tariffs_url = "https://testprovider.com/tariffs"
+
+    async def fetch(self) -> str:
+        return "<html></html>"
+
+    async def parse(self, html: str) -> AsyncIterator[TariffCreate]:  # noqa: ARG002
+        self.errors_count = 1
+        for i in range(1, 6):
+            yield TariffCreate(
+                name=f"Tariff {i}", price=Decimal(f"{i}00.00"), speed=i * 100
+            )
+
+
+class FailingParser(FakeParser):
+    provider_name = "Failing Provider"
+
+    async def fetch(self) -> str:
+        raise ConnectionError("Connection refused")
+
+
+@pytest.fixture
+def provider_repository_mock() -> AsyncMock:
+    return AsyncMock(spec=ProviderRepository)
+
+
+@pytest.fixture
+def tariff_repository_mock() -> AsyncMock:
+    repository = AsyncMock(spec=TariffRepository)
+    repository.get_active_by_provider.return_value = []
+    return repository
+
+
+@pytest.fixture
+def parser_run_repository_mock() -> AsyncMock:
+    repository = AsyncMock(spec=ParserRunRepository)
+
+    async def create_side_effect(parser_run: ParserRun) -> None:
+        parser_run.id = uuid.uuid4()
+
+    repository.create.side_effect = create_side_effect
+    return repository
+
+
+@pytest.fixture
+def transaction_manager_mock() -> AsyncMock:
+    return AsyncMock(spec=TransactionManager)
+
+
+@pytest.fixture
+def catalog_version_mock() -> AsyncMock:
+    return AsyncMock(spec=CatalogVersion)
+
+
+@pytest.fixture
+def parser_service(
+    provider_repository_mock: AsyncMock,
+    tariff_repository_mock: AsyncMock,
+    parser_run_repository_mock: AsyncMock,
+    transaction_manager_mock: AsyncMock,
+    catalog_version_mock: AsyncMock,
+) -> ParserService:
+    service = ParserService(
+        provider_repository=provider_repository_mock,
+        tariff_repository=tariff_repository_mock,
+        parser_run_repository=parser_run_repository_mock,
+        transaction_manager=transaction_manager_mock,
+        config=ParserConfig(batch_size=2),
+        catalog_version=catalog_version_mock,
+    )
+    service._parsers = {
+        FakeParser.provider_name: FakeParser,
+        FailingParser.provider_name: FailingParser,
+    }
+    return service
+
+
+@pytest.fixture
+def mock_provider(faker: Faker) -> Provider:
+    return Provider(
+        id=uuid.uuid4(),
+        name=FakeParser.provider_name,
+        website=faker.url(),
+        phone=faker.phone_number(),
+    )
+
+
+async def test_update_provider_tariffs_records_run(
+    parser_service: ParserService,
+    provider_repository_mock: AsyncMock,
+    tariff_repository_mock: AsyncMock,
+    parser_run_repository_mock: AsyncMock,
+    catalog_version_mock: AsyncMock,
+    mock_provider: Provider,
+) -> None:
+    provider_repository_mock.get_by_name.return_value = mock_provider
+    job_id = uuid.uuid4()
+
+    count = await parser_service.update_provider_tariffs(
+        FakeParser.provider_name, job_id
+    )
+
+    assert count == 5
+    batches = [
+        call.args[0] for call in tariff_repository_mock.create_many.await_args_list
+    ]
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [tariff["name"] for batch in batches for tariff in batch] == [
+        f"Tariff {i}" for i in range(1, 6)
+    ]
+    assert all(
+        tariff["provider_id"] == mock_provider.id
+        for batch in batches
+        for tariff in batch
+    )
+
+    created_run = parser_run_repository_mock.create.await_args.args[0]
+    assert created_run.job_id == job_id
+    assert created_run.status == ParserRunStatus.RUNNING
+
+    run_id, stats = parser_run_repository_mock.update.await_args.args
+    assert run_id == created_run.id
+    assert stats["status"] == ParserRunStatus.SUCCESS
+    assert stats["provider_id"] == mock_provider.id
+    assert stats["items_count"] == 5
+    assert stats["errors_count"] == 1
+    assert stats["changes_count"] == 5
+    assert stats["finished_at"] is not None
+    for timing in ("http_time", "parse_time", "db_time"):
+        assert stats[timing] >= 0
+    catalog_version_mock.bump.assert_awaited_once()
+
+
+async def test_update_provider_tariffs_replaces_current(
+    parser_service: ParserService,
+    provider_repository_mock: AsyncMock,
+    tariff_repository_mock: AsyncMock,
+    parser_run_repository_mock: AsyncMock,
+    mock_provider: Provider,
+) -> None:
+    provider_repository_mock.get_by_name.return_value = mock_provider
+    current = {
+        name: {
+            "id": uuid.uuid4(),
+            "provider_id": mock_provider.id,
+            **TariffCreate(name=name, price=price, speed=speed).model_dump(),
+        }
+        for name, price, speed in (
+            ("Tariff 1", Decimal("100.00"), 100),
+            ("Tariff 2", Decimal("250.00"), 200),
+            ("Old Tariff", Decimal("500.00"), 500),
+        )
+    }
+    tariff_repository_mock.get_active_by_provider.return_value = list(current.values())
+
+    count = await parser_service.update_provider_tariffs(FakeParser.provider_name)
+
+    assert count == 5
+    inserted = [
+        tariff["name"]
+        for call in tariff_repository_mock.create_many.await_args_list
+        for tariff in call.args[0]
+    ]
+    assert inserted == ["Tariff 3", "Tariff 4", "Tariff 5"]
+    updated = [
+        tariff
+        for call in tariff_repository_mock.update_many.await_args_list
+        for tariff in call.args[0]
+    ]
+    assert [(tariff["id"], tariff["price"]) for tariff in updated] == [
+        (current["Tariff 2"]["id"], Decimal("200.00"))
+    ]
+    tariff_repository_mock.deactivate_many.assert_awaited_once_with(
+        [current["Old Tariff"]["id"]]
+    )
+    _, stats = parser_run_repository_mock.update.await_args.args
+    # 3 новых, 1 измененный и 1 удаленный; Tariff 1 не изменился
+    assert stats["changes_count"] == 5
+
+
+async def test_update_provider_tariffs_empty_parse_keeps_catalog(
+    parser_service: ParserService,
+    provider_repository_mock: AsyncMock,
+    tariff_repository_mock: AsyncMock,
+    parser_run_repository_mock: AsyncMock,
+    transaction_manager_mock: AsyncMock,
+    mock_provider: Provider,
+) -> None:
+    class EmptyParser(FakeParser):
+        async def parse(self, html: str) -> AsyncIterator[TariffCreate]:  # noqa: ARG002
+            return
+            yield
+
+    parser_service._parsers[FakeParser.provider_name] = EmptyParser
+    provider_repository_mock.get_by_name.return_value = mock_provider
+    tariff_repository_mock.get_active_by_provider.return_value = [
+        {"id": uuid.uuid4(), "name": "Tariff 1"}
+    ]
+
+    count = await parser_service.update_provider_tariffs(FakeParser.provider_name)
+
+    assert count == 0
+    tariff_repository_mock.deactivate_many.assert_not_awaited()
+    transaction_manager_mock.rollback.assert_awaited_once()
+    _, stats = parser_run_repository_mock.update.await_args.args
+    assert stats["status"] == ParserRunStatus.FAILED
+
+
+async def test_update_provider_tariffs_provider_not_in_database(
+    parser_service: ParserService,
+    provider_repository_mock: AsyncMock,
+    tariff_repository_mock: AsyncMock,
+    parser_run_repository_mock: AsyncMock,
+    transaction_manager_mock: AsyncMock,
+    catalog_version_mock: AsyncMock,
+) -> None:
+    provider_repository_mock.get_by_name.return_value = None
+
+    count = await parser_service.update_provider_tariffs(FakeParser.provider_name)
+
+    assert count == 0
+    tariff_repository_mock.create_many.assert_not_awaited()
+    transaction_manager_mock.rollback.assert_awaited_once()
+    catalog_version_mock.bump.assert_not_awaited()
+
+    _, stats = parser_run_repository_mock.update.await_args.args
+    assert stats["status"] == ParserRunStatus.FAILED
+    assert FakeParser.provider_name in stats["error"]
+
+
+async def test_update_provider_tariffs_fetch_error(
+    parser_service: ParserService,
+    provider_repository_mock: AsyncMock,
+    tariff_repository_mock: AsyncMock,
+    parser_run_repository_mock: AsyncMock,
+    mock_provider: Provider,
+) -> None:
+    mock_provider.name = "Failing Provider"
+    provider_repository_mock.get_by_name.return_value = mock_provider
+
+    count = await parser_service.update_provider_tariffs("Failing Provider")
+
+    assert count == 0
+    tariff_repository_mock.create_many.assert_not_awaited()
+
+    _, stats = parser_run_repository_mock.update.await_args.args
+    assert stats["status"] == ParserRunStatus.FAILED
+    assert stats["error"] == "Connection refused"
+    assert "http_time" not in stats
+
+
+async def test_update_provider_tariffs_unknown_parser(
+    parser_service: ParserService,
+    parser_run_repository_mock: AsyncMock,
+) -> None:
+    count = await parser_service.update_provider_tariffs("Unknown")
+
+    assert count == 0
+    parser_run_repository_mock.create.assert_not_awaited()
@@ -1,5 +1,5 @@
+import asyncio
 import uuid
-from typing import Any
 from unittest.mock import AsyncMock
 
 import pytest
@@ -14,7 +14,15 @@ from isp_compare.repositories.provider import ProviderRepository
 from isp_compare.schemas.provider import (
     ProviderResponse,
 )
-from isp_compare.services.provider import ProviderService
+from isp_compare.services.cache import RedisCache
+from isp_compare.services.catalog_version import CatalogVersion
+from isp_compare.services.provider import (
+    ALL_PROVIDERS_CACHE_KEY,
+    PROVIDER_CACHE_KEY,
+    ProviderService,
+    providers_adapter,
+)
+from isp_compare.services.transaction_manager import TransactionManager
 
 
 @pytest.fixture
@@ -23,29 +31,21 @@ def provider_repository_mock() -> AsyncMock:
 
 
 @pytest.fixture
-def redis_client_mock() -> AsyncMock:
-    redis_mock = AsyncMock(spec=Redis)
-
-    async def async_none(*_: Any, **__: Any) -> None:
-        return None
-
-    async def async_true(*_: Any, **__: Any) -> True:
-        return True
-
-    redis_mock.get.side_effect = async_none
-    redis_mock.set.side_effect = async_true
-
-    return redis_mock
+def transaction_manager_mock() -> AsyncMock:
+    return AsyncMock(spec=TransactionManager)
 
 
 @pytest.fixture
 def provider_service(
     provider_repository_mock: AsyncMock,
-    redis_client_mock: AsyncMock,
+    redis_client: Redis,
+    transaction_manager_mock: AsyncMock,
 ) -> ProviderService:
     return ProviderService(
         provider_repository=provider_repository_mock,
-        redis_client=redis_client_mock,
+        cache=RedisCache(redis_client),
+        catalog_version=CatalogVersion(redis_client),
+        transaction_manager=transaction_manager_mock,
     )
 
 
@@ -59,6 +59,8 @@ def mock_provider(faker: Faker) -> Provider:
         phone=faker.phone_number(),
         logo_url="https://example.com/logo.png",
         rating=4.5,
+        rating_sum=9,
+        reviews_count=2,
     )
 
 
@@ -68,7 +70,7 @@ async def test_get_provider_success(
     mock_provider: Provider,
 ) -> None:
     provider_id = uuid.uuid4()
-    provider_repository_mock.get_by_id.return_value = mock_provider, 0
+    provider_repository_mock.get_by_id.return_value = mock_provider
 
     result = await provider_service.get_provider(provider_id)
 
@@ -80,6 +82,7 @@ async def test_get_provider_success(
     assert str(result.website) == mock_provider.website
     assert result.logo_url == mock_provider.logo_url
     assert result.rating == mock_provider.rating
+    assert result.reviews_count == mock_provider.reviews_count
 
 
 async def test_get_provider_not_found(
@@ -95,21 +98,111 @@ async def test_get_provider_not_found(
     provider_repository_mock.get_by_id.assert_called_once_with(provider_id)
 
 
+async def test_get_provider_from_cache(
+    provider_service: ProviderService,
+    provider_repository_mock: AsyncMock,
+    redis_client: Redis,
+    mock_provider: Provider,
+) -> None:
+    provider_repository_mock.get_by_id.return_value = mock_provider
+
+    await provider_service.get_provider(mock_provider.id)
+    result = await provider_service.get_provider(mock_provider.id)
+
+    provider_repository_mock.get_by_id.assert_called_once_with(mock_provider.id)
+    assert result.id == mock_provider.id
+    cache_key = PROVIDER_CACHE_KEY.format(provider_id=mock_provider.id)
+    assert await redis_client.ttl(cache_key) > 0
+
+
+async def test_get_provider_from_all_providers_cache(
+    provider_service: ProviderService,
+    provider_repository_mock: AsyncMock,
+    mock_provider: Provider,
+) -> None:
+    provider_repository_mock.get_all.return_value = [mock_provider]
+    await provider_service.get_all_providers_json()
+
+    result = await provider_service.get_provider(mock_provider.id)
+
+    provider_repository_mock.get_by_id.assert_not_called()
+    assert result.id == mock_provider.id
+    assert result.reviews_count == mock_provider.reviews_count
+
+
 async def test_get_all_providers(
     provider_service: ProviderService,
     provider_repository_mock: AsyncMock,
-    redis_client_mock: AsyncMock,
+    redis_client: Redis,
     mock_provider: Provider,
 ) -> None:
-    providers = [(mock_provider, 0), (mock_provider, 0), (mock_provider, 0)]
+    providers = [mock_provider, mock_provider, mock_provider]
     provider_repository_mock.get_all.return_value = providers
 
-    result = await provider_service.get_all_providers()
+    content = await provider_service.get_all_providers_json()
 
-    redis_client_mock.get.assert_called_once_with("all_providers")
     provider_repository_mock.get_all.assert_called_once()
+    assert await redis_client.ttl(ALL_PROVIDERS_CACHE_KEY) > 0
+    result = providers_adapter.validate_json(content)
     assert len(result) == len(providers)
     for provider_response in result:
-        assert isinstance(provider_response, ProviderResponse)
         assert provider_response.id == mock_provider.id
         assert provider_response.name == mock_provider.name
+
+
+async def test_get_all_providers_from_cache(
+    provider_service: ProviderService,
+    provider_repository_mock: AsyncMock,
+    mock_provider: Provider,
+) -> None:
+    provider_repository_mock.get_all.return_value = [mock_provider]
+
+    first = await provider_service.get_all_providers_json()
+    second = await provider_service.get_all_providers_json()
+
+    provider_repository_mock.get_all.assert_called_once()
+    assert isinstance(second, bytes)
+    assert first == second
+
+
+async def test_get_all_providers_single_flight(
+    provider_service: ProviderService,
+    provider_repository_mock: AsyncMock,
+    mock_provider: Provider,
+) -> None:
+    async def slow_get_all() -> list[Provider]:
+        await asyncio.sleep(0.1)
+        return [mock_provider]
+
+    provider_repository_mock.get_all.side_effect = slow_get_all
+
+    results = await asyncio.gather(
+        *(provider_service.get_all_providers_json() for _ in range(10))
+    )
+
+    provider_repository_mock.get_all.assert_called_once()
+    assert len(set(results)) == 1
+
+
+async def test_recalculate_review_stats(
+    provider_service: ProviderService,
+    provider_repository_mock: AsyncMock,
+    redis_client: Redis,
+    transaction_manager_mock: AsyncMock,
+    mock_provider: Provider,
+) -> None:
+    provider_repository_mock.get_by_id.return_value = mock_provider
+    provider_repository_mock.get_all.return_value = [mock_provider]
+    await provider_service.get_all_providers_json()
+    await provider_service.get_provider(mock_provider.id)
+    provider_repository_mock.recalculate_review_stats.return_value = 3
+
+    updated = await provider_service.recalculate_review_stats()
+
+    assert updated == 3
+    provider_repository_mock.recalculate_review_stats.assert_called_once_with()
+    transaction_manager_mock.commit.assert_called_once()
+    assert not await redis_client.exists(ALL_PROVIDERS_CACHE_KEY)
+    assert not await redis_client.exists(
+        PROVIDER_CACHE_KEY.format(provider_id=mock_provider.id)
+    )
@@ -1,105 +1,103 @@
+import time
 import uuid
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import pytest
+from redis.asyncio import Redis
 
 from isp_compare.services.rate_limiter import RateLimiter
 
 
 @pytest.fixture
-def redis_mock() -> AsyncMock:
-    redis = AsyncMock()
-    redis.zremrangebyscore = AsyncMock()
-    redis.zcard = AsyncMock()
-    redis.zadd = AsyncMock()
-    redis.expire = AsyncMock()
-    return redis
+def rate_limiter(redis_client: Redis) -> RateLimiter:
+    return RateLimiter(redis_client)
 
 
-@pytest.fixture
-def rate_limiter(redis_mock: AsyncMock) -> RateLimiter:
-    return RateLimiter(redis_mock)
+async def add_attempts(redis_client: Redis, key: str, count: int) -> None:
+    now = int(time.time())
+    await redis_client.zadd(key, {str(uuid.uuid4()): now for _ in range(count)})
 
 
 async def test_check_rate_limit_first_attempt(
-    rate_limiter: RateLimiter, redis_mock: AsyncMock
+    rate_limiter: RateLimiter, redis_client: Redis
 ) -> None:
     """Тест первой попытки (Redis пуст)"""
-    redis_mock.zcard.return_value = 0  # В Redis пока нет попыток
-
     is_allowed, remaining = await rate_limiter.check_rate_limit("test:key", 5, 10)
 
     assert is_allowed is True
     assert remaining == 4  # 5 - 1 = 4
 
-    redis_mock.zremrangebyscore.assert_called_once()
-    redis_mock.zcard.assert_called_once()
-    redis_mock.zadd.assert_called_once()  # Добавляем первую попытку
-    redis_mock.expire.assert_called_once()
+    assert await redis_client.zcard("test:key") == 1  # Добавляем первую попытку
+    assert 0 < await redis_client.ttl("test:key") <= 600
 
 
 async def test_check_rate_limit_allowed(
-    rate_limiter: RateLimiter, redis_mock: AsyncMock
+    rate_limiter: RateLimiter, redis_client: Redis
 ) -> None:
-    redis_mock.zcard.return_value = 2
+    await add_attempts(redis_client, "test:key", 2)
 
     is_allowed, remaining = await rate_limiter.check_rate_limit("test:key", 5, 10)
 
     assert is_allowed is True
     assert remaining == 2  # 5 - 3 (2 в Redis + 1 текущая)
 
-    redis_mock.zremrangebyscore.assert_called_once()
-    redis_mock.zcard.assert_called_once()
-    redis_mock.zadd.assert_called_once()  # Добавляем текущую попытку
-    redis_mock.expire.assert_called_once()
+    assert await redis_client.zcard("test:key") == 3  # Добавляем текущую попытку
 
 
 async def test_check_rate_limit_exceeded(
-    rate_limiter: RateLimiter, redis_mock: AsyncMock
+    rate_limiter: RateLimiter, redis_client: Redis
 ) -> None:
-    redis_mock.zcard.return_value = 5
+    await add_attempts(redis_client, "test:key", 5)
 
     is_allowed, remaining = await rate_limiter.check_rate_limit("test:key", 5, 10)
 
     assert is_allowed is False
     assert remaining == 0
 
-    redis_mock.zremrangebyscore.assert_called_once()
-    redis_mock.zcard.assert_called_once()
-    assert redis_mock.zadd.call_count == 0  # Не добавляем при превышении лимита
-    redis_mock.expire.assert_called_once()
+    assert await redis_client.zcard("test:key") == 5  # Не добавляем при превышении
+    assert await redis_client.ttl("test:key") > 0
 
 
 async def test_check_rate_limit_at_limit(
-    rate_limiter: RateLimiter, redis_mock: AsyncMock
+    rate_limiter: RateLimiter, redis_client: Redis
 ) -> None:
     """Тест случая, когда достигаем точно лимита"""
-    redis_mock.zcard.return_value = 4  # 4 попытки в Redis
+    await add_attempts(redis_client, "test:key", 4)  # 4 попытки в Redis
 
     is_allowed, remaining = await rate_limiter.check_rate_limit("test:key", 5, 10)
 
     assert is_allowed is True  # 4 + 1 = 5, что равно лимиту
     assert remaining == 0  # 5 - 5 = 0
 
-    redis_mock.zremrangebyscore.assert_called_once()
-    redis_mock.zcard.assert_called_once()
-    redis_mock.zadd.assert_called_once()  # Добавляем 5-ю (последнюю) попытку
-    redis_mock.expire.assert_called_once()
+    assert await redis_client.zcard("test:key") == 5  # Добавляем 5-ю попытку
+
+
+async def test_check_rate_limit_drops_old_attempts(
+    rate_limiter: RateLimiter, redis_client: Redis
+) -> None:
+    await redis_client.zadd("test:key", {"old": int(time.time()) - 11 * 60})
+
+    is_allowed, remaining = await rate_limiter.check_rate_limit("test:key", 5, 10)
+
+    assert is_allowed is True
+    assert remaining == 4
+    assert await redis_client.zscore("test:key", "old") is None
 
 
 async def test_add_failed_attempt(
-    rate_limiter: RateLimiter, redis_mock: AsyncMock
+    rate_limiter: RateLimiter, redis_client: Redis
 ) -> None:
     await rate_limiter.add_failed_attempt("test:key", 5)
 
-    redis_mock.zadd.assert_called_once()
-    redis_mock.expire.assert_called_once()
+    assert await redis_client.zcard("test:key") == 1
+    assert 0 < await redis_client.ttl("test:key") <= 300
 
 
 async def test_check_failed_login_limit_allowed(
-    rate_limiter: RateLimiter, redis_mock: AsyncMock
+    rate_limiter: RateLimiter, redis_client: Redis
 ) -> None:
-    redis_mock.zcard.return_value = 5
+    key = "failed_login_limit:testuser:127.0.0.1"
+    await add_attempts(redis_client, key, 5)
 
     is_allowed, remaining = await rate_limiter.check_failed_login_limit(
         "testuser", "127.0.0.1"
@@ -108,16 +106,14 @@ async def test_check_failed_login_limit_allowed(
     assert is_allowed is True
     assert remaining == 5  # 10 - 5 (НЕ добавляем текущую попытку)
 
-    redis_mock.zremrangebyscore.assert_called_once()
-    redis_mock.zcard.assert_called_once()
-    assert redis_mock.zadd.call_count == 0  # НЕ добавляем попытку - только проверяем
-    redis_mock.expire.assert_called_once()
+    assert await redis_client.zcard(key) == 5  # НЕ добавляем попытку - только проверяем
+    assert 0 < await redis_client.ttl(key) <= 300
 
 
 async def test_check_failed_login_limit_exceeded(
-    rate_limiter: RateLimiter, redis_mock: AsyncMock
+    rate_limiter: RateLimiter, redis_client: Redis
 ) -> None:
-    redis_mock.zcard.return_value = 10
+    await add_attempts(redis_client, "failed_login_limit:testuser:127.0.0.1", 10)
 
     is_allowed, remaining = await rate_limiter.check_failed_login_limit(
         "testuser", "127.0.0.1"
@@ -126,14 +122,8 @@ async def test_check_failed_login_limit_exceeded(
     assert is_allowed is False
     assert remaining == 0
 
-    redis_mock.zremrangebyscore.assert_called_once()
-    redis_mock.zcard.assert_called_once()
-    redis_mock.expire.assert_called_once()
-
 
-async def test_add_failed_login_attempt(
-    rate_limiter: RateLimiter, redis_mock: AsyncMock
-) -> None:
+async def test_add_failed_login_attempt(rate_limiter: RateLimiter) -> None:
     with patch.object(rate_limiter, "add_failed_attempt") as mock_add_failed_attempt:
         await rate_limiter.add_failed_login_attempt("testuser", "127.0.0.1")
 
@@ -143,41 +133,34 @@ async def test_add_failed_login_attempt(
 
 
 async def test_check_password_change_limit_allowed(
-    rate_limiter: RateLimiter, redis_mock: AsyncMock
+    rate_limiter: RateLimiter, redis_client: Redis
 ) -> None:
     user_id = uuid.uuid4()
-    redis_mock.zcard.return_value = 3
+    key = f"failed_password_change_limit:{user_id}"
+    await add_attempts(redis_client, key, 3)
 
     is_allowed, remaining = await rate_limiter.check_password_change_limit(user_id)
 
     assert is_allowed is True
     assert remaining == 7  # 10 - 3 (НЕ добавляем текущую попытку)
 
-    redis_mock.zremrangebyscore.assert_called_once()
-    redis_mock.zcard.assert_called_once()
-    assert redis_mock.zadd.call_count == 0  # НЕ добавляем попытку - только проверяем
-    redis_mock.expire.assert_called_once()
+    assert await redis_client.zcard(key) == 3  # НЕ добавляем попытку - только проверяем
+    assert await redis_client.ttl(key) > 0
 
 
 async def test_check_password_change_limit_exceeded(
-    rate_limiter: RateLimiter, redis_mock: AsyncMock
+    rate_limiter: RateLimiter, redis_client: Redis
 ) -> None:
     user_id = uuid.uuid4()
-    redis_mock.zcard.return_value = 10
+    await add_attempts(redis_client, f"failed_password_change_limit:{user_id}", 10)
 
     is_allowed, remaining = await rate_limiter.check_password_change_limit(user_id)
 
     assert is_allowed is False
     assert remaining == 0
 
-    redis_mock.zremrangebyscore.assert_called_once()
-    redis_mock.zcard.assert_called_once()
-    redis_mock.expire.assert_called_once()
-
 
-async def test_add_password_change_attempt(
-    rate_limiter: RateLimiter, redis_mock: AsyncMock
-) -> None:
+async def test_add_password_change_attempt(rate_limiter: RateLimiter) -> None:
     user_id = uuid.uuid4()
 
     with patch.object(rate_limiter, "add_failed_attempt") as mock_add_failed_attempt:
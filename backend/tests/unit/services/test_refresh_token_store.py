@@ -0,0 +1,347 @@
+import importlib.util
+import uuid
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from redis.asyncio import Redis
+
+from isp_compare.core.config import RefreshTokenConfig
+from isp_compare.core.exceptions import (
+    InvalidTokenException,
+    TokenExpiredException,
+    TokenRevokedException,
+)
+from isp_compare.models.token import RefreshToken
+from isp_compare.models.user import User
+from isp_compare.repositories.token import RefreshTokenRepository
+from isp_compare.services.refresh_token_store import (
+    REFRESH_TOKEN_GENERATION_KEY,
+    REFRESH_TOKEN_KEY,
+    REFRESH_TOKEN_OWNER_KEY,
+    RedisRefreshTokenStore,
+    SqlRefreshTokenStore,
+)
+from isp_compare.services.token_processor import TokenProcessor
+from isp_compare.services.transaction_manager import TransactionManager
+
+# Скрипты Redis в fakeredis выполняются через lupa (fakeredis[lua])
+requires_lua = pytest.mark.skipif(
+    importlib.util.find_spec("lupa") is None, reason="fakeredis[lua] is required"
+)
+
+TOKEN_HASH = TokenProcessor.hash_refresh_token("refresh_token")
+NEW_TOKEN_HASH = TokenProcessor.hash_refresh_token("new_refresh_token")
+
+
+def expires_in(days: float) -> datetime:
+    return datetime.now(UTC) + timedelta(days=days)
+
+
+@pytest.fixture
+def refresh_token_repository_mock() -> AsyncMock:
+    return AsyncMock(spec=RefreshTokenRepository)
+
+
+@pytest.fixture
+def transaction_manager_mock() -> AsyncMock:
+    return AsyncMock(spec=TransactionManager)
+
+
+@pytest.fixture
+def sql_store(
+    refresh_token_repository_mock: AsyncMock,
+    transaction_manager_mock: AsyncMock,
+) -> SqlRefreshTokenStore:
+    return SqlRefreshTokenStore(
+        refresh_token_repository=refresh_token_repository_mock,
+        transaction_manager=transaction_manager_mock,
+    )
+
+
+@pytest.fixture
+def mock_user() -> User:
+    return User(id=uuid.uuid4(), username="user", email="user@example.com")
+
+
+@pytest.fixture
+def refresh_token(mock_user: User) -> RefreshToken:
+    return RefreshToken(
+        id=uuid.uuid4(),
+        token_hash=TOKEN_HASH,
+        user_id=mock_user.id,
+        expires_at=expires_in(1),
+        revoked=False,
+    )
+
+
+async def test_sql_create(
+    sql_store: SqlRefreshTokenStore,
+    mock_user: User,
+    refresh_token_repository_mock: AsyncMock,
+    transaction_manager_mock: AsyncMock,
+) -> None:
+    expires_at = expires_in(7)
+
+    await sql_store.create(mock_user.id, TOKEN_HASH, expires_at)
+
+    refresh_token_repository_mock.create_revoking_others.assert_called_once_with(
+        mock_user.id, TOKEN_HASH, expires_at
+    )
+    refresh_token_repository_mock.create.assert_not_called()
+    transaction_manager_mock.commit.assert_called_once()
+
+
+async def test_sql_create_without_revocation(
+    sql_store: SqlRefreshTokenStore,
+    mock_user: User,
+    refresh_token_repository_mock: AsyncMock,
+) -> None:
+    expires_at = expires_in(7)
+
+    await sql_store.create(mock_user.id, TOKEN_HASH, expires_at, revoke_existing=False)
+
+    refresh_token_repository_mock.create_revoking_others.assert_not_called()
+    created_token = refresh_token_repository_mock.create.call_args[0][0]
+    assert isinstance(created_token, RefreshToken)
+    assert created_token.token_hash == TOKEN_HASH
+    assert created_token.user_id == mock_user.id
+    assert created_token.expires_at == expires_at
+
+
+async def test_sql_rotate(
+    sql_store: SqlRefreshTokenStore,
+    mock_user: User,
+    refresh_token: RefreshToken,
+    refresh_token_repository_mock: AsyncMock,
+    transaction_manager_mock: AsyncMock,
+) -> None:
+    refresh_token_repository_mock.get_by_token_hash.return_value = refresh_token
+
+    user_id = await sql_store.rotate(TOKEN_HASH, NEW_TOKEN_HASH, expires_in(7))
+
+    assert user_id == mock_user.id
+    refresh_token_repository_mock.get_by_token_hash.assert_called_once_with(TOKEN_HASH)
+    refresh_token_repository_mock.revoke.assert_called_once_with(TOKEN_HASH)
+    created_token = refresh_token_repository_mock.create.call_args[0][0]
+    assert created_token.token_hash == NEW_TOKEN_HASH
+    assert created_token.user_id == mock_user.id
+    transaction_manager_mock.commit.assert_called_once()
+
+
+async def test_sql_rotate_not_found(
+    sql_store: SqlRefreshTokenStore,
+    refresh_token_repository_mock: AsyncMock,
+) -> None:
+    refresh_token_repository_mock.get_by_token_hash.return_value = None
+
+    with pytest.raises(InvalidTokenException):
+        await sql_store.rotate(TOKEN_HASH, NEW_TOKEN_HASH, expires_in(7))
+
+
+async def test_sql_rotate_expired(
+    sql_store: SqlRefreshTokenStore,
+    refresh_token: RefreshToken,
+    refresh_token_repository_mock: AsyncMock,
+) -> None:
+    refresh_token.expires_at = expires_in(-1)
+    refresh_token_repository_mock.get_by_token_hash.return_value = refresh_token
+
+    with pytest.raises(TokenExpiredException):
+        await sql_store.rotate(TOKEN_HASH, NEW_TOKEN_HASH, expires_in(7))
+
+    refresh_token_repository_mock.create.assert_not_called()
+
+
+async def test_sql_rotate_revoked(
+    sql_store: SqlRefreshTokenStore,
+    refresh_token: RefreshToken,
+    refresh_token_repository_mock: AsyncMock,
+    transaction_manager_mock: AsyncMock,
+) -> None:
+    refresh_token.revoked = True
+    refresh_token_repository_mock.get_by_token_hash.return_value = refresh_token
+
+    with pytest.raises(TokenRevokedException):
+        await sql_store.rotate(TOKEN_HASH, NEW_TOKEN_HASH, expires_in(7))
+
+    refresh_token_repository_mock.revoke_all_for_user.assert_called_once_with(
+        refresh_token.user_id
+    )
+    transaction_manager_mock.commit.assert_called_once()
+    refresh_token_repository_mock.create.assert_not_called()
+
+
+async def test_sql_revoke(
+    sql_store: SqlRefreshTokenStore,
+    refresh_token_repository_mock: AsyncMock,
+    transaction_manager_mock: AsyncMock,
+) -> None:
+    await sql_store.revoke(TOKEN_HASH)
+
+    refresh_token_repository_mock.revoke.assert_called_once_with(TOKEN_HASH)
+    transaction_manager_mock.commit.assert_called_once()
+
+
+@pytest.fixture
+def redis_store(
+    redis_client: Redis, refresh_token_config: RefreshTokenConfig
+) -> RedisRefreshTokenStore:
+    return RedisRefreshTokenStore(redis_client, refresh_token_config)
+
+
+def token_key(user_id: uuid.UUID, token_hash: bytes) -> str:
+    return REFRESH_TOKEN_KEY.format(user_id=user_id, token_hash=token_hash.hex())
+
+
+def owner_key(token_hash: bytes) -> str:
+    return REFRESH_TOKEN_OWNER_KEY.format(token_hash=token_hash.hex())
+
+
+def test_redis_keys_share_user_hash_tag() -> None:
+    user_id = uuid.uuid4()
+    hash_tag = f"{{{user_id}}}"
+
+    # Скрипты трогают только ключи токенов и поколения одного пользователя,
+    # поэтому все они должны попасть в один слот Redis Cluster
+    assert hash_tag in token_key(user_id, TOKEN_HASH)
+    assert hash_tag in REFRESH_TOKEN_GENERATION_KEY.format(user_id=user_id)
+
+
+@requires_lua
+async def test_redis_create_sets_ttl(
+    redis_store: RedisRefreshTokenStore, redis_client: Redis
+) -> None:
+    user_id = uuid.uuid4()
+
+    await redis_store.create(user_id, TOKEN_HASH, expires_in(7))
+
+    token = await redis_client.hgetall(token_key(user_id, TOKEN_HASH))
+    assert token == {"generation": "1", "revoked": "0"}
+    assert await redis_client.get(owner_key(TOKEN_HASH)) == str(user_id)
+    for key in (token_key(user_id, TOKEN_HASH), owner_key(TOKEN_HASH)):
+        ttl = await redis_client.ttl(key)
+        assert timedelta(days=7) - timedelta(minutes=1) < timedelta(seconds=ttl)
+
+
+@requires_lua
+async def test_redis_rotate(
+    redis_store: RedisRefreshTokenStore, redis_client: Redis
+) -> None:
+    user_id = uuid.uuid4()
+    await redis_store.create(user_id, TOKEN_HASH, expires_in(7))
+
+    result = await redis_store.rotate(TOKEN_HASH, NEW_TOKEN_HASH, expires_in(7))
+
+    assert result == user_id
+    assert await redis_client.hget(token_key(user_id, TOKEN_HASH), "revoked") == "1"
+    assert await redis_client.hget(token_key(user_id, NEW_TOKEN_HASH), "revoked") == "0"
+    assert await redis_client.get(owner_key(NEW_TOKEN_HASH)) == str(user_id)
+    # Отозванный токен хранится только для распознавания повторного
+    # использования
+    assert (
+        await redis_client.ttl(token_key(user_id, TOKEN_HASH))
+        <= timedelta(days=1).total_seconds()
+    )
+
+
+@requires_lua
+async def test_redis_rotate_unknown_token(
+    redis_store: RedisRefreshTokenStore,
+) -> None:
+    with pytest.raises(InvalidTokenException):
+        await redis_store.rotate(TOKEN_HASH, NEW_TOKEN_HASH, expires_in(7))
+
+
+@requires_lua
+async def test_redis_rotate_reuse_revokes_all(
+    redis_store: RedisRefreshTokenStore,
+) -> None:
+    user_id = uuid.uuid4()
+    other_user_id = uuid.uuid4()
+    other_token_hash = TokenProcessor.hash_refresh_token("other_token")
+    await redis_store.create(user_id, TOKEN_HASH, expires_in(7))
+    await redis_store.create(other_user_id, other_token_hash, expires_in(7))
+    await redis_store.rotate(TOKEN_HASH, NEW_TOKEN_HASH, expires_in(7))
+
+    with pytest.raises(TokenRevokedException):
+        await redis_store.rotate(
+            TOKEN_HASH,
+            TokenProcessor.hash_refresh_token("stolen_rotation"),
+            expires_in(7),
+        )
+
+    with pytest.raises(TokenRevokedException):
+        await redis_store.rotate(
+            NEW_TOKEN_HASH,
+            TokenProcessor.hash_refresh_token("next_rotation"),
+            expires_in(7),
+        )
+    assert (
+        await redis_store.rotate(
+            other_token_hash,
+            TokenProcessor.hash_refresh_token("other_rotation"),
+            expires_in(7),
+        )
+        == other_user_id
+    )
+
+
+@requires_lua
+async def test_redis_create_revokes_existing(
+    redis_store: RedisRefreshTokenStore,
+) -> None:
+    user_id = uuid.uuid4()
+    await redis_store.create(user_id, TOKEN_HASH, expires_in(7))
+
+    await redis_store.create(user_id, NEW_TOKEN_HASH, expires_in(7))
+
+    assert (
+        await redis_store.rotate(
+            NEW_TOKEN_HASH,
+            TokenProcessor.hash_refresh_token("rotation"),
+            expires_in(7),
+        )
+        == user_id
+    )
+    with pytest.raises(TokenRevokedException):
+        await redis_store.rotate(
+            TOKEN_HASH,
+            TokenProcessor.hash_refresh_token("stale_rotation"),
+            expires_in(7),
+        )
+
+
+@requires_lua
+async def test_redis_create_without_revocation(
+    redis_store: RedisRefreshTokenStore,
+) -> None:
+    user_id = uuid.uuid4()
+    await redis_store.create(user_id, TOKEN_HASH, expires_in(7))
+
+    await redis_store.create(
+        user_id, NEW_TOKEN_HASH, expires_in(7), revoke_existing=False
+    )
+
+    assert (
+        await redis_store.rotate(
+            TOKEN_HASH, TokenProcessor.hash_refresh_token("rotation"), expires_in(7)
+        )
+        == user_id
+    )
+
+
+@requires_lua
+async def test_redis_revoke(
+    redis_store: RedisRefreshTokenStore, redis_client: Redis
+) -> None:
+    user_id = uuid.uuid4()
+    await redis_store.create(user_id, TOKEN_HASH, expires_in(7))
+
+    await redis_store.revoke(TOKEN_HASH)
+    await redis_store.revoke(NEW_TOKEN_HASH)
+
+    assert await redis_client.hget(token_key(user_id, TOKEN_HASH), "revoked") == "1"
+    assert not await redis_client.exists(owner_key(NEW_TOKEN_HASH))
+    with pytest.raises(TokenRevokedException):
+        await redis_store.rotate(TOKEN_HASH, NEW_TOKEN_HASH, expires_in(7))
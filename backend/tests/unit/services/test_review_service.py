@@ -1,11 +1,13 @@
 import uuid
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, call
 
 import pytest
 from faker import Faker
+from redis.asyncio import Redis
 
 from isp_compare.core.exceptions import (
+    InvalidCursorException,
     ProviderNotFoundException,
     ReviewNotFoundException,
 )
@@ -15,7 +17,15 @@ from isp_compare.repositories.provider import ProviderRepository
 from isp_compare.repositories.review import ReviewRepository
 from isp_compare.schemas.review import ReviewCreate, ReviewResponse, ReviewUpdate
 from isp_compare.services.identity_provider import IdentityProvider
-from isp_compare.services.review import ReviewService
+from isp_compare.services.cache import RedisCache
+from isp_compare.services.catalog_version import CatalogVersion
+from isp_compare.services.cursor import encode_cursor
+from isp_compare.services.provider import ALL_PROVIDERS_CACHE_KEY
+from isp_compare.services.review import (
+    PROVIDER_REVIEWS_CACHE_KEY,
+    PROVIDER_REVIEWS_CACHE_SIZE,
+    ReviewService,
+)
 from isp_compare.services.transaction_manager import TransactionManager
 
 
@@ -45,12 +55,15 @@ def review_service(
     provider_repository_mock: AsyncMock,
     transaction_manager_mock: AsyncMock,
     identity_provider_mock: AsyncMock,
+    redis_client: Redis,
 ) -> ReviewService:
     return ReviewService(
         review_repository=review_repository_mock,
         provider_repository=provider_repository_mock,
         transaction_manager=transaction_manager_mock,
         identity_provider=identity_provider_mock,
+        cache=RedisCache(redis_client),
+        catalog_version=CatalogVersion(redis_client),
     )
 
 
@@ -113,9 +126,8 @@ async def test_create_review_success(
     mock_provider: Provider,
 ) -> None:
     identity_provider_mock.get_current_user.return_value = mock_user
-    provider_repository_mock.get_by_id.return_value = mock_provider
+    provider_repository_mock.exists.return_value = True
     review_repository_mock.get_by_user_and_provider.return_value = None
-    review_repository_mock.calculate_average_rating.return_value = 4.5
 
     review_data = ReviewCreate(
         rating=5,
@@ -132,20 +144,15 @@ async def test_create_review_success(
     result = await review_service.create_review(mock_provider.id, review_data)
 
     identity_provider_mock.get_current_user.assert_called_once()
-    provider_repository_mock.get_by_id.assert_called_once_with(
-        provider_id=mock_provider.id
-    )
+    provider_repository_mock.exists.assert_called_once_with(mock_provider.id)
     review_repository_mock.get_by_user_and_provider.assert_called_once_with(
-        user_id=mock_user.id, provider_id=mock_provider.id
+        user_id=mock_user.id, provider_id=mock_provider.id, for_update=True
     )
     review_repository_mock.create.assert_called_once()
-    review_repository_mock.calculate_average_rating.assert_called_once_with(
-        provider_id=mock_provider.id
+    provider_repository_mock.apply_review_change.assert_called_once_with(
+        mock_provider.id, rating_delta=review_data.rating, count_delta=1
     )
-    provider_repository_mock.update.assert_called_once_with(
-        mock_provider.id, {"rating": 4.5}
-    )
-    assert transaction_manager_mock.commit.call_count == 2
+    transaction_manager_mock.commit.assert_called_once()
 
     assert isinstance(result, ReviewResponse)
     assert result.rating == review_data.rating
@@ -163,10 +170,10 @@ async def test_create_review_update_existing(
     mock_review: Review,
 ) -> None:
     identity_provider_mock.get_current_user.return_value = mock_user
-    provider_repository_mock.get_by_id.return_value = mock_provider
+    provider_repository_mock.exists.return_value = True
     review_repository_mock.get_by_user_and_provider.return_value = mock_review
-    review_repository_mock.calculate_average_rating.return_value = 4.0
-    review_repository_mock.get_by_id.return_value = mock_review
+
+    old_rating = mock_review.rating
 
     review_data = ReviewCreate(
         rating=3,
@@ -176,18 +183,17 @@ async def test_create_review_update_existing(
     result = await review_service.create_review(mock_provider.id, review_data)
 
     identity_provider_mock.get_current_user.assert_called_once()
-    provider_repository_mock.get_by_id.assert_called_once_with(
-        provider_id=mock_provider.id
-    )
+    provider_repository_mock.exists.assert_called_once_with(mock_provider.id)
     review_repository_mock.get_by_user_and_provider.assert_called_once()
     review_repository_mock.update.assert_called_once_with(
-        mock_review.id, {"rating": review_data.rating, "comment": review_data.comment}
+        mock_review, {"rating": review_data.rating, "comment": review_data.comment}
     )
-    review_repository_mock.calculate_average_rating.assert_called_once()
-    provider_repository_mock.update.assert_called_once_with(
-        provider_id=mock_provider.id, update_data={"rating": 4.0}
+    provider_repository_mock.apply_review_change.assert_called_once_with(
+        mock_provider.id,
+        rating_delta=review_data.rating - old_rating,
+        count_delta=0,
     )
-    assert transaction_manager_mock.commit.call_count == 2
+    transaction_manager_mock.commit.assert_called_once()
 
     assert isinstance(result, ReviewResponse)
 
@@ -200,7 +206,7 @@ async def test_create_review_provider_not_found(
 ) -> None:
     provider_id = uuid.uuid4()
     identity_provider_mock.get_current_user.return_value = mock_user
-    provider_repository_mock.get_by_id.return_value = None
+    provider_repository_mock.exists.return_value = False
 
     review_data = ReviewCreate(
         rating=5,
@@ -211,7 +217,7 @@ async def test_create_review_provider_not_found(
         await review_service.create_review(provider_id, review_data)
 
     identity_provider_mock.get_current_user.assert_called_once()
-    provider_repository_mock.get_by_id.assert_called_once_with(provider_id=provider_id)
+    provider_repository_mock.exists.assert_called_once_with(provider_id)
 
 
 async def test_get_review_success(
@@ -249,32 +255,140 @@ async def test_get_provider_reviews_success(
     mock_provider: Provider,
     mock_review: Review,
 ) -> None:
-    provider_repository_mock.get_by_id.return_value = mock_provider
+    provider_repository_mock.exists.return_value = True
     review_repository_mock.get_by_provider.return_value = [mock_review]
 
     limit = 10
     offset = 0
     result = await review_service.get_provider_reviews(mock_provider.id, limit, offset)
 
-    provider_repository_mock.get_by_id.assert_called_once_with(mock_provider.id)
+    provider_repository_mock.exists.assert_called_once_with(mock_provider.id)
     review_repository_mock.get_by_provider.assert_called_once_with(
-        mock_provider.id, limit, offset
+        mock_provider.id, PROVIDER_REVIEWS_CACHE_SIZE
     )
     assert len(result) == 1
     assert isinstance(result[0], ReviewResponse)
 
 
+async def test_get_provider_reviews_first_page_from_cache(
+    review_service: ReviewService,
+    provider_repository_mock: AsyncMock,
+    review_repository_mock: AsyncMock,
+    mock_provider: Provider,
+    mock_review: Review,
+    redis_client: Redis,
+) -> None:
+    provider_repository_mock.exists.return_value = True
+    review_repository_mock.get_by_provider.return_value = [mock_review, mock_review]
+
+    await review_service.get_provider_reviews(mock_provider.id, 10)
+    result = await review_service.get_provider_reviews(mock_provider.id, 1)
+
+    review_repository_mock.get_by_provider.assert_called_once()
+    provider_repository_mock.exists.assert_called_once()
+    assert [review.id for review in result] == [mock_review.id]
+
+    cache_key = PROVIDER_REVIEWS_CACHE_KEY.format(provider_id=mock_provider.id)
+    assert await redis_client.ttl(cache_key) > 0
+
+
+async def test_get_provider_reviews_non_positive_limit_skips_cache(
+    review_service: ReviewService,
+    provider_repository_mock: AsyncMock,
+    review_repository_mock: AsyncMock,
+    mock_provider: Provider,
+    mock_review: Review,
+) -> None:
+    provider_repository_mock.exists.return_value = True
+    review_repository_mock.get_by_provider.return_value = [mock_review, mock_review]
+    await review_service.get_provider_reviews(mock_provider.id, 10)
+    review_repository_mock.get_by_provider.return_value = []
+
+    result = await review_service.get_provider_reviews(mock_provider.id, -1)
+
+    assert result == []
+    assert review_repository_mock.get_by_provider.call_count == 2
+
+
+async def test_get_provider_reviews_next_pages_skip_cache(
+    review_service: ReviewService,
+    provider_repository_mock: AsyncMock,
+    review_repository_mock: AsyncMock,
+    mock_provider: Provider,
+    mock_review: Review,
+) -> None:
+    provider_repository_mock.exists.return_value = True
+    review_repository_mock.get_by_provider.return_value = [mock_review]
+    cursor = encode_cursor(mock_review.created_at, mock_review.id)
+
+    await review_service.get_provider_reviews(mock_provider.id, 10, offset=10)
+    await review_service.get_provider_reviews(mock_provider.id, 10, cursor=cursor)
+
+    review_repository_mock.get_by_provider.assert_has_calls(
+        [
+            call(mock_provider.id, 10, offset=10, cursor=None),
+            call(
+                mock_provider.id,
+                10,
+                offset=0,
+                cursor=(mock_review.created_at, mock_review.id),
+            ),
+        ]
+    )
+
+
+async def test_get_provider_reviews_invalid_cursor(
+    review_service: ReviewService,
+    review_repository_mock: AsyncMock,
+    mock_provider: Provider,
+) -> None:
+    with pytest.raises(InvalidCursorException):
+        await review_service.get_provider_reviews(
+            mock_provider.id, 10, cursor="not-a-cursor"
+        )
+
+    review_repository_mock.get_by_provider.assert_not_called()
+
+
+async def test_create_review_invalidates_cache(
+    review_service: ReviewService,
+    identity_provider_mock: AsyncMock,
+    provider_repository_mock: AsyncMock,
+    review_repository_mock: AsyncMock,
+    mock_user: User,
+    mock_provider: Provider,
+    mock_review: Review,
+    redis_client: Redis,
+) -> None:
+    identity_provider_mock.get_current_user.return_value = mock_user
+    provider_repository_mock.exists.return_value = True
+    review_repository_mock.get_by_provider.return_value = [mock_review]
+    review_repository_mock.get_by_user_and_provider.return_value = mock_review
+
+    await review_service.get_provider_reviews(mock_provider.id, 10)
+    cache_key = PROVIDER_REVIEWS_CACHE_KEY.format(provider_id=mock_provider.id)
+    assert await redis_client.exists(cache_key)
+    await redis_client.set(ALL_PROVIDERS_CACHE_KEY, "[]")
+
+    await review_service.create_review(
+        mock_provider.id, ReviewCreate(rating=5, comment="Обновленный отзыв.")
+    )
+
+    assert not await redis_client.exists(cache_key)
+    assert not await redis_client.exists(ALL_PROVIDERS_CACHE_KEY)
+
+
 async def test_get_provider_reviews_provider_not_found(
     review_service: ReviewService,
     provider_repository_mock: AsyncMock,
 ) -> None:
     provider_id = uuid.uuid4()
-    provider_repository_mock.get_by_id.return_value = None
+    provider_repository_mock.exists.return_value = False
 
     with pytest.raises(ProviderNotFoundException):
         await review_service.get_provider_reviews(provider_id, 10, 0)
 
-    provider_repository_mock.get_by_id.assert_called_once_with(provider_id)
+    provider_repository_mock.exists.assert_called_once_with(provider_id)
 
 
 async def test_update_review_success(
@@ -289,7 +403,8 @@ async def test_update_review_success(
     mock_review.user_id = mock_user.id
     identity_provider_mock.get_current_user.return_value = mock_user
     review_repository_mock.get_by_id.return_value = mock_review
-    review_repository_mock.calculate_average_rating.return_value = 4.2
+
+    old_rating = mock_review.rating
 
     update_data = ReviewUpdate(
         rating=4,
@@ -301,15 +416,12 @@ async def test_update_review_success(
     identity_provider_mock.get_current_user.assert_called_once()
     review_repository_mock.get_by_id.assert_any_call(mock_review.id, for_update=True)
     review_repository_mock.update.assert_called_once_with(
-        mock_review.id, update_data.model_dump(exclude_unset=True)
+        mock_review, update_data.model_dump(exclude_unset=True)
     )
-    review_repository_mock.calculate_average_rating.assert_called_once_with(
-        mock_review.provider_id
+    provider_repository_mock.apply_review_change.assert_called_once_with(
+        mock_review.provider_id, rating_delta=4 - old_rating, count_delta=0
     )
-    provider_repository_mock.update.assert_called_once_with(
-        mock_review.provider_id, {"rating": 4.2}
-    )
-    assert transaction_manager_mock.commit.call_count == 2
+    transaction_manager_mock.commit.assert_called_once()
 
     assert isinstance(result, ReviewResponse)
 
@@ -325,7 +437,6 @@ async def test_update_review_as_admin(
 ) -> None:
     identity_provider_mock.get_current_user.return_value = mock_admin_user
     review_repository_mock.get_by_id.return_value = mock_review
-    review_repository_mock.calculate_average_rating.return_value = 3.8
 
     update_data = ReviewUpdate(rating=3)
 
@@ -382,7 +493,6 @@ async def test_delete_review_success(
     mock_review.user_id = mock_user.id
     identity_provider_mock.get_current_user.return_value = mock_user
     review_repository_mock.get_by_id.return_value = mock_review
-    review_repository_mock.calculate_average_rating.return_value = 3.5
 
     await review_service.delete_review(mock_review.id)
 
@@ -391,13 +501,10 @@ async def test_delete_review_success(
         mock_review.id, for_update=True
     )
     review_repository_mock.delete.assert_called_once_with(mock_review)
-    review_repository_mock.calculate_average_rating.assert_called_once_with(
-        mock_review.provider_id
-    )
-    provider_repository_mock.update.assert_called_once_with(
-        mock_review.provider_id, {"rating": 3.5}
+    provider_repository_mock.apply_review_change.assert_called_once_with(
+        mock_review.provider_id, rating_delta=-mock_review.rating, count_delta=-1
     )
-    assert transaction_manager_mock.commit.call_count == 2
+    transaction_manager_mock.commit.assert_called_once()
 
 
 async def test_delete_review_as_admin(
@@ -411,13 +518,12 @@ async def test_delete_review_as_admin(
 ) -> None:
     identity_provider_mock.get_current_user.return_value = mock_admin_user
     review_repository_mock.get_by_id.return_value = mock_review
-    review_repository_mock.calculate_average_rating.return_value = None
 
     await review_service.delete_review(mock_review.id)
 
     review_repository_mock.delete.assert_called_once_with(mock_review)
-    provider_repository_mock.update.assert_called_once_with(
-        mock_review.provider_id, {"rating": None}
+    provider_repository_mock.apply_review_change.assert_called_once_with(
+        mock_review.provider_id, rating_delta=-mock_review.rating, count_delta=-1
     )
 
 
@@ -0,0 +1,250 @@
+import json
+import uuid
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from dishka import AsyncContainer
+from redis.asyncio import Redis
+from isp_compare.core.config import SearchHistoryConfig
+from isp_compare.models.search_history import SearchHistory
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from isp_compare.models.user import User
+from isp_compare.repositories.popular_search import PopularSearchRepository
+from isp_compare.repositories.search_history import SearchHistoryRepository
+from isp_compare.services.search_history_recorder import (
+    SEARCH_HISTORY_DEAD_LETTER_KEY,
+    SEARCH_HISTORY_PURGE_KEY,
+    SEARCH_HISTORY_QUEUE_KEY,
+    SearchHistoryRecorder,
+)
+
+
+@pytest.fixture
+async def recorder(container: AsyncContainer) -> SearchHistoryRecorder:
+    return await container.get(SearchHistoryRecorder)
+
+
+@pytest.fixture
+def search_history_repository(session: AsyncSession) -> SearchHistoryRepository:
+    return SearchHistoryRepository(session=session)
+
+
+async def test_record_only_enqueues(
+    recorder: SearchHistoryRecorder,
+    search_history_repository: SearchHistoryRepository,
+    redis_client: Redis,
+    regular_user: User,
+) -> None:
+    await recorder.record(regular_user.id, {"min_speed": 100})
+
+    payload = await redis_client.lindex(SEARCH_HISTORY_QUEUE_KEY, 0)
+    assert json.loads(payload)["search_params"] == {"min_speed": 100}
+    assert await search_history_repository.get_by_user(regular_user.id, 10, 0) == []
+
+
+async def test_flush_saves_batch(
+    recorder: SearchHistoryRecorder,
+    search_history_repository: SearchHistoryRepository,
+    redis_client: Redis,
+    regular_user: User,
+    regular_user_2: User,
+) -> None:
+    await recorder.record(regular_user.id, {"min_speed": 50})
+    await recorder.record(regular_user_2.id, {"has_tv": True})
+    await recorder.record(regular_user.id, {"min_speed": 100})
+
+    saved = await recorder.flush()
+
+    assert saved == 3
+    assert await redis_client.llen(SEARCH_HISTORY_QUEUE_KEY) == 0
+    history = await search_history_repository.get_by_user(regular_user.id, 10, 0)
+    assert [item.search_params for item in history] == [
+        {"min_speed": 100},
+        {"min_speed": 50},
+    ]
+
+
+async def test_flush_skips_consecutive_duplicates(
+    recorder: SearchHistoryRecorder,
+    search_history_repository: SearchHistoryRepository,
+    regular_user: User,
+) -> None:
+    await recorder.record(regular_user.id, {"min_speed": 50})
+    await recorder.flush()
+
+    for params in ({"min_speed": 50}, {"has_tv": True}, {"has_tv": True}):
+        await recorder.record(regular_user.id, params)
+    await recorder.record(regular_user.id, {"min_speed": 50})
+
+    saved = await recorder.flush()
+
+    assert saved == 2
+    history = await search_history_repository.get_by_user(regular_user.id, 10, 0)
+    assert [item.search_params for item in history] == [
+        {"min_speed": 50},
+        {"has_tv": True},
+        {"min_speed": 50},
+    ]
+
+
+async def test_flush_drops_unknown_users(
+    recorder: SearchHistoryRecorder, regular_user: User
+) -> None:
+    await recorder.record(uuid.uuid4(), {"min_speed": 50})
+    await recorder.record(regular_user.id, {"min_speed": 50})
+
+    assert await recorder.flush() == 1
+
+
+async def test_flush_failure_requeues_batch(
+    recorder: SearchHistoryRecorder,
+    redis_client: Redis,
+    regular_user: User,
+) -> None:
+    await recorder.record(regular_user.id, {"min_speed": 50})
+    await recorder.record(regular_user.id, {"min_speed": 100})
+
+    with (
+        patch.object(SearchHistoryRepository, "create_many", side_effect=RuntimeError),
+        pytest.raises(RuntimeError),
+    ):
+        await recorder.flush()
+
+    queued = await redis_client.lrange(SEARCH_HISTORY_QUEUE_KEY, 0, -1)
+    assert [json.loads(item)["search_params"] for item in queued] == [
+        {"min_speed": 50},
+        {"min_speed": 100},
+    ]
+    assert await recorder.flush() == 2
+
+
+async def test_flush_failing_batch_moves_to_dead_letter(
+    recorder: SearchHistoryRecorder,
+    search_history_config: SearchHistoryConfig,
+    redis_client: Redis,
+    regular_user: User,
+) -> None:
+    await recorder.record(regular_user.id, {"min_speed": 50})
+
+    with patch.object(
+        SearchHistoryRecorder, "_save_batch", side_effect=RuntimeError
+    ) as save_batch:
+        for _ in range(search_history_config.max_flush_attempts):
+            with pytest.raises(RuntimeError):
+                await recorder.flush()
+
+        assert await redis_client.llen(SEARCH_HISTORY_QUEUE_KEY) == 0
+        assert await recorder.flush() == 0
+        assert save_batch.call_count == search_history_config.max_flush_attempts
+
+    dead = await redis_client.lrange(SEARCH_HISTORY_DEAD_LETTER_KEY, 0, -1)
+    assert [json.loads(item)["search_params"] for item in dead] == [{"min_speed": 50}]
+
+    await recorder.record(regular_user.id, {"min_speed": 100})
+    assert await recorder.flush() == 1
+
+
+async def test_flush_moves_malformed_entries_to_dead_letter(
+    recorder: SearchHistoryRecorder,
+    redis_client: Redis,
+    regular_user: User,
+) -> None:
+    await redis_client.rpush(SEARCH_HISTORY_QUEUE_KEY, "not json", '{"user_id": 1}')
+    await recorder.record(regular_user.id, {"min_speed": 50})
+
+    assert await recorder.flush() == 1
+    assert await redis_client.lrange(SEARCH_HISTORY_DEAD_LETTER_KEY, 0, -1) == [
+        "not json",
+        '{"user_id": 1}',
+    ]
+
+
+async def test_stop_flushes_queue(
+    recorder: SearchHistoryRecorder,
+    search_history_repository: SearchHistoryRepository,
+    regular_user: User,
+) -> None:
+    recorder.start()
+    await recorder.record(regular_user.id, {"min_speed": 50})
+
+    await recorder.stop()
+
+    history = await search_history_repository.get_by_user(regular_user.id, 10, 0)
+    assert len(history) == 1
+
+
+async def test_flush_trims_history_to_limit(
+    recorder: SearchHistoryRecorder,
+    search_history_repository: SearchHistoryRepository,
+    search_history_config: SearchHistoryConfig,
+    regular_user: User,
+) -> None:
+    searches = search_history_config.max_per_user + 3
+    for speed in range(searches):
+        await recorder.record(regular_user.id, {"min_speed": speed})
+
+    await recorder.flush()
+
+    history = await search_history_repository.get_by_user(regular_user.id, 100, 0)
+    assert len(history) == search_history_config.max_per_user
+    assert history[0].search_params == {"min_speed": searches - 1}
+
+
+async def test_purge_expired(
+    recorder: SearchHistoryRecorder,
+    session: AsyncSession,
+    search_history_repository: SearchHistoryRepository,
+    search_history_config: SearchHistoryConfig,
+    regular_user: User,
+) -> None:
+    now = datetime.now(UTC)
+    retention = timedelta(days=search_history_config.retention_days)
+    expired_count = search_history_config.batch_size + 5
+    session.add_all(
+        SearchHistory(
+            user_id=regular_user.id,
+            search_params={"min_speed": i},
+            created_at=now - retention - timedelta(minutes=i + 1),
+        )
+        for i in range(expired_count)
+    )
+    session.add(SearchHistory(user_id=regular_user.id, search_params={}))
+    await session.commit()
+
+    purged = await recorder.purge_expired()
+
+    assert purged == expired_count
+    history = await search_history_repository.get_by_user(regular_user.id, 10, 0)
+    assert len(history) == 1
+
+
+async def test_purge_runs_once_per_interval(
+    recorder: SearchHistoryRecorder, redis_client: Redis
+) -> None:
+    assert await recorder._is_purge_due()
+    assert not await recorder._is_purge_due()
+    assert await redis_client.ttl(SEARCH_HISTORY_PURGE_KEY) > 0
+
+
+async def test_flush_updates_popular_searches(
+    recorder: SearchHistoryRecorder,
+    session: AsyncSession,
+    regular_user: User,
+    regular_user_2: User,
+) -> None:
+    await recorder.record(regular_user.id, {"min_speed": 100, "limit": 50})
+    await recorder.record(regular_user_2.id, {"min_speed": 100, "offset": 20})
+    await recorder.record(regular_user.id, {"has_tv": True})
+    await recorder.record(regular_user_2.id, {"limit": 10})
+    await recorder.flush()
+    await recorder.record(regular_user.id, {"min_speed": 100})
+    await recorder.flush()
+
+    result = await PopularSearchRepository(session=session).get_top(10)
+
+    assert [(item.filters, item.searches_count) for item in result] == [
+        ({"min_speed": 100}, 3),
+        ({"has_tv": True}, 1),
+    ]
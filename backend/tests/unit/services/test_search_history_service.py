@@ -5,9 +5,14 @@ from unittest.mock import AsyncMock
 import pytest
 from faker import Faker
 
-from isp_compare.core.exceptions import SearchHistoryNotFoundException
+from isp_compare.core.exceptions import (
+    AdminAccessDeniedException,
+    SearchHistoryNotFoundException,
+)
 from isp_compare.models import User
+from isp_compare.models.popular_search import PopularSearch
 from isp_compare.models.search_history import SearchHistory
+from isp_compare.repositories.popular_search import PopularSearchRepository
 from isp_compare.repositories.search_history import SearchHistoryRepository
 from isp_compare.schemas.search_history import SearchHistoryResponse
 from isp_compare.services.identity_provider import IdentityProvider
@@ -20,6 +25,11 @@ def search_history_repository_mock() -> AsyncMock:
     return AsyncMock(spec=SearchHistoryRepository)
 
 
+@pytest.fixture
+def popular_search_repository_mock() -> AsyncMock:
+    return AsyncMock(spec=PopularSearchRepository)
+
+
 @pytest.fixture
 def transaction_manager_mock() -> AsyncMock:
     return AsyncMock(spec=TransactionManager)
@@ -33,11 +43,13 @@ def identity_provider_mock() -> AsyncMock:
 @pytest.fixture
 def search_history_service(
     search_history_repository_mock: AsyncMock,
+    popular_search_repository_mock: AsyncMock,
     transaction_manager_mock: AsyncMock,
     identity_provider_mock: AsyncMock,
 ) -> SearchHistoryService:
     return SearchHistoryService(
         search_history_repository=search_history_repository_mock,
+        popular_search_repository=popular_search_repository_mock,
         transaction_manager=transaction_manager_mock,
         identity_provider=identity_provider_mock,
     )
@@ -342,3 +354,38 @@ async def test_get_latest_search_not_found(
     )
 
     assert result is None
+
+
+async def test_get_popular_searches(
+    search_history_service: SearchHistoryService,
+    identity_provider_mock: AsyncMock,
+    popular_search_repository_mock: AsyncMock,
+) -> None:
+    popular_search = PopularSearch(
+        id=uuid.uuid4(),
+        filters={"min_speed": 100},
+        searches_count=5,
+        last_searched_at=datetime.now(UTC),
+    )
+    popular_search_repository_mock.get_top.return_value = [popular_search]
+
+    result = await search_history_service.get_popular_searches(10)
+
+    identity_provider_mock.ensure_is_admin.assert_called_once()
+    popular_search_repository_mock.get_top.assert_called_once_with(10)
+    assert len(result) == 1
+    assert result[0].filters == {"min_speed": 100}
+    assert result[0].searches_count == 5
+
+
+async def test_get_popular_searches_not_admin(
+    search_history_service: SearchHistoryService,
+    identity_provider_mock: AsyncMock,
+    popular_search_repository_mock: AsyncMock,
+) -> None:
+    identity_provider_mock.ensure_is_admin.side_effect = AdminAccessDeniedException()
+
+    with pytest.raises(AdminAccessDeniedException):
+        await search_history_service.get_popular_searches(10)
+
+    popular_search_repository_mock.get_top.assert_not_called()
@@ -13,7 +13,6 @@ from isp_compare.core.exceptions import (
 from isp_compare.models import Provider, User
 from isp_compare.models.tariff import Tariff
 from isp_compare.repositories.provider import ProviderRepository
-from isp_compare.repositories.search_history import SearchHistoryRepository
 from isp_compare.repositories.tariff import TariffRepository
 from isp_compare.schemas.tariff import (
     TariffCreate,
@@ -22,6 +21,8 @@ from isp_compare.schemas.tariff import (
     TariffUpdate,
 )
 from isp_compare.services.identity_provider import IdentityProvider
+from isp_compare.services.catalog_version import CatalogVersion
+from isp_compare.services.search_history_recorder import SearchHistoryRecorder
 from isp_compare.services.tariff import TariffService
 from isp_compare.services.transaction_manager import TransactionManager
 
@@ -37,8 +38,8 @@ def provider_repository_mock() -> AsyncMock:
 
 
 @pytest.fixture
-def search_history_repository_mock() -> AsyncMock:
-    return AsyncMock(spec=SearchHistoryRepository)
+def search_history_recorder_mock() -> AsyncMock:
+    return AsyncMock(spec=SearchHistoryRecorder)
 
 
 @pytest.fixture
@@ -51,20 +52,27 @@ def identity_provider_mock() -> AsyncMock:
     return AsyncMock(spec=IdentityProvider)
 
 
+@pytest.fixture
+def catalog_version_mock() -> AsyncMock:
+    return AsyncMock(spec=CatalogVersion)
+
+
 @pytest.fixture
 def tariff_service(
     tariff_repository_mock: AsyncMock,
     provider_repository_mock: AsyncMock,
-    search_history_repository_mock: AsyncMock,
+    search_history_recorder_mock: AsyncMock,
     transaction_manager_mock: AsyncMock,
     identity_provider_mock: AsyncMock,
+    catalog_version_mock: AsyncMock,
 ) -> TariffService:
     return TariffService(
         tariff_repository=tariff_repository_mock,
         provider_repository=provider_repository_mock,
-        search_history_repository=search_history_repository_mock,
+        search_history_recorder=search_history_recorder_mock,
         transaction_manager=transaction_manager_mock,
         identity_provider=identity_provider_mock,
+        catalog_version=catalog_version_mock,
     )
 
 
@@ -116,6 +124,7 @@ async def test_create_tariff_success(
     tariff_repository_mock: AsyncMock,
     transaction_manager_mock: AsyncMock,
     mock_provider: Provider,
+    catalog_version_mock: AsyncMock,
 ) -> None:
     provider_id = uuid.uuid4()
     tariff_data = TariffCreate(
@@ -131,7 +140,7 @@ async def test_create_tariff_success(
         is_active=True,
     )
 
-    provider_repository_mock.get_by_id.return_value = mock_provider
+    provider_repository_mock.exists.return_value = True
 
     async def create_side_effect(tariff: Tariff) -> None:
         tariff.id = uuid.uuid4()
@@ -141,9 +150,10 @@ async def test_create_tariff_success(
     result = await tariff_service.create_tariff(provider_id, tariff_data)
 
     identity_provider_mock.ensure_is_admin.assert_called_once()
-    provider_repository_mock.get_by_id.assert_called_once_with(provider_id)
+    provider_repository_mock.exists.assert_called_once_with(provider_id)
     tariff_repository_mock.create.assert_called_once()
     transaction_manager_mock.commit.assert_called_once()
+    catalog_version_mock.bump.assert_awaited_once()
 
     assert isinstance(result, TariffResponse)
     assert result.name == tariff_data.name
@@ -175,7 +185,7 @@ async def test_create_tariff_not_admin(
     with pytest.raises(AdminAccessDeniedException):
         await tariff_service.create_tariff(provider_id, tariff_data)
 
-    provider_repository_mock.get_by_id.assert_not_called()
+    provider_repository_mock.exists.assert_not_called()
 
 
 async def test_create_tariff_provider_not_found(
@@ -190,13 +200,13 @@ async def test_create_tariff_provider_not_found(
         speed=200,
     )
 
-    provider_repository_mock.get_by_id.return_value = None
+    provider_repository_mock.exists.return_value = False
 
     with pytest.raises(ProviderNotFoundException):
         await tariff_service.create_tariff(provider_id, tariff_data)
 
     identity_provider_mock.ensure_is_admin.assert_called_once()
-    provider_repository_mock.get_by_id.assert_called_once_with(provider_id)
+    provider_repository_mock.exists.assert_called_once_with(provider_id)
 
 
 async def test_get_tariff_success(
@@ -262,12 +272,12 @@ async def test_get_provider_tariffs_success(
     offset = 0
     tariffs = [mock_tariff, mock_tariff]
 
-    provider_repository_mock.get_by_id.return_value = mock_provider
+    provider_repository_mock.exists.return_value = True
     tariff_repository_mock.get_by_provider.return_value = tariffs
 
     result = await tariff_service.get_provider_tariffs(provider_id, limit, offset)
 
-    provider_repository_mock.get_by_id.assert_called_once_with(provider_id)
+    provider_repository_mock.exists.assert_called_once_with(provider_id)
     tariff_repository_mock.get_by_provider.assert_called_once_with(
         provider_id, limit, offset
     )
@@ -284,12 +294,12 @@ async def test_get_provider_tariffs_provider_not_found(
     limit = 10
     offset = 0
 
-    provider_repository_mock.get_by_id.return_value = None
+    provider_repository_mock.exists.return_value = False
 
     with pytest.raises(ProviderNotFoundException):
         await tariff_service.get_provider_tariffs(provider_id, limit, offset)
 
-    provider_repository_mock.get_by_id.assert_called_once_with(provider_id)
+    provider_repository_mock.exists.assert_called_once_with(provider_id)
 
 
 async def test_update_tariff_success(
@@ -298,6 +308,7 @@ async def test_update_tariff_success(
     tariff_repository_mock: AsyncMock,
     transaction_manager_mock: AsyncMock,
     mock_tariff: Tariff,
+    catalog_version_mock: AsyncMock,
 ) -> None:
     tariff_id = uuid.uuid4()
     update_data = TariffUpdate(
@@ -317,6 +328,7 @@ async def test_update_tariff_success(
         tariff_id, update_data.model_dump(exclude_unset=True)
     )
     transaction_manager_mock.commit.assert_called_once()
+    catalog_version_mock.bump.assert_awaited_once()
     transaction_manager_mock.refresh.assert_called_once_with(mock_tariff)
 
     assert isinstance(result, TariffResponse)
@@ -365,6 +377,7 @@ async def test_delete_tariff_success(
     tariff_repository_mock: AsyncMock,
     transaction_manager_mock: AsyncMock,
     mock_tariff: Tariff,
+    catalog_version_mock: AsyncMock,
 ) -> None:
     tariff_id = uuid.uuid4()
     tariff_repository_mock.get_by_id.return_value = mock_tariff
@@ -375,6 +388,7 @@ async def test_delete_tariff_success(
     tariff_repository_mock.get_by_id.assert_called_once_with(tariff_id, for_update=True)
     tariff_repository_mock.delete.assert_called_once_with(mock_tariff)
     transaction_manager_mock.commit.assert_called_once()
+    catalog_version_mock.bump.assert_awaited_once()
 
 
 async def test_delete_tariff_not_found(
@@ -411,7 +425,7 @@ async def test_delete_tariff_not_admin(
 async def test_search_tariffs_authenticated_user(
     tariff_service: TariffService,
     tariff_repository_mock: AsyncMock,
-    search_history_repository_mock: AsyncMock,
+    search_history_recorder_mock: AsyncMock,
     transaction_manager_mock: AsyncMock,
     identity_provider_mock: AsyncMock,
     mock_tariff: Tariff,
@@ -427,7 +441,7 @@ async def test_search_tariffs_authenticated_user(
     )
     tariffs = [mock_tariff, mock_tariff]
     tariff_repository_mock.search.return_value = tariffs
-    identity_provider_mock.get_current_user.return_value = mock_user
+    identity_provider_mock.get_current_user_id.return_value = mock_user.id
 
     result = await tariff_service.search_tariffs(search_params)
 
@@ -441,9 +455,11 @@ async def test_search_tariffs_authenticated_user(
         limit=search_params.limit,
         offset=search_params.offset,
     )
-    identity_provider_mock.get_current_user.assert_called_once()
-    search_history_repository_mock.create.assert_called_once()
-    transaction_manager_mock.commit.assert_called_once()
+    identity_provider_mock.get_current_user_id.assert_called_once()
+    search_history_recorder_mock.record.assert_called_once_with(
+        mock_user.id, search_params.model_dump(exclude_none=True, mode="json")
+    )
+    transaction_manager_mock.commit.assert_not_called()
 
     assert len(result) == len(tariffs)
     for tariff_response in result:
@@ -453,7 +469,7 @@ async def test_search_tariffs_authenticated_user(
 async def test_search_tariffs_unauthenticated_user(
     tariff_service: TariffService,
     tariff_repository_mock: AsyncMock,
-    search_history_repository_mock: AsyncMock,
+    search_history_recorder_mock: AsyncMock,
     transaction_manager_mock: AsyncMock,
     identity_provider_mock: AsyncMock,
     mock_tariff: Tariff,
@@ -467,7 +483,7 @@ async def test_search_tariffs_unauthenticated_user(
 
     tariffs = [mock_tariff]
     tariff_repository_mock.search.return_value = tariffs
-    identity_provider_mock.get_current_user.side_effect = AppException(
+    identity_provider_mock.get_current_user_id.side_effect = AppException(
         status_code=401, detail="Unauthorized"
     )
 
@@ -484,8 +500,8 @@ async def test_search_tariffs_unauthenticated_user(
         offset=search_params.offset,
     )
 
-    identity_provider_mock.get_current_user.assert_called_once()
-    search_history_repository_mock.create.assert_not_called()
+    identity_provider_mock.get_current_user_id.assert_called_once()
+    search_history_recorder_mock.record.assert_not_called()
     transaction_manager_mock.commit.assert_not_called()
 
     assert len(result) == len(tariffs)
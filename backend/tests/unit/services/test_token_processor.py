@@ -26,6 +26,16 @@ def test_create_access_token(token_processor: TokenProcessor) -> None:
     assert datetime.fromtimestamp(payload["exp"], UTC) > datetime.now(UTC)
 
 
+def test_hash_refresh_token(token_processor: TokenProcessor) -> None:
+    token, _ = token_processor.create_refresh_token()
+
+    token_hash = token_processor.hash_refresh_token(token)
+
+    assert len(token_hash) == 32
+    assert token_hash == token_processor.hash_refresh_token(token)
+    assert token_hash != token_processor.hash_refresh_token(token.upper())
+
+
 def test_create_refresh_token(token_processor: TokenProcessor) -> None:
     token, expires_at = token_processor.create_refresh_token()
 
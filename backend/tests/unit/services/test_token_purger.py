@@ -0,0 +1,128 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from dishka import AsyncContainer
+from faker import Faker
+from redis.asyncio import Redis
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from isp_compare.core.config import RefreshTokenConfig
+from isp_compare.models.token import RefreshToken
+from isp_compare.models.user import User
+from isp_compare.repositories.token import RefreshTokenRepository
+from isp_compare.services.token_purger import (
+    REFRESH_TOKEN_PURGE_KEY,
+    RefreshTokenPurger,
+)
+
+ACTIVE_TOKENS = 10
+
+
+@pytest.fixture
+async def purger(container: AsyncContainer) -> RefreshTokenPurger:
+    return await container.get(RefreshTokenPurger)
+
+
+async def count_tokens(session: AsyncSession) -> int:
+    return await session.scalar(select(func.count()).select_from(RefreshToken))
+
+
+async def test_purge(
+    purger: RefreshTokenPurger,
+    session: AsyncSession,
+    refresh_token_config: RefreshTokenConfig,
+    regular_user: User,
+    faker: Faker,
+) -> None:
+    now = datetime.now(UTC)
+    retention = timedelta(days=refresh_token_config.revoked_retention_days)
+    expired_count = refresh_token_config.purge_batch_size + 5
+    session.add_all(
+        RefreshToken(
+            token_hash=faker.binary(32),
+            user_id=regular_user.id,
+            expires_at=now - timedelta(minutes=i + 1),
+        )
+        for i in range(expired_count)
+    )
+    session.add(
+        RefreshToken(
+            token_hash=faker.binary(32),
+            user_id=regular_user.id,
+            expires_at=now + timedelta(days=5),
+            revoked=True,
+            revoked_at=now - retention - timedelta(hours=1),
+        )
+    )
+    recently_revoked_token = RefreshToken(
+        token_hash=faker.binary(32),
+        user_id=regular_user.id,
+        expires_at=now + timedelta(days=5),
+        revoked=True,
+        revoked_at=now,
+    )
+    active_token = RefreshToken(
+        token_hash=faker.binary(32),
+        user_id=regular_user.id,
+        expires_at=now + timedelta(days=5),
+    )
+    session.add_all([recently_revoked_token, active_token])
+    await session.commit()
+
+    purged = await purger.purge()
+
+    assert purged == expired_count + 1
+    result = await session.scalars(select(RefreshToken.id))
+    assert set(result) == {recently_revoked_token.id, active_token.id}
+
+
+async def test_purge_runs_once_per_interval(
+    purger: RefreshTokenPurger, redis_client: Redis
+) -> None:
+    assert await purger._is_purge_due()
+    assert not await purger._is_purge_due()
+    assert await redis_client.ttl(REFRESH_TOKEN_PURGE_KEY) > 0
+
+
+async def test_purge_loops_over_batches(
+    purger: RefreshTokenPurger,
+    session: AsyncSession,
+    refresh_token_config: RefreshTokenConfig,
+    regular_user: User,
+) -> None:
+    batch_size = refresh_token_config.purge_batch_size
+    expired_count = batch_size * 3 + 7
+    await session.execute(
+        text(
+            "INSERT INTO refresh_tokens (id, token_hash, user_id, expires_at, revoked) "
+            "SELECT gen_random_uuid(), sha256(int8send(i)), :user_id, "
+            "now() - make_interval(secs => i), false "
+            "FROM generate_series(1, :count) AS i"
+        ),
+        {"user_id": regular_user.id, "count": expired_count},
+    )
+    await session.execute(
+        text(
+            "INSERT INTO refresh_tokens (id, token_hash, user_id, expires_at, revoked) "
+            "SELECT gen_random_uuid(), sha256(int8send(-i)), :user_id, "
+            "now() + interval '7 days', false "
+            "FROM generate_series(1, :count) AS i"
+        ),
+        {"user_id": regular_user.id, "count": ACTIVE_TOKENS},
+    )
+    await session.commit()
+
+    with patch.object(
+        RefreshTokenRepository,
+        "delete_expired",
+        autospec=True,
+        side_effect=RefreshTokenRepository.delete_expired,
+    ) as delete_expired:
+        purged = await purger.purge()
+
+    assert purged == expired_count
+    # Три полные порции и одна неполная
+    assert delete_expired.await_count == 4
+    assert await count_tokens(session) == ACTIVE_TOKENS
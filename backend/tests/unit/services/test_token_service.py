@@ -7,24 +7,18 @@ from faker import Faker
 from jose import JWTError
 from redis.asyncio import Redis
 
-from isp_compare.core.exceptions import (
-    InvalidTokenException,
-    TokenExpiredException,
-    TokenRevokedException,
-    UserNotFoundException,
-)
-from isp_compare.models.token import RefreshToken
+from isp_compare.core.exceptions import TokenRevokedException, UserNotFoundException
 from isp_compare.models.user import User
-from isp_compare.repositories.token import RefreshTokenRepository
 from isp_compare.repositories.user import UserRepository
+from isp_compare.services.refresh_token_store import RefreshTokenStore
 from isp_compare.services.token_processor import TokenProcessor
 from isp_compare.services.token_service import TokenService
-from isp_compare.services.transaction_manager import TransactionManager
 
 
 @pytest.fixture
 def token_processor_mock() -> MagicMock:
     mock = MagicMock(spec=TokenProcessor)
+    mock.hash_refresh_token.side_effect = TokenProcessor.hash_refresh_token
     mock.create_access_token.return_value = "test_access_token"
     mock.create_refresh_token.return_value = (
         "test_refresh_token",
@@ -34,8 +28,8 @@ def token_processor_mock() -> MagicMock:
 
 
 @pytest.fixture
-def refresh_token_repository_mock() -> AsyncMock:
-    return AsyncMock(spec=RefreshTokenRepository)
+def refresh_token_store_mock() -> AsyncMock:
+    return AsyncMock(spec=RefreshTokenStore)
 
 
 @pytest.fixture
@@ -43,11 +37,6 @@ def user_repository_mock() -> AsyncMock:
     return AsyncMock(spec=UserRepository)
 
 
-@pytest.fixture
-def transaction_manager_mock() -> AsyncMock:
-    return AsyncMock(spec=TransactionManager)
-
-
 @pytest.fixture
 def redis_client_mock() -> AsyncMock:
     redis_mock = AsyncMock(spec=Redis)
@@ -59,16 +48,14 @@ def redis_client_mock() -> AsyncMock:
 @pytest.fixture
 def token_service(
     token_processor_mock: MagicMock,
-    refresh_token_repository_mock: AsyncMock,
+    refresh_token_store_mock: AsyncMock,
     user_repository_mock: AsyncMock,
-    transaction_manager_mock: AsyncMock,
     redis_client_mock: AsyncMock,
 ) -> TokenService:
     return TokenService(
         token_processor=token_processor_mock,
-        refresh_token_repository=refresh_token_repository_mock,
+        refresh_token_store=refresh_token_store_mock,
         user_repository=user_repository_mock,
-        transaction_manager=transaction_manager_mock,
         redis_client=redis_client_mock,
     )
 
@@ -84,81 +71,52 @@ def mock_user(faker: Faker) -> User:
     )
 
 
-@pytest.fixture
-def refresh_token(mock_user: User) -> RefreshToken:
-    return RefreshToken(
-        id=uuid.uuid4(),
-        token="valid_refresh_token",
-        user_id=mock_user.id,
-        expires_at=datetime.now(UTC) + timedelta(days=1),
-        revoked=False,
-    )
-
-
-@pytest.fixture
-def expired_refresh_token(mock_user: User) -> RefreshToken:
-    return RefreshToken(
-        id=uuid.uuid4(),
-        token="expired_refresh_token",
-        user_id=mock_user.id,
-        expires_at=datetime.now(UTC) - timedelta(days=1),
-        revoked=False,
-    )
-
-
-@pytest.fixture
-def revoked_refresh_token(mock_user: User) -> RefreshToken:
-    return RefreshToken(
-        id=uuid.uuid4(),
-        token="revoked_refresh_token",
-        user_id=mock_user.id,
-        expires_at=datetime.now(UTC) + timedelta(days=1),
-        revoked=True,
-        revoked_at=datetime.now(UTC) - timedelta(hours=1),
-    )
-
-
 async def test_create_tokens(
     token_service: TokenService,
     mock_user: User,
     token_processor_mock: MagicMock,
-    refresh_token_repository_mock: AsyncMock,
-    transaction_manager_mock: AsyncMock,
+    refresh_token_store_mock: AsyncMock,
 ) -> None:
     access_token, refresh_token, expires_at = await token_service.create_tokens(
         mock_user
     )
 
-    refresh_token_repository_mock.revoke_all_for_user.assert_called_once_with(
-        mock_user.id
-    )
     token_processor_mock.create_access_token.assert_called_once_with(
         user_id=mock_user.id
     )
     token_processor_mock.create_refresh_token.assert_called_once()
-
-    assert refresh_token_repository_mock.create.call_count == 1
-    created_token = refresh_token_repository_mock.create.call_args[0][0]
-    assert isinstance(created_token, RefreshToken)
-    assert created_token.token == "test_refresh_token"
-    assert created_token.user_id == mock_user.id
-
-    transaction_manager_mock.commit.assert_called_once()
+    refresh_token_store_mock.create.assert_called_once_with(
+        mock_user.id,
+        TokenProcessor.hash_refresh_token("test_refresh_token"),
+        expires_at,
+        revoke_existing=True,
+    )
 
     assert access_token == "test_access_token"
     assert refresh_token == "test_refresh_token"
     assert expires_at > datetime.now(UTC)
 
 
+async def test_create_tokens_skip_revocation(
+    token_service: TokenService,
+    mock_user: User,
+    refresh_token_store_mock: AsyncMock,
+) -> None:
+    await token_service.create_tokens(mock_user, skip_revocation=True)
+
+    _, kwargs = refresh_token_store_mock.create.call_args
+    assert kwargs["revoke_existing"] is False
+
+
 async def test_revoke_refresh_token(
     token_service: TokenService,
-    refresh_token_repository_mock: AsyncMock,
-    transaction_manager_mock: AsyncMock,
+    refresh_token_store_mock: AsyncMock,
 ) -> None:
     await token_service.revoke_refresh_token("test_token")
 
-    refresh_token_repository_mock.revoke.assert_called_once_with("test_token")
-    transaction_manager_mock.commit.assert_called_once()
+    refresh_token_store_mock.revoke.assert_called_once_with(
+        TokenProcessor.hash_refresh_token("test_token")
+    )
 
 
 async def test_blacklist_access_token_valid(
@@ -232,107 +190,59 @@ async def test_is_access_token_blacklisted_false(
 
 async def test_rotate_refresh_token_success(
     token_service: TokenService,
-    refresh_token: RefreshToken,
     mock_user: User,
-    refresh_token_repository_mock: AsyncMock,
+    refresh_token_store_mock: AsyncMock,
     user_repository_mock: AsyncMock,
     token_processor_mock: MagicMock,
-    transaction_manager_mock: AsyncMock,
 ) -> None:
-    refresh_token_repository_mock.get_by_token.return_value = refresh_token
+    refresh_token_store_mock.rotate.return_value = mock_user.id
     user_repository_mock.get_by_id.return_value = mock_user
 
     (
         access_token,
         new_refresh_token,
         expires_at,
-    ) = await token_service.rotate_refresh_token(refresh_token.token)
+    ) = await token_service.rotate_refresh_token("valid_refresh_token")
 
-    refresh_token_repository_mock.get_by_token.assert_called_once_with(
-        refresh_token.token
+    refresh_token_store_mock.rotate.assert_called_once_with(
+        TokenProcessor.hash_refresh_token("valid_refresh_token"),
+        TokenProcessor.hash_refresh_token("test_refresh_token"),
+        expires_at,
     )
-    user_repository_mock.get_by_id.assert_called_once_with(refresh_token.user_id)
-    refresh_token_repository_mock.revoke.assert_called_once_with(refresh_token.token)
     token_processor_mock.create_access_token.assert_called_once_with(
         user_id=mock_user.id
     )
-    token_processor_mock.create_refresh_token.assert_called_once()
-
-    assert refresh_token_repository_mock.create.call_count == 1
-    created_token = refresh_token_repository_mock.create.call_args[0][0]
-    assert isinstance(created_token, RefreshToken)
-    assert created_token.token == "test_refresh_token"
-    assert created_token.user_id == mock_user.id
-
-    transaction_manager_mock.commit.assert_called_once()
 
     assert access_token == "test_access_token"
     assert new_refresh_token == "test_refresh_token"
     assert expires_at > datetime.now(UTC)
 
 
-async def test_rotate_refresh_token_not_found(
-    token_service: TokenService,
-    refresh_token_repository_mock: AsyncMock,
-) -> None:
-    refresh_token_repository_mock.get_by_token.return_value = None
-
-    with pytest.raises(InvalidTokenException):
-        await token_service.rotate_refresh_token("nonexistent_token")
-
-    refresh_token_repository_mock.get_by_token.assert_called_once_with(
-        "nonexistent_token"
-    )
-
-
-async def test_rotate_refresh_token_expired(
-    token_service: TokenService,
-    expired_refresh_token: RefreshToken,
-    refresh_token_repository_mock: AsyncMock,
-) -> None:
-    refresh_token_repository_mock.get_by_token.return_value = expired_refresh_token
-
-    with pytest.raises(TokenExpiredException):
-        await token_service.rotate_refresh_token(expired_refresh_token.token)
-
-    refresh_token_repository_mock.get_by_token.assert_called_once_with(
-        expired_refresh_token.token
-    )
-
-
 async def test_rotate_refresh_token_revoked(
     token_service: TokenService,
-    revoked_refresh_token: RefreshToken,
-    refresh_token_repository_mock: AsyncMock,
-    transaction_manager_mock: AsyncMock,
+    refresh_token_store_mock: AsyncMock,
+    token_processor_mock: MagicMock,
 ) -> None:
-    refresh_token_repository_mock.get_by_token.return_value = revoked_refresh_token
+    refresh_token_store_mock.rotate.side_effect = TokenRevokedException
 
     with pytest.raises(TokenRevokedException):
-        await token_service.rotate_refresh_token(revoked_refresh_token.token)
+        await token_service.rotate_refresh_token("revoked_refresh_token")
 
-    refresh_token_repository_mock.get_by_token.assert_called_once_with(
-        revoked_refresh_token.token
-    )
-    refresh_token_repository_mock.revoke_all_for_user.assert_called_once_with(
-        revoked_refresh_token.user_id
-    )
-    transaction_manager_mock.commit.assert_called_once()
+    token_processor_mock.create_access_token.assert_not_called()
 
 
 async def test_rotate_refresh_token_user_not_found(
     token_service: TokenService,
-    refresh_token: RefreshToken,
-    refresh_token_repository_mock: AsyncMock,
+    mock_user: User,
+    refresh_token_store_mock: AsyncMock,
     user_repository_mock: AsyncMock,
+    token_processor_mock: MagicMock,
 ) -> None:
-    refresh_token_repository_mock.get_by_token.return_value = refresh_token
+    refresh_token_store_mock.rotate.return_value = mock_user.id
     user_repository_mock.get_by_id.return_value = None
 
     with pytest.raises(UserNotFoundException):
-        await token_service.rotate_refresh_token(refresh_token.token)
+        await token_service.rotate_refresh_token("valid_refresh_token")
 
-    refresh_token_repository_mock.get_by_token.assert_called_once_with(
-        refresh_token.token
-    )
-    user_repository_mock.get_by_id.assert_called_once_with(refresh_token.user_id)
+    user_repository_mock.get_by_id.assert_called_once_with(mock_user.id)
+    token_processor_mock.create_access_token.assert_not_called()
@@ -43,6 +43,28 @@ async def test_rollback(
     session_mock.rollback.assert_called_once()
 
 
+async def test_release(
+    transaction_manager: TransactionManager,
+    session_mock: AsyncMock,
+) -> None:
+    session_mock.in_transaction.return_value = True
+
+    await transaction_manager.release()
+
+    session_mock.commit.assert_called_once()
+
+
+async def test_release_without_transaction(
+    transaction_manager: TransactionManager,
+    session_mock: AsyncMock,
+) -> None:
+    session_mock.in_transaction.return_value = False
+
+    await transaction_manager.release()
+
+    session_mock.commit.assert_not_called()
+
+
 async def test_refresh(
     transaction_manager: TransactionManager,
     session_mock: AsyncMock,